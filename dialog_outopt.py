@@ -2,10 +2,120 @@
 # Complete port of COutopt
 #
 
+import sys
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QGridLayout, QCheckBox, 
-    QDialogButtonBox, QGroupBox
+    QDialog, QVBoxLayout, QCheckBox, QDialogButtonBox, QGroupBox,
+    QListWidget, QListWidgetItem, QListView, QAbstractItemView, QFrame
 )
+from PySide6.QtCore import Qt, QSize
+
+# Default state of every output flag (all selected)
+DEFAULT_DATA = {
+    'oall': True, 'oshipd': True, 'ol': True, 'ob': True, 'olb': True,
+    'od': True, 'ot': True, 'obt': True, 'ocb': True,
+    'odispetc': True, 'odisp': True, 'ocdw': True, 'otdw': True,
+    'opdt': True, 'ospeed': True, 'orange': True, 'oerpm': True,
+    'oprpm': True, 'opoweretc': True, 'ospower': True,
+    'oipower': True, 'ope': True, 'ono': True, 'onh': True,
+    'oqpc': True, 'oscf': True, 'ont': True, 'omargin': True,
+    'omassetc': True, 'osmass': True, 'oomass': True, 'ommass': True,
+    'ofbd': True, 'oagm': True, 'oinput': True, 'ovyear': True,
+    'osdyear': True, 'ofcost': True, 'oirate': True,
+    'oreyear': True, 'ooutput': True, 'obcost': True, 'oacc': True,
+    'oafc': True, 'orfr': True
+}
+
+# (flag key, label) of the options in each group box, in display order
+SHIPD_OPTIONS = (
+    ('ol', "L"), ('ob', "B"), ('olb', "L/B"),
+    ('od', "D"), ('ot', "T"), ('obt', "B/T"),
+    ('ocb', "CB"),
+)
+DISPETC_OPTIONS = (
+    ('odisp', "Disp."), ('ocdw', "Cargo DW"), ('otdw', "Total DW"),
+    ('opdt', "PropDia/T"), ('ospeed', "Speed"), ('orange', "Range"),
+    ('oerpm', "Engine Rpm"), ('oprpm', "Prop. Rpm"),
+)
+POWERETC_OPTIONS = (
+    ('ospower', "Serv. power"), ('oipower', "Inst. power"), ('ope', "PE"), ('ono', "NO"),
+    ('onh', "NH"), ('oqpc', "QPC"), ('oscf', "SCF"), ('ont', "NT"),
+    ('omargin', "Margin"),
+)
+MASSETC_OPTIONS = (
+    ('osmass', "Steel mass"), ('oomass', "Outfit mass"), ('ommass', "Machy mass"),
+    ('ofbd', "Free board"), ('oagm', "Appr. GM"),
+)
+INPUT_OPTIONS = (
+    ('ovyear', "Voyages/year"), ('osdyear', "Seadays/year"), ('ofcost', "Fuel cost"),
+    ('oirate', "Int. rate"), ('oreyear', "Repay. years"),
+)
+OUTPUT_OPTIONS = (
+    ('obcost', "Build cost"), ('oacc', "Ann. cap. charges"),
+    ('oafc', "Annual fuel cost"), ('orfr', "Req. freight rate"),
+)
+
+# Output flags belonging to each group box
+SHIPD_KEYS = tuple(key for key, _ in SHIPD_OPTIONS)
+DISPETC_KEYS = tuple(key for key, _ in DISPETC_OPTIONS)
+POWERETC_KEYS = tuple(key for key, _ in POWERETC_OPTIONS)
+MASSETC_KEYS = tuple(key for key, _ in MASSETC_OPTIONS)
+INPUT_KEYS = tuple(key for key, _ in INPUT_OPTIONS)
+OUTPUT_KEYS = tuple(key for key, _ in OUTPUT_OPTIONS)
+
+# Options of the design report and of the economic report
+DESIGN_KEYS = SHIPD_KEYS + DISPETC_KEYS + POWERETC_KEYS + MASSETC_KEYS
+ECONOMIC_KEYS = INPUT_KEYS + OUTPUT_KEYS
+
+# Bit position of each output flag, in DEFAULT_DATA order. The dialog
+# keeps all flags in one int; OutoptFlags is only built at get_data.
+FLAG_BITS = {sys.intern(key): 1 << bit for bit, key in enumerate(DEFAULT_DATA)}
+
+def _mask_of(keys):
+    mask = 0
+    for key in keys:
+        mask |= FLAG_BITS[key]
+    return mask
+
+# Each group's own flag plus the flags of the options inside it
+SHIPD_MASK = _mask_of(('oshipd',) + SHIPD_KEYS)
+DISPETC_MASK = _mask_of(('odispetc',) + DISPETC_KEYS)
+POWERETC_MASK = _mask_of(('opoweretc',) + POWERETC_KEYS)
+MASSETC_MASK = _mask_of(('omassetc',) + MASSETC_KEYS)
+INPUT_MASK = _mask_of(('oinput',) + INPUT_KEYS)
+OUTPUT_MASK = _mask_of(('ooutput',) + OUTPUT_KEYS)
+DEFAULT_MASK = _mask_of(key for key, on in DEFAULT_DATA.items() if on)
+
+class OutoptFlags:
+    """
+    Slotted container for the output flags handed to the view, one bool
+    attribute per DEFAULT_DATA key (opt.ol rather than opt['ol']).
+    """
+    __slots__ = tuple(FLAG_BITS)
+
+    def __init__(self, mask=DEFAULT_MASK):
+        for key, bit in FLAG_BITS.items():
+            setattr(self, key, bool(mask & bit))
+
+    def to_mask(self):
+        mask = 0
+        for key, bit in FLAG_BITS.items():
+            if getattr(self, key):
+                mask |= bit
+        return mask
+
+    def as_dict(self):
+        return {key: getattr(self, key) for key in FLAG_BITS}
+
+def _set_checked(widget, checked):
+    """Only touch the widget when its state actually differs."""
+    if widget.isChecked() != checked:
+        widget.setChecked(checked)
+
+def _set_check_state(item, checked):
+    """Same as _set_checked, for a checkable QListWidgetItem."""
+    state = Qt.Checked if checked else Qt.Unchecked
+    if item.checkState() != state:
+        item.setCheckState(state)
 
 class OutoptDialog(QDialog):
     """
@@ -17,22 +127,10 @@ class OutoptDialog(QDialog):
         #
         self.setWindowTitle("Select Output")
         
-        # This dict holds the state of all checkboxes, replacing m_o... vars
+        # Bitmask (see FLAG_BITS) holding the state of all checkboxes,
+        # replacing m_o... vars
         #
-        self.data = {
-            'oall': True, 'oshipd': True, 'ol': True, 'ob': True, 'olb': True,
-            'od': True, 'ot': True, 'obt': True, 'ocb': True,
-            'odispetc': True, 'odisp': True, 'ocdw': True, 'otdw': True,
-            'opdt': True, 'ospeed': True, 'orange': True, 'oerpm': True,
-            'oprpm': True, 'opoweretc': True, 'ospower': True,
-            'oipower': True, 'ope': True, 'ono': True, 'onh': True,
-            'oqpc': True, 'oscf': True, 'ont': True, 'omargin': True,
-            'omassetc': True, 'osmass': True, 'oomass': True, 'ommass': True,
-            'ofbd': True, 'oagm': True, 'oinput': True, 'ovyear': True,
-            'osdyear': True, 'ofcost': True, 'oirate': True,
-            'oreyear': True, 'ooutput': True, 'obcost': True, 'oacc': True,
-            'oafc': True, 'orfr': True
-        }
+        self.mask = DEFAULT_MASK
         
         # --- Create UI Controls ---
         main_layout = QVBoxLayout()
@@ -41,126 +139,42 @@ class OutoptDialog(QDialog):
         self.check_all = QCheckBox("Select / De-select all")
         main_layout.addWidget(self.check_all)
         
-        self.checks = {}
+        # One checkable QListWidgetItem per option (no widget per option)
+        self.items = {}
 
         # Ship Dimensions Group
         #
-        shipd_group = QGroupBox("Ship &dimensions")
-        shipd_group.setCheckable(True)
-        shipd_layout = QGridLayout()
-        self.checks.update({
-            'ol': QCheckBox("L"), 'ob': QCheckBox("B"), 'olb': QCheckBox("L/B"),
-            'od': QCheckBox("D"), 'ot': QCheckBox("T"), 'obt': QCheckBox("B/T"),
-            'ocb': QCheckBox("CB")
-        })
-        shipd_layout.addWidget(self.checks['ol'], 0, 0) #
-        shipd_layout.addWidget(self.checks['ob'], 0, 1) #
-        shipd_layout.addWidget(self.checks['olb'], 0, 2) #
-        shipd_layout.addWidget(self.checks['od'], 1, 0) #
-        shipd_layout.addWidget(self.checks['ot'], 1, 1) #
-        shipd_layout.addWidget(self.checks['obt'], 1, 2) #
-        shipd_layout.addWidget(self.checks['ocb'], 2, 0) #
-        shipd_group.setLayout(shipd_layout)
+        shipd_group = self._make_option_group("Ship &dimensions", SHIPD_OPTIONS, 3)
         main_layout.addWidget(shipd_group)
         self.shipd_group = shipd_group
 
         # Displacement Group
         #
-        dispetc_group = QGroupBox("Di&splacement. etc")
-        dispetc_group.setCheckable(True)
-        dispetc_layout = QGridLayout()
-        self.checks.update({
-            'odisp': QCheckBox("Disp."), 'ocdw': QCheckBox("Cargo DW"),
-            'otdw': QCheckBox("Total DW"), 'opdt': QCheckBox("PropDia/T"),
-            'ospeed': QCheckBox("Speed"), 'orange': QCheckBox("Range"),
-            'oerpm': QCheckBox("Engine Rpm"), 'oprpm': QCheckBox("Prop. Rpm")
-        })
-        dispetc_layout.addWidget(self.checks['odisp'], 0, 0) #
-        dispetc_layout.addWidget(self.checks['ocdw'], 0, 1) #
-        dispetc_layout.addWidget(self.checks['otdw'], 0, 2) #
-        dispetc_layout.addWidget(self.checks['opdt'], 1, 0) #
-        dispetc_layout.addWidget(self.checks['ospeed'], 1, 1) #
-        dispetc_layout.addWidget(self.checks['orange'], 1, 2) #
-        dispetc_layout.addWidget(self.checks['oerpm'], 2, 0) #
-        dispetc_layout.addWidget(self.checks['oprpm'], 2, 1) #
-        dispetc_group.setLayout(dispetc_layout)
+        dispetc_group = self._make_option_group("Di&splacement. etc", DISPETC_OPTIONS, 3)
         main_layout.addWidget(dispetc_group)
         self.dispetc_group = dispetc_group
 
         # Power Group
         #
-        poweretc_group = QGroupBox("&Power etc")
-        poweretc_group.setCheckable(True)
-        poweretc_layout = QGridLayout()
-        self.checks.update({
-            'ospower': QCheckBox("Serv. power"), 'oipower': QCheckBox("Inst. power"),
-            'ope': QCheckBox("PE"), 'ono': QCheckBox("NO"),
-            'onh': QCheckBox("NH"), 'oqpc': QCheckBox("QPC"),
-            'oscf': QCheckBox("SCF"), 'ont': QCheckBox("NT"), 'omargin': QCheckBox("Margin")
-        })
-        poweretc_layout.addWidget(self.checks['ospower'], 0, 0) #
-        poweretc_layout.addWidget(self.checks['oipower'], 0, 1) #
-        poweretc_layout.addWidget(self.checks['ope'], 0, 2) #
-        poweretc_layout.addWidget(self.checks['ono'], 0, 3) #
-        poweretc_layout.addWidget(self.checks['onh'], 1, 0) #
-        poweretc_layout.addWidget(self.checks['oqpc'], 1, 1) #
-        poweretc_layout.addWidget(self.checks['oscf'], 1, 2) #
-        poweretc_layout.addWidget(self.checks['ont'], 1, 3) #
-        poweretc_layout.addWidget(self.checks['omargin'], 2, 0) #
-        poweretc_group.setLayout(poweretc_layout)
+        poweretc_group = self._make_option_group("&Power etc", POWERETC_OPTIONS, 4)
         main_layout.addWidget(poweretc_group)
         self.poweretc_group = poweretc_group
 
         # Mass Group
         #
-        massetc_group = QGroupBox("&Mass etc")
-        massetc_group.setCheckable(True)
-        massetc_layout = QGridLayout()
-        self.checks.update({
-            'osmass': QCheckBox("Steel mass"), 'oomass': QCheckBox("Outfit mass"),
-            'ommass': QCheckBox("Machy mass"), 'ofbd': QCheckBox("Free board"), 'oagm': QCheckBox("Appr. GM")
-        })
-        massetc_layout.addWidget(self.checks['osmass'], 0, 0) #
-        massetc_layout.addWidget(self.checks['oomass'], 0, 1) #
-        massetc_layout.addWidget(self.checks['ommass'], 0, 2) #
-        massetc_layout.addWidget(self.checks['ofbd'], 1, 0) #
-        massetc_layout.addWidget(self.checks['oagm'], 1, 1) #
-        massetc_group.setLayout(massetc_layout)
+        massetc_group = self._make_option_group("&Mass etc", MASSETC_OPTIONS, 3)
         main_layout.addWidget(massetc_group)
         self.massetc_group = massetc_group
 
         # Economic Input Group
         #
-        einput_group = QGroupBox("&Input for economic analysis")
-        einput_group.setCheckable(True)
-        einput_layout = QGridLayout()
-        self.checks.update({
-            'ovyear': QCheckBox("Voyages/year"), 'osdyear': QCheckBox("Seadays/year"),
-            'ofcost': QCheckBox("Fuel cost"), 'oirate': QCheckBox("Int. rate"), 'oreyear': QCheckBox("Repay. years")
-        })
-        einput_layout.addWidget(self.checks['ovyear'], 0, 0) #
-        einput_layout.addWidget(self.checks['osdyear'], 0, 1) #
-        einput_layout.addWidget(self.checks['ofcost'], 0, 2) #
-        einput_layout.addWidget(self.checks['oirate'], 1, 0) #
-        einput_layout.addWidget(self.checks['oreyear'], 1, 1) #
-        einput_group.setLayout(einput_layout)
+        einput_group = self._make_option_group("&Input for economic analysis", INPUT_OPTIONS, 3)
         main_layout.addWidget(einput_group)
         self.einput_group = einput_group
         
         # Economic Output Group
         #
-        eoutput_group = QGroupBox("&Output from economic analysis")
-        eoutput_group.setCheckable(True)
-        eoutput_layout = QGridLayout()
-        self.checks.update({
-            'obcost': QCheckBox("Build cost"), 'oacc': QCheckBox("Ann. cap. charges"),
-            'oafc': QCheckBox("Annual fuel cost"), 'orfr': QCheckBox("Req. freight rate")
-        })
-        eoutput_layout.addWidget(self.checks['obcost'], 0, 0) #
-        eoutput_layout.addWidget(self.checks['oacc'], 0, 1) #
-        eoutput_layout.addWidget(self.checks['oafc'], 1, 0) #
-        eoutput_layout.addWidget(self.checks['orfr'], 1, 1) #
-        eoutput_group.setLayout(eoutput_layout)
+        eoutput_group = self._make_option_group("&Output from economic analysis", OUTPUT_OPTIONS, 2)
         main_layout.addWidget(eoutput_group)
         self.eoutput_group = eoutput_group
         
@@ -172,6 +186,26 @@ class OutoptDialog(QDialog):
         
         self.setLayout(main_layout)
         
+        # Widgets whose toggled signal drives a handler below
+        self._toggles = (self.check_all, shipd_group, dispetc_group,
+                         poweretc_group, massetc_group, einput_group,
+                         eoutput_group)
+        self._updating = False
+
+        # (bit, widget) for the select-all box and the group boxes, and
+        # (bit, item) for the options inside the groups
+        self._flag_widgets = (
+            (FLAG_BITS['oall'], self.check_all),
+            (FLAG_BITS['oshipd'], shipd_group),
+            (FLAG_BITS['odispetc'], dispetc_group),
+            (FLAG_BITS['opoweretc'], poweretc_group),
+            (FLAG_BITS['omassetc'], massetc_group),
+            (FLAG_BITS['oinput'], einput_group),
+            (FLAG_BITS['ooutput'], eoutput_group),
+        )
+        self._flag_items = tuple((FLAG_BITS[key], item)
+                                 for key, item in self.items.items())
+
         # --- Connect signals ---
         #
         self.check_all.toggled.connect(self.on_check_all)
@@ -185,64 +219,115 @@ class OutoptDialog(QDialog):
 
         self.update_ui_from_data() # Set initial state
 
+    def _make_option_group(self, title, options, columns):
+        """
+        Builds a checkable QGroupBox holding a wrapping QListWidget with
+        one checkable item per (key, label) in options, laid out in
+        the given number of columns.
+        """
+        group = QGroupBox(title)
+        group.setCheckable(True)
+
+        option_list = QListWidget()
+        option_list.setFlow(QListView.LeftToRight)
+        option_list.setWrapping(True)
+        option_list.setResizeMode(QListView.Adjust)
+        option_list.setUniformItemSizes(True)
+        option_list.setSelectionMode(QAbstractItemView.NoSelection)
+        option_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        option_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        option_list.setFrameShape(QFrame.NoFrame)
+        option_list.viewport().setAutoFillBackground(False)
+
+        for key, label in options:
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, key)
+            item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+            item.setCheckState(Qt.Checked)
+            option_list.addItem(item)
+            self.items[key] = item
+
+        # Fixed grid cells so the items wrap into the same rows/columns
+        # the old checkbox grid used
+        cell_width = max(option_list.sizeHintForColumn(0), 1) + 16
+        cell_height = max(option_list.sizeHintForRow(0), 1) + 4
+        rows = -(-len(options) // columns)
+        option_list.setGridSize(QSize(cell_width, cell_height))
+        option_list.setMinimumWidth(cell_width * columns + 4)
+        option_list.setFixedHeight(cell_height * rows + 4)
+
+        group_layout = QVBoxLayout()
+        group_layout.addWidget(option_list)
+        group.setLayout(group_layout)
+        return group
+
     def update_data_from_ui(self):
-        """Pulls state from UI checkboxes into self.data dict"""
-        self.data['oall'] = self.check_all.isChecked()
-        self.data['oshipd'] = self.shipd_group.isChecked()
-        self.data['odispetc'] = self.dispetc_group.isChecked()
-        self.data['opoweretc'] = self.poweretc_group.isChecked()
-        self.data['omassetc'] = self.massetc_group.isChecked()
-        self.data['oinput'] = self.einput_group.isChecked()
-        self.data['ooutput'] = self.eoutput_group.isChecked()
-        for key, checkbox in self.checks.items():
-            self.data[key] = checkbox.isChecked()
+        """Pulls state from UI checkboxes into self.mask"""
+        mask = 0
+        for bit, widget in self._flag_widgets:
+            if widget.isChecked():
+                mask |= bit
+        for bit, item in self._flag_items:
+            if item.checkState() == Qt.Checked:
+                mask |= bit
+        self.mask = mask
             
     def update_ui_from_data(self):
-        """Pushes state from self.data dict to UI checkboxes"""
-        # Block signals to prevent loops
-        self.check_all.blockSignals(True)
-        self.shipd_group.blockSignals(True)
-        self.dispetc_group.blockSignals(True)
-        self.poweretc_group.blockSignals(True)
-        self.massetc_group.blockSignals(True)
-        self.einput_group.blockSignals(True)
-        self.eoutput_group.blockSignals(True)
-
-        self.check_all.setChecked(self.data['oall'])
-        self.shipd_group.setChecked(self.data['oshipd'])
-        self.dispetc_group.setChecked(self.data['odispetc'])
-        self.poweretc_group.setChecked(self.data['opoweretc'])
-        self.massetc_group.setChecked(self.data['omassetc'])
-        self.einput_group.setChecked(self.data['oinput'])
-        self.eoutput_group.setChecked(self.data['ooutput'])
-        for key, checkbox in self.checks.items():
-            checkbox.setChecked(self.data[key])
-            
-        # Unblock signals
-        self.check_all.blockSignals(False)
-        self.shipd_group.blockSignals(False)
-        self.dispetc_group.blockSignals(False)
-        self.poweretc_group.blockSignals(False)
-        self.massetc_group.blockSignals(False)
-        self.einput_group.blockSignals(False)
-        self.eoutput_group.blockSignals(False)
+        """Pushes state from self.mask to UI checkboxes"""
+        # Block signals to prevent loops; _updating also stops any handler
+        # that still fires from re-entering while we push state out.
+        self._updating = True
+        for toggle in self._toggles:
+            toggle.blockSignals(True)
+        try:
+            mask = self.mask
+            for bit, widget in self._flag_widgets:
+                _set_checked(widget, bool(mask & bit))
+            for bit, item in self._flag_items:
+                _set_check_state(item, bool(mask & bit))
+        finally:
+            # Unblock signals
+            for toggle in self._toggles:
+                toggle.blockSignals(False)
+            self._updating = False
             
     def on_accept(self):
         self.update_data_from_ui()
         self.accept()
         
     def get_data(self):
-        return self.data
+        """Returns the flags as a fresh OutoptFlags."""
+        return OutoptFlags(self.mask)
         
-    def set_data(self, data):
-        self.data.update(data)
+    def set_data(self, flags):
+        """
+        Loads the view's flags into the checkboxes: an OutoptFlags, or a
+        {key: bool} mapping as the legacy ship_des_view_widget still keeps.
+        """
+        if isinstance(flags, OutoptFlags):
+            mask = flags.to_mask()
+        else:
+            mask = self.mask
+            for key, value in flags.items():
+                bit = FLAG_BITS.get(key)
+                if bit is None:
+                    continue
+                mask = (mask | bit) if value else (mask & ~bit)
+        self.mask = mask
         self.update_ui_from_data()
 
+    def _set_group(self, group_mask, k):
+        """Sets or clears every bit in group_mask."""
+        self.mask = (self.mask | group_mask) if k else (self.mask & ~group_mask)
+
     # --- Ported Logic from Outopt.cpp ---
     
     def on_check_all(self, checked):
         #
-        self.data['oall'] = checked
+        if self._updating:
+            return
+        # Apply every group to the mask first, then refresh the UI once
+        self._set_group(FLAG_BITS['oall'], checked)
         self.set_shipd(checked)
         self.set_dispetc(checked)
         self.set_poweretc(checked)
@@ -253,69 +338,66 @@ class OutoptDialog(QDialog):
 
     def on_check_shipdim(self, checked):
         #
+        if self._updating:
+            return
         self.set_shipd(checked)
         self.update_ui_from_data()
         
     def on_check_dispetc(self, checked):
         #
+        if self._updating:
+            return
         self.set_dispetc(checked)
         self.update_ui_from_data()
         
     def on_check_poweretc(self, checked):
         #
+        if self._updating:
+            return
         self.set_poweretc(checked)
         self.update_ui_from_data()
         
     def on_check_massetc(self, checked):
         #
+        if self._updating:
+            return
         self.set_massetc(checked)
         self.update_ui_from_data()
         
     def on_check_einput(self, checked):
         #
+        if self._updating:
+            return
         self.set_input(checked)
         self.update_ui_from_data()
         
     def on_check_eoutput(self, checked):
         #
+        if self._updating:
+            return
         self.set_output(checked)
         self.update_ui_from_data()
 
     def set_shipd(self, k):
         #
-        self.data['oshipd'] = k
-        self.data['ol'] = k; self.data['ob'] = k; self.data['olb'] = k
-        self.data['od'] = k; self.data['ot'] = k; self.data['obt'] = k
-        self.data['ocb'] = k
+        self._set_group(SHIPD_MASK, k)
         
     def set_dispetc(self, k):
         #
-        self.data['odispetc'] = k
-        self.data['odisp'] = k; self.data['ocdw'] = k; self.data['otdw'] = k
-        self.data['opdt'] = k; self.data['ospeed'] = k; self.data['orange'] = k
-        self.data['oerpm'] = k; self.data['oprpm'] = k
+        self._set_group(DISPETC_MASK, k)
         
     def set_poweretc(self, k):
         #
-        self.data['opoweretc'] = k
-        self.data['ospower'] = k; self.data['oipower'] = k; self.data['ope'] = k
-        self.data['ono'] = k; self.data['onh'] = k; self.data['oqpc'] = k
-        self.data['oscf'] = k; self.data['ont'] = k; self.data['omargin'] = k
+        self._set_group(POWERETC_MASK, k)
         
     def set_massetc(self, k):
         #
-        self.data['omassetc'] = k
-        self.data['osmass'] = k; self.data['oomass'] = k; self.data['ommass'] = k
-        self.data['ofbd'] = k; self.data['oagm'] = k
+        self._set_group(MASSETC_MASK, k)
         
     def set_input(self, k):
         #
-        self.data['oinput'] = k
-        self.data['ovyear'] = k; self.data['osdyear'] = k; self.data['ofcost'] = k
-        self.data['oirate'] = k; self.data['oreyear'] = k
+        self._set_group(INPUT_MASK, k)
         
     def set_output(self, k):
         #
-        self.data['ooutput'] = k
-        self.data['obcost'] = k; self.data['oacc'] = k; self.data['oafc'] = k
-        self.data['orfr'] = k
\ No newline at end of file
+        self._set_group(OUTPUT_MASK, k)
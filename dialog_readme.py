@@ -4,6 +4,15 @@
 
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QDialogButtonBox
 
+# Text of CReadme::AddReadmeText
+_README_TEXT = (
+    " To run ShipDes, you can also use:\n"
+    " Tab key, Space bar, Arrow keys, Alt+C etc.\n"
+    " \n"
+    " Please report any bug information to\n"
+    "     Prof. AF Molland or Dr. M Tan. or M. MacCormac\n"
+)
+
 class ReadmeDialog(QDialog):
     """
     Replaces the CReadme dialog.
@@ -30,19 +39,21 @@ class ReadmeDialog(QDialog):
         
         self.setLayout(layout)
         
-        #
-        # Call the function to populate the text
-        self._add_readme_text()
+        # Text is filled in on first show (see showEvent)
+        self._populated = False
+
+    def showEvent(self, event):
+        """
+        Populates the readme text the first time the dialog is shown.
+        """
+        if not self._populated:
+            self._add_readme_text()
+            self._populated = True
+        super().showEvent(event)
 
     def _add_readme_text(self):
         """
         Port of CReadme::AddReadmeText
         """
-        readme_text = " To run ShipDes, you can also use:\r\n"
-        readme_text += " Tab key, Space bar, Arrow keys,"
-        readme_text += " Alt+C etc.\r\n"
-        readme_text += " \r\n Please report any bug information to"
-        readme_text += " \r\n     Prof. AF Molland or Dr. M Tan. or M. MacCormac\r\n"
-        
         #
-        self.text_readme.setText(readme_text)
\ No newline at end of file
+        self.text_readme.setPlainText(_README_TEXT)
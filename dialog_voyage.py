@@ -2,58 +2,62 @@
 # Voyage Configuration Dialog
 # Allows user to configure voyage mode, routes, speed profiles, and port operations
 
+from collections import namedtuple
+
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QRadioButton,
-    QComboBox, QLineEdit, QLabel, QPushButton, QGridLayout, QFormLayout
+    QComboBox, QDoubleSpinBox, QLabel, QPushButton, QGridLayout, QFormLayout
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
+
 
+# One pre-defined route; distances in nm
+Route = namedtuple('Route', (
+    'port_approach', 'canal', 'open_ocean', 'total',
+    'default_port_days_origin', 'default_port_days_dest',
+))
 
 # Route database with pre-defined routes
 ROUTE_DATABASE = {
-    "Southampton → Singapore (Suez)": {
-        "port_approach": 100,  # nm (50 each end)
-        "canal": 120,  # nm (Suez Canal)
-        "open_ocean": 7780,  # nm
-        "total": 8000,  # nm
-        "default_port_days_origin": 2,
-        "default_port_days_dest": 2
-    },
-    "Rotterdam → Shanghai (Suez)": {
-        "port_approach": 100,  # nm
-        "canal": 120,  # nm (Suez Canal)
-        "open_ocean": 9780,  # nm
-        "total": 10000,  # nm
-        "default_port_days_origin": 2,
-        "default_port_days_dest": 2
-    },
-    "New York → Los Angeles (Panama)": {
-        "port_approach": 100,  # nm
-        "canal": 50,  # nm (Panama Canal)
-        "open_ocean": 4850,  # nm
-        "total": 5000,  # nm
-        "default_port_days_origin": 2,
-        "default_port_days_dest": 2
-    },
-    "Houston → Rotterdam (Atlantic)": {
-        "port_approach": 100,  # nm
-        "canal": 0,  # nm (no canal)
-        "open_ocean": 4700,  # nm
-        "total": 4800,  # nm
-        "default_port_days_origin": 2,
-        "default_port_days_dest": 2
-    },
-    "Custom": {
-        "port_approach": 100,  # nm (default)
-        "canal": 0,  # nm (default)
-        "open_ocean": 8000,  # nm (default)
-        "total": 8100,  # nm (calculated)
-        "default_port_days_origin": 2,
-        "default_port_days_dest": 2
-    }
+    # port_approach is 50 nm each end; canal is the Suez Canal
+    "Southampton → Singapore (Suez)": Route(100, 120, 7780, 8000, 2, 2),
+    "Rotterdam → Shanghai (Suez)": Route(100, 120, 9780, 10000, 2, 2),
+    # Panama Canal
+    "New York → Los Angeles (Panama)": Route(100, 50, 4850, 5000, 2, 2),
+    # No canal
+    "Houston → Rotterdam (Atlantic)": Route(100, 0, 4700, 4800, 2, 2),
+    # Defaults for the Custom fields; total is calculated
+    "Custom": Route(100, 0, 8000, 8100, 2, 2),
+}
+
+# Route names in combo box order, and each name's combo index
+ROUTE_NAMES = tuple(ROUTE_DATABASE)
+ROUTE_INDEX = {name: i for i, name in enumerate(ROUTE_NAMES)}
+
+# (port approach, canal, open ocean) distances per route, in nm.
+# None for Custom, whose distances come from the edit fields.
+_ROUTE_DISTANCES = {
+    name: None if name == "Custom" else
+          (route.port_approach, route.canal, route.open_ocean)
+    for name, route in ROUTE_DATABASE.items()
 }
 
 
+def _make_spin(minimum, maximum, decimals, suffix):
+    """Numeric input used for every Port to Port field"""
+    spin = QDoubleSpinBox()
+    spin.setRange(minimum, maximum)
+    spin.setDecimals(decimals)
+    spin.setSuffix(suffix)
+    return spin
+
+
+def _set_label(label, text):
+    """Only touch the label when its text actually changes"""
+    if label.text() != text:
+        label.setText(text)
+
+
 class VoyageDialog(QDialog):
     """
     Dialog for configuring voyage parameters.
@@ -79,6 +83,16 @@ class VoyageDialog(QDialog):
             'custom_ocean': 8000.0,
         }
         
+        # Inputs of the last successful _update_calculations
+        self._last_inputs = None
+        # Cruise speed / sea days read from the parent (see showEvent)
+        self.invalidate_parent_cache()
+        
+        # Distances of the selected route (see _on_route_changed)
+        self._current_route_dist = None
+        # (is_port_to_port, is_custom) last applied by _update_ui_state
+        self._ui_state = (None, None)
+        
         self._create_ui()
         self._connect_signals()
         self._update_ui_state()
@@ -102,13 +116,49 @@ class VoyageDialog(QDialog):
         
         # Port to Port configuration group
         self.port_to_port_group = QGroupBox("Port to Port Configuration")
-        ptp_layout = QVBoxLayout()
+        # Everything inside is built on first switch to Port to Port mode
+        # (see _build_ptp_widgets)
+        self.port_to_port_group.setLayout(QVBoxLayout())
+        main_layout.addWidget(self.port_to_port_group)
+        self._ptp_built = False
+        
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        
+        self.btn_ok = QPushButton("OK")
+        self.btn_cancel = QPushButton("Cancel")
+        
+        button_layout.addWidget(self.btn_ok)
+        button_layout.addWidget(self.btn_cancel)
+        main_layout.addLayout(button_layout)
+        
+    def _connect_signals(self):
+        """Connect UI signals to handlers"""
+        # The radios are exclusive, so one of them toggling covers both
+        self.radio_port_to_port.toggled.connect(self._update_ui_state)
+        
+        # Calculation trigger for the Port to Port fields. Typing restarts a
+        # short single-shot timer so the calculation runs once the user
+        # pauses, not per key.
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(250)  # ms
+        self._recalc_timer.timeout.connect(self._update_calculations)
+        
+        # Buttons
+        self.btn_ok.clicked.connect(self.accept)
+        self.btn_cancel.clicked.connect(self.reject)
+        
+    def _build_ptp_widgets(self):
+        """Build the Port to Port subtree and fill it from self.data"""
+        ptp_layout = self.port_to_port_group.layout()
         
         # Route selection
         route_layout = QHBoxLayout()
         route_layout.addWidget(QLabel("Select Route:"))
         self.combo_route = QComboBox()
-        self.combo_route.addItems(list(ROUTE_DATABASE.keys()))
+        self.combo_route.addItems(ROUTE_NAMES)
         route_layout.addWidget(self.combo_route)
         route_layout.addStretch()
         ptp_layout.addLayout(route_layout)
@@ -117,16 +167,16 @@ class VoyageDialog(QDialog):
         self.custom_group = QGroupBox("Custom Route Distances")
         custom_layout = QGridLayout()
         
-        custom_layout.addWidget(QLabel("Port Approach/Departure (nm):"), 0, 0)
-        self.edit_custom_port = QLineEdit()
+        custom_layout.addWidget(QLabel("Port Approach/Departure:"), 0, 0)
+        self.edit_custom_port = _make_spin(0.0, 1e6, 1, " nm")
         custom_layout.addWidget(self.edit_custom_port, 0, 1)
         
-        custom_layout.addWidget(QLabel("Canal Transit (nm):"), 1, 0)
-        self.edit_custom_canal = QLineEdit()
+        custom_layout.addWidget(QLabel("Canal Transit:"), 1, 0)
+        self.edit_custom_canal = _make_spin(0.0, 1e6, 1, " nm")
         custom_layout.addWidget(self.edit_custom_canal, 1, 1)
         
-        custom_layout.addWidget(QLabel("Open Ocean (nm):"), 2, 0)
-        self.edit_custom_ocean = QLineEdit()
+        custom_layout.addWidget(QLabel("Open Ocean:"), 2, 0)
+        self.edit_custom_ocean = _make_spin(0.0, 1e6, 1, " nm")
         custom_layout.addWidget(self.edit_custom_ocean, 2, 1)
         
         self.custom_group.setLayout(custom_layout)
@@ -137,19 +187,16 @@ class VoyageDialog(QDialog):
         speed_layout = QGridLayout()
         
         speed_layout.addWidget(QLabel("Open Ocean:"), 0, 0)
-        self.edit_speed_ocean = QLineEdit()
+        self.edit_speed_ocean = _make_spin(0.0, 100.0, 3, " %")
         speed_layout.addWidget(self.edit_speed_ocean, 0, 1)
-        speed_layout.addWidget(QLabel("%"), 0, 2)
         
         speed_layout.addWidget(QLabel("Canal Transit:"), 1, 0)
-        self.edit_speed_canal = QLineEdit()
+        self.edit_speed_canal = _make_spin(0.0, 100.0, 3, " %")
         speed_layout.addWidget(self.edit_speed_canal, 1, 1)
-        speed_layout.addWidget(QLabel("%"), 1, 2)
         
         speed_layout.addWidget(QLabel("Port Approach/Departure:"), 2, 0)
-        self.edit_speed_port = QLineEdit()
+        self.edit_speed_port = _make_spin(0.0, 100.0, 3, " %")
         speed_layout.addWidget(self.edit_speed_port, 2, 1)
-        speed_layout.addWidget(QLabel("%"), 2, 2)
         
         speed_group.setLayout(speed_layout)
         ptp_layout.addWidget(speed_group)
@@ -159,11 +206,11 @@ class VoyageDialog(QDialog):
         port_layout = QGridLayout()
         
         port_layout.addWidget(QLabel("Days at Origin Port (loading):"), 0, 0)
-        self.edit_port_days_origin = QLineEdit()
+        self.edit_port_days_origin = _make_spin(0.0, 365.0, 2, " days")
         port_layout.addWidget(self.edit_port_days_origin, 0, 1)
         
         port_layout.addWidget(QLabel("Days at Destination Port (unloading):"), 1, 0)
-        self.edit_port_days_dest = QLineEdit()
+        self.edit_port_days_dest = _make_spin(0.0, 365.0, 2, " days")
         port_layout.addWidget(self.edit_port_days_dest, 1, 1)
         
         port_group.setLayout(port_layout)
@@ -185,69 +232,118 @@ class VoyageDialog(QDialog):
         calc_group.setLayout(calc_layout)
         ptp_layout.addWidget(calc_group)
         
-        self.port_to_port_group.setLayout(ptp_layout)
-        main_layout.addWidget(self.port_to_port_group)
-        
-        # Buttons
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        
-        self.btn_ok = QPushButton("OK")
-        self.btn_cancel = QPushButton("Cancel")
-        
-        button_layout.addWidget(self.btn_ok)
-        button_layout.addWidget(self.btn_cancel)
-        main_layout.addLayout(button_layout)
+        self._numeric_edits = (
+            self.edit_custom_port, self.edit_custom_canal, self.edit_custom_ocean,
+            self.edit_speed_ocean, self.edit_speed_canal, self.edit_speed_port,
+            self.edit_port_days_origin, self.edit_port_days_dest,
+        )
         
-    def _connect_signals(self):
-        """Connect UI signals to handlers"""
-        self.radio_annual.toggled.connect(self._update_ui_state)
-        self.radio_port_to_port.toggled.connect(self._update_ui_state)
+        # Connect the new inputs
         self.combo_route.currentIndexChanged.connect(self._on_route_changed)
-        
-        # Connect calculation triggers
-        self.edit_speed_ocean.textChanged.connect(self._update_calculations)
-        self.edit_speed_canal.textChanged.connect(self._update_calculations)
-        self.edit_speed_port.textChanged.connect(self._update_calculations)
-        self.edit_port_days_origin.textChanged.connect(self._update_calculations)
-        self.edit_port_days_dest.textChanged.connect(self._update_calculations)
-        self.edit_custom_port.textChanged.connect(self._update_calculations)
-        self.edit_custom_canal.textChanged.connect(self._update_calculations)
-        self.edit_custom_ocean.textChanged.connect(self._update_calculations)
-        
-        # Buttons
-        self.btn_ok.clicked.connect(self.accept)
-        self.btn_cancel.clicked.connect(self.reject)
+        self.edit_speed_ocean.valueChanged.connect(self._schedule_recalc)
+        self.edit_speed_canal.valueChanged.connect(self._schedule_recalc)
+        self.edit_speed_port.valueChanged.connect(self._schedule_recalc)
+        self.edit_port_days_origin.valueChanged.connect(self._schedule_recalc)
+        self.edit_port_days_dest.valueChanged.connect(self._schedule_recalc)
+        self.edit_custom_port.valueChanged.connect(self._schedule_recalc)
+        self.edit_custom_canal.valueChanged.connect(self._schedule_recalc)
+        self.edit_custom_ocean.valueChanged.connect(self._schedule_recalc)
+        
+        self._ptp_built = True
+        self._populate_ptp()
+        
+    def _populate_ptp(self):
+        """Push self.data into the Port to Port fields"""
+        data = self.data
+        
+        # Block the inputs' signals while populating so each setter does
+        # not trigger its own recalculation
+        blocked = (self.combo_route,) + self._numeric_edits
+        for widget in blocked:
+            widget.blockSignals(True)
+        try:
+            # Set route
+            route_name = data['selected_route']
+            index = ROUTE_INDEX.get(route_name, -1)
+            if index >= 0:
+                self.combo_route.setCurrentIndex(index)
+        
+            # Set speed profiles
+            self.edit_speed_ocean.setValue(data['speed_profile_ocean'])
+            self.edit_speed_canal.setValue(data['speed_profile_canal'])
+            self.edit_speed_port.setValue(data['speed_profile_port'])
+        
+            # Set port days
+            self.edit_port_days_origin.setValue(data['port_days_origin'])
+            self.edit_port_days_dest.setValue(data['port_days_dest'])
+        
+            # Set custom route distances
+            self.edit_custom_port.setValue(data['custom_port_approach'])
+            self.edit_custom_canal.setValue(data['custom_canal'])
+            self.edit_custom_ocean.setValue(data['custom_ocean'])
+        finally:
+            for widget in blocked:
+                widget.blockSignals(False)
+        
+        # _on_route_changed did not run, so pick up the route here
+        self._current_route_dist = _ROUTE_DISTANCES.get(self.combo_route.currentText())
+        
+    def invalidate_parent_cache(self):
+        """Re-read the parent's cruise speed and sea days"""
+        parent = self.parent()
+        self._cruise_speed = getattr(parent, 'm_Speed', 15.0)
+        self._sea_days = getattr(parent, 'm_Seadays', 340.0)
+        
+    def showEvent(self, event):
+        """Pick up the parent's current values each time the dialog opens"""
+        self.invalidate_parent_cache()
+        super().showEvent(event)
+        self._update_calculations()
+        
+    def _schedule_recalc(self, _value=None):
+        """(Re)start the debounce timer for _update_calculations"""
+        self._recalc_timer.start()
         
     def _update_ui_state(self):
         """Update UI based on selected mode"""
         is_port_to_port = self.radio_port_to_port.isChecked()
-        self.port_to_port_group.setEnabled(is_port_to_port)
-        
-        # Update custom route visibility
-        is_custom = self.combo_route.currentText() == "Custom"
-        self.custom_group.setVisible(is_custom and is_port_to_port)
+        if is_port_to_port and not self._ptp_built:
+            self._build_ptp_widgets()
+        is_custom = self._ptp_built and self.combo_route.currentText() == "Custom"
+        
+        # Only touch enabled/visible state (each a relayout) when the
+        # mode or custom-ness actually changed
+        state = (is_port_to_port, is_custom)
+        if state != self._ui_state:
+            self._ui_state = state
+            self.port_to_port_group.setEnabled(is_port_to_port)
+            
+            # Update custom route visibility
+            if self._ptp_built:
+                self.custom_group.setVisible(is_custom and is_port_to_port)
         
-        # Update calculations if in port to port mode
+        # Update calculations if in port to port mode (a no-op when its
+        # inputs are unchanged)
         if is_port_to_port:
             self._update_calculations()
             
     def _on_route_changed(self):
         """Handle route selection change"""
         route_name = self.combo_route.currentText()
+        self._current_route_dist = _ROUTE_DISTANCES.get(route_name)
         
         if route_name in ROUTE_DATABASE:
             route = ROUTE_DATABASE[route_name]
             
             # Update port days with defaults
-            self.edit_port_days_origin.setText(str(route['default_port_days_origin']))
-            self.edit_port_days_dest.setText(str(route['default_port_days_dest']))
+            self.edit_port_days_origin.setValue(route.default_port_days_origin)
+            self.edit_port_days_dest.setValue(route.default_port_days_dest)
             
             # If custom route, update custom fields
             if route_name == "Custom":
-                self.edit_custom_port.setText(str(route['port_approach']))
-                self.edit_custom_canal.setText(str(route['canal']))
-                self.edit_custom_ocean.setText(str(route['open_ocean']))
+                self.edit_custom_port.setValue(route.port_approach)
+                self.edit_custom_canal.setValue(route.canal)
+                self.edit_custom_ocean.setValue(route.open_ocean)
         
         self._update_ui_state()
         
@@ -255,118 +351,121 @@ class VoyageDialog(QDialog):
         """Update calculated voyage time and annual voyages"""
         if not self.radio_port_to_port.isChecked():
             return
+        
+        # Skip the recompute if nothing feeding it has changed
+        route_name = self.combo_route.currentText()
+        inputs = (
+            route_name,
+            self.edit_custom_port.value(), self.edit_custom_canal.value(),
+            self.edit_custom_ocean.value(),
+            self.edit_speed_ocean.value(), self.edit_speed_canal.value(),
+            self.edit_speed_port.value(),
+            self.edit_port_days_origin.value(), self.edit_port_days_dest.value(),
+            self._cruise_speed, self._sea_days,
+        )
+        if inputs == self._last_inputs:
+            return
+        self._last_inputs = None
+        
+        # Cruise speed from parent widget
+        cruise_speed = self._cruise_speed
+        if cruise_speed <= 0:
+            self._show_placeholders()
+            return
             
-        try:
-            # Get cruise speed from parent widget
-            cruise_speed = self.parent().m_Speed if hasattr(self.parent(), 'm_Speed') else 15.0
-            
-            # Get route distances
-            route_name = self.combo_route.currentText()
-            if route_name == "Custom":
-                dist_port = float(self.edit_custom_port.text() or 0)
-                dist_canal = float(self.edit_custom_canal.text() or 0)
-                dist_ocean = float(self.edit_custom_ocean.text() or 0)
-            else:
-                route = ROUTE_DATABASE[route_name]
-                dist_port = route['port_approach']
-                dist_canal = route['canal']
-                dist_ocean = route['open_ocean']
-            
-            total_distance = dist_port + dist_canal + dist_ocean
-            self.label_total_distance.setText(f"{total_distance:.0f} nm")
-            
-            # Get speed profiles
-            speed_ocean_pct = float(self.edit_speed_ocean.text() or 100) / 100.0
-            speed_canal_pct = float(self.edit_speed_canal.text() or 20) / 100.0
-            speed_port_pct = float(self.edit_speed_port.text() or 10) / 100.0
-            
-            # Calculate time for each segment
-            # Time = Distance / Speed (in hours), then convert to days
-            time_port_hours = dist_port / (cruise_speed * speed_port_pct) if speed_port_pct > 0 else 0
-            time_canal_hours = dist_canal / (cruise_speed * speed_canal_pct) if speed_canal_pct > 0 else 0
-            time_ocean_hours = dist_ocean / (cruise_speed * speed_ocean_pct) if speed_ocean_pct > 0 else 0
-            
-            # Convert to days
-            time_port_days = time_port_hours / 24.0
-            time_canal_days = time_canal_hours / 24.0
-            time_ocean_days = time_ocean_hours / 24.0
-            
-            # One-way transit time
-            one_way_time = time_port_days + time_canal_days + time_ocean_days
-            
-            # Round trip time
-            round_trip_time = 2 * one_way_time
-            
-            # Add port operation time
-            port_days_origin = float(self.edit_port_days_origin.text() or 0)
-            port_days_dest = float(self.edit_port_days_dest.text() or 0)
-            total_port_days = port_days_origin + port_days_dest
-            
-            # Total voyage time
-            total_voyage_time = round_trip_time + total_port_days
-            self.label_voyage_time.setText(f"{total_voyage_time:.2f} days")
-            
-            # Calculate annual voyages
-            sea_days = self.parent().m_Seadays if hasattr(self.parent(), 'm_Seadays') else 340.0
-            if total_voyage_time > 0:
-                annual_voyages = sea_days / total_voyage_time
-                self.label_annual_voyages.setText(f"{annual_voyages:.2f} voyages/year")
-            else:
-                self.label_annual_voyages.setText("-- voyages/year")
-                
-        except (ValueError, ZeroDivisionError):
-            # If any field is invalid, show placeholders
-            self.label_total_distance.setText("-- nm")
-            self.label_voyage_time.setText("-- days")
-            self.label_annual_voyages.setText("-- voyages/year")
+        # Get route distances
+        if self._current_route_dist is None:
+            dist_port = self.edit_custom_port.value()
+            dist_canal = self.edit_custom_canal.value()
+            dist_ocean = self.edit_custom_ocean.value()
+        else:
+            dist_port, dist_canal, dist_ocean = self._current_route_dist
+        
+        total_distance = dist_port + dist_canal + dist_ocean
+        _set_label(self.label_total_distance, f"{total_distance:.0f} nm")
+        
+        # Get speed profiles
+        speed_ocean_pct = self.edit_speed_ocean.value() / 100.0
+        speed_canal_pct = self.edit_speed_canal.value() / 100.0
+        speed_port_pct = self.edit_speed_port.value() / 100.0
+        
+        # Time = Distance / Speed (in hours), then convert to days. The
+        # 1/(speed*24) factor and the x2 for the round trip are shared by
+        # all three segments, so apply them once.
+        hours_per_speed = 0.0
+        if speed_port_pct > 0:
+            hours_per_speed += dist_port / speed_port_pct
+        if speed_canal_pct > 0:
+            hours_per_speed += dist_canal / speed_canal_pct
+        if speed_ocean_pct > 0:
+            hours_per_speed += dist_ocean / speed_ocean_pct
+        
+        # Round trip time
+        round_trip_time = hours_per_speed * (2.0 / (cruise_speed * 24.0))
+        
+        # Add port operation time
+        port_days_origin = self.edit_port_days_origin.value()
+        port_days_dest = self.edit_port_days_dest.value()
+        total_port_days = port_days_origin + port_days_dest
+        
+        # Total voyage time
+        total_voyage_time = round_trip_time + total_port_days
+        _set_label(self.label_voyage_time, f"{total_voyage_time:.2f} days")
+        
+        # Calculate annual voyages
+        sea_days = self._sea_days
+        if total_voyage_time > 0:
+            annual_voyages = sea_days / total_voyage_time
+            _set_label(self.label_annual_voyages, f"{annual_voyages:.2f} voyages/year")
+        else:
+            _set_label(self.label_annual_voyages, "-- voyages/year")
+        
+        self._last_inputs = inputs
+    
+    def _show_placeholders(self):
+        """Show placeholders when the voyage cannot be calculated"""
+        _set_label(self.label_total_distance, "-- nm")
+        _set_label(self.label_voyage_time, "-- days")
+        _set_label(self.label_annual_voyages, "-- voyages/year")
     
     def set_data(self, data):
         """Load data into the dialog"""
         self.data = data.copy()
         
-        # Set mode
-        if data['voyage_mode'] == 0:
-            self.radio_annual.setChecked(True)
-        else:
-            self.radio_port_to_port.setChecked(True)
-        
-        # Set route
-        route_name = data['selected_route']
-        index = self.combo_route.findText(route_name)
-        if index >= 0:
-            self.combo_route.setCurrentIndex(index)
-        
-        # Set speed profiles
-        self.edit_speed_ocean.setText(f"{data['speed_profile_ocean']:.6g}")
-        self.edit_speed_canal.setText(f"{data['speed_profile_canal']:.6g}")
-        self.edit_speed_port.setText(f"{data['speed_profile_port']:.6g}")
-        
-        # Set port days
-        self.edit_port_days_origin.setText(f"{data['port_days_origin']:.6g}")
-        self.edit_port_days_dest.setText(f"{data['port_days_dest']:.6g}")
-        
-        # Set custom route distances
-        self.edit_custom_port.setText(f"{data['custom_port_approach']:.6g}")
-        self.edit_custom_canal.setText(f"{data['custom_canal']:.6g}")
-        self.edit_custom_ocean.setText(f"{data['custom_ocean']:.6g}")
-        
+        # Block the radios' signals so setting the mode does not trigger a
+        # refresh of its own; refresh once at the end
+        radios = (self.radio_annual, self.radio_port_to_port)
+        for radio in radios:
+            radio.blockSignals(True)
+        try:
+            # Set mode
+            if data['voyage_mode'] == 0:
+                self.radio_annual.setChecked(True)
+            else:
+                self.radio_port_to_port.setChecked(True)
+        finally:
+            for radio in radios:
+                radio.blockSignals(False)
+        
+        # Not built yet: _build_ptp_widgets fills the fields from self.data
+        if self._ptp_built:
+            self._populate_ptp()
         self._update_ui_state()
         
     def get_data(self):
         """Get data from the dialog"""
         self.data['voyage_mode'] = 1 if self.radio_port_to_port.isChecked() else 0
+        if not self._ptp_built:
+            return self.data  # Port to Port fields never shown; nothing edited
         self.data['selected_route'] = self.combo_route.currentText()
         
-        try:
-            self.data['speed_profile_ocean'] = float(self.edit_speed_ocean.text())
-            self.data['speed_profile_canal'] = float(self.edit_speed_canal.text())
-            self.data['speed_profile_port'] = float(self.edit_speed_port.text())
-            self.data['port_days_origin'] = float(self.edit_port_days_origin.text())
-            self.data['port_days_dest'] = float(self.edit_port_days_dest.text())
-            self.data['custom_port_approach'] = float(self.edit_custom_port.text())
-            self.data['custom_canal'] = float(self.edit_custom_canal.text())
-            self.data['custom_ocean'] = float(self.edit_custom_ocean.text())
-        except ValueError:
-            pass  # Keep previous values if conversion fails
+        self.data['speed_profile_ocean'] = self.edit_speed_ocean.value()
+        self.data['speed_profile_canal'] = self.edit_speed_canal.value()
+        self.data['speed_profile_port'] = self.edit_speed_port.value()
+        self.data['port_days_origin'] = self.edit_port_days_origin.value()
+        self.data['port_days_dest'] = self.edit_port_days_dest.value()
+        self.data['custom_port_approach'] = self.edit_custom_port.value()
+        self.data['custom_canal'] = self.edit_custom_canal.value()
+        self.data['custom_ocean'] = self.edit_custom_ocean.value()
         
         return self.data
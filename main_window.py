@@ -24,6 +24,8 @@ class MainWindow(QMainWindow):
         self.view_widget = ShipDesViewWidget(self)
         self.setCentralWidget(self.view_widget)
 
+        self.dlg_about = None # Built on first use by on_app_about
+
         self._create_menus()
 
     def _create_menus(self):
@@ -74,5 +76,6 @@ class MainWindow(QMainWindow):
         """
         Replaces CShipDesApp::OnAppAbout
         """
-        dlg = AboutDialog(self)
-        dlg.exec()
\ No newline at end of file
+        if self.dlg_about is None:
+            self.dlg_about = AboutDialog(self)
+        self.dlg_about.exec()
\ No newline at end of file
@@ -4,13 +4,14 @@ import csv
 import numpy as np
 from PySide6.QtWidgets import (
     QWidget, QFormLayout, QLineEdit, QComboBox, QCheckBox,
-    QTextEdit, QPushButton, QVBoxLayout, QGroupBox, QRadioButton,
+    QPlainTextEdit, QPushButton, QVBoxLayout, QGroupBox, QRadioButton,
     QHBoxLayout, QMessageBox, QFileDialog, QLabel, QGridLayout,
     QApplication, QDialog, QTableWidget, QTableWidgetItem, QHeaderView,
     QInputDialog, QListWidget, QAbstractItemView, QScrollArea
 )
 
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
 
 try:
     from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
@@ -564,8 +565,8 @@ class ShipDesViewWidget(QWidget):
         self.maxit = 1000 #
         self.MdfEnable = [False] * 10 #;]
 
-        from dialog_outopt import OutoptDialog
-        self.outopt_data = OutoptDialog().get_data() # Get defaults
+        from dialog_outopt import DEFAULT_DATA as OUTOPT_DEFAULTS
+        self.outopt_data = dict(OUTOPT_DEFAULTS) # Get defaults
 
         self.L1 = 0.0; self.B = 0.0; self.D = 0.0; self.T = 0.0; self.C = 0.0
         self.R = 0.0; self.V = 0.0; self.N1 = 0.0; self.N2 = 0.0; self.V7 = 0.0
@@ -623,12 +624,10 @@ class ShipDesViewWidget(QWidget):
         self.m_H6_Overhead = 1500000.0 # Annual overhead
         self.m_H8_Other = 0.0       # Annual other
 
-        from dialog_modify import ModifyDialog
-        from dialog_readme import ReadmeDialog
-
-        self.dlg_modify = ModifyDialog(self)
-        self.dlg_outopt = OutoptDialog(self)
-        self.dlg_readme = ReadmeDialog(self)
+        # Dialogs are built on first use (see on_dialog_modify etc.)
+        self.dlg_modify = None
+        self.dlg_outopt = None
+        self.dlg_readme = None
 
         self.combo_ship = QComboBox()
         self.combo_ship.addItems(list(ShipConfig.DATA.keys()))
@@ -678,9 +677,10 @@ class ShipDesViewWidget(QWidget):
         self.edit_decom_cost = QLineEdit()
         self.edit_interest = QLineEdit() #
         self.edit_repay = QLineEdit() #
-        self.text_results = QTextEdit()
+        self.text_results = QPlainTextEdit()
         self.text_results.setReadOnly(True)
-        self.text_results.setFontFamily("Courier New")
+        self.text_results.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text_results.setFont(QFont("Courier New"))
         self.btn_modify = QPushButton("&Modify parameters") #
         self.btn_outopt = QPushButton("&Output options") #
 
@@ -1298,7 +1298,7 @@ class ShipDesViewWidget(QWidget):
         self.check_pdtratio.setChecked(self.m_Pdtratio)
         self.check_append.setChecked(self.m_Append)
         
-        self.text_results.setText(self.m_Results)
+        self.text_results.setPlainText(self.m_Results)
 
     def _show_error(self, message, title="Input error"):
         """Helper for porting MessageBox"""
@@ -1314,7 +1314,8 @@ class ShipDesViewWidget(QWidget):
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if ret == QMessageBox.StandardButton.No: 
             self.dbgmd = False
-            self.dlg_modify.data['dbgmd'] = False
+            if self.dlg_modify is not None:
+                self.dlg_modify.params.dbgmd = False
             return False
         return True
 
@@ -1483,9 +1484,9 @@ class ShipDesViewWidget(QWidget):
         if ratio <= 1.0:
             return True 
 
-        self.text_results.append(f"\n--- VOLUME LIMIT DETECTED ---")
-        self.text_results.append(f"Required: {int(req)} m3 | Available: {int(avail)} m3")
-        self.text_results.append(f"Expanding ship dimensions...")
+        self.text_results.appendPlainText(f"\n--- VOLUME LIMIT DETECTED ---")
+        self.text_results.appendPlainText(f"Required: {int(req)} m3 | Available: {int(avail)} m3")
+        self.text_results.appendPlainText(f"Expanding ship dimensions...")
 
         target_payload = self.W 
         L_orig, B_orig, D_orig = self.L1, self.B, self.D
@@ -1544,12 +1545,12 @@ class ShipDesViewWidget(QWidget):
                 req, avail, ratio = self._get_volume_status()
                 
                 if ratio <= 1.0:
-                    self.text_results.append(f"-> Converged at L={self.L1:.1f}m")
-                    self.text_results.append(f"-> Draft adjusted to {self.T:.1f}m (New Disp: {int(self.M)}t)")
+                    self.text_results.appendPlainText(f"-> Converged at L={self.L1:.1f}m")
+                    self.text_results.appendPlainText(f"-> Draft adjusted to {self.T:.1f}m (New Disp: {int(self.M)}t)")
                     self.W1 = self.M - new_lightship - fuel_mass - misc_mass
                     return True 
 
-            self.text_results.append("-> WARNING: Volume expansion limit reached.")
+            self.text_results.appendPlainText("-> WARNING: Volume expansion limit reached.")
             return False
         finally:
             self.ignspd = prev_ignspd
@@ -1740,7 +1741,9 @@ class ShipDesViewWidget(QWidget):
                         else: msg += "\r\n Keep running in the debug mode?\r\n"
                     if W1 <= 0.0 and self.Kcount >= 10:
                         QMessageBox.critical(self, "Info. from OnButtonCal in debug mode", msg)
-                        self.dbgmd = False; self.dlg_modify.data['dbgmd'] = False
+                        self.dbgmd = False
+                        if self.dlg_modify is not None:
+                            self.dlg_modify.params.dbgmd = False
                     else:
                         if not self._show_debug_msg(msg): break
             
@@ -1781,12 +1784,12 @@ class ShipDesViewWidget(QWidget):
         while not self._power() and retries < 15:
             
             if self.Kpwrerr % self.PITCH_LOW == 0:
-                self.text_results.append(f"[Auto-Correcting: Pitch > 1.4. Increasing RPM from {self.N2:.1f} to {self.N2*1.05:.1f}]")
+                self.text_results.appendPlainText(f"[Auto-Correcting: Pitch > 1.4. Increasing RPM from {self.N2:.1f} to {self.N2*1.05:.1f}]")
                 self.N2 *= 1.05
                 self.N1 *= 1.05
                 
             elif self.Kpwrerr % self.PITCH_HIGH == 0:
-                self.text_results.append(f"[Auto-Correcting: Pitch < 0.5. Decreasing RPM from {self.N2:.1f} to {self.N2*0.95:.1f}]")
+                self.text_results.appendPlainText(f"[Auto-Correcting: Pitch < 0.5. Decreasing RPM from {self.N2:.1f} to {self.N2*0.95:.1f}]")
                 self.N2 *= 0.95
                 self.N1 *= 0.95
                 
@@ -1796,9 +1799,9 @@ class ShipDesViewWidget(QWidget):
             retries += 1
             
         if self.Kpwrerr != 1:
-            self.text_results.append("\nERROR: Propeller design fundamentally failed!")
-            self.text_results.append("The physics engine cannot balance the thrust required for this weight/speed.")
-            self.text_results.append("Try: 1) Reducing Speed, 2) Reducing Range, or 3) Unchecking 'Prop.dia. to T ratio'.")
+            self.text_results.appendPlainText("\nERROR: Propeller design fundamentally failed!")
+            self.text_results.appendPlainText("The physics engine cannot balance the thrust required for this weight/speed.")
+            self.text_results.appendPlainText("Try: 1) Reducing Speed, 2) Reducing Range, or 3) Unchecking 'Prop.dia. to T ratio'.")
             return
         self._apply_resistance_breakdown()
 
@@ -1922,7 +1925,7 @@ class ShipDesViewWidget(QWidget):
                 header.append("RFR($/tonne)")
 
         self.m_Results = f"Running range analysis for '{param_name}'...\r\nSaving to {fileName}\r\n"
-        self.text_results.setText(self.m_Results)
+        self.text_results.setPlainText(self.m_Results)
         self.Kcases = 0 
 
         original_ui_state = {
@@ -1958,7 +1961,7 @@ class ShipDesViewWidget(QWidget):
                 is_teu_mode = original_ui_state['teu_r']
                 
                 for i, value in enumerate(value_range):
-                    self.text_results.append(f"Running step {i+1}/{steps} ({param_name} = {value:.4f})...")
+                    self.text_results.appendPlainText(f"Running step {i+1}/{steps} ({param_name} = {value:.4f})...")
                     QApplication.processEvents()
 
                     if param_name == "Speed(knts)":
@@ -2027,7 +2030,7 @@ class ShipDesViewWidget(QWidget):
 
                     writer.writerow(row)
             
-            self.text_results.append(f"\r\n... Range analysis complete. ...")
+            self.text_results.appendPlainText(f"\r\n... Range analysis complete. ...")
             
             msg = f"Successfully saved {steps} rows to {fileName}"
             if total_skipped > 0:
@@ -2061,7 +2064,7 @@ class ShipDesViewWidget(QWidget):
             self.ignpth = original_ui_state['ignpth']
             
             self.m_Results = "Press the Calculate button\r\nto find ship dimensions ..."
-            self.text_results.setText(self.m_Results)
+            self.text_results.setPlainText(self.m_Results)
             self.CalculatedOk = False
             self.Kcases = 0
             self._reset_dlg()
@@ -2191,7 +2194,7 @@ class ShipDesViewWidget(QWidget):
                 
                 return 0.0
 
-            self.text_results.append("Starting analysis...")
+            self.text_results.appendPlainText("Starting analysis...")
             
             if is_3d:
                 for i in range(steps_2):
@@ -2232,11 +2235,11 @@ class ShipDesViewWidget(QWidget):
                                               f"{y_param_name} vs {param_name_1}")
 
             self.graph_window.show()
-            self.text_results.append("Plot complete.")
+            self.text_results.appendPlainText("Plot complete.")
             
             if total_skipped > 0:
                 summary_msg = f"{total_skipped} calculation(s) were skipped/omitted from the plot due to physical constraints."
-                self.text_results.append(f"Note: {summary_msg}")
+                self.text_results.appendPlainText(f"Note: {summary_msg}")
                 QMessageBox.warning(self, "Plot Missing Data", summary_msg)
 
         except Exception as e:
@@ -2395,12 +2398,12 @@ class ShipDesViewWidget(QWidget):
             return 0.0
 
         try:
-            self.text_results.append(f"\n--- MULTI-ENGINE BATTLE ---")
-            self.text_results.append(f"Comparing: {', '.join(selected_engines)}")
-            self.text_results.append(f"X-Axis: {param_x} | Y-Axis: {param_y}")
+            self.text_results.appendPlainText(f"\n--- MULTI-ENGINE BATTLE ---")
+            self.text_results.appendPlainText(f"Comparing: {', '.join(selected_engines)}")
+            self.text_results.appendPlainText(f"X-Axis: {param_x} | Y-Axis: {param_y}")
             
             for engine_name in selected_engines:
-                self.text_results.append(f"Calculating {engine_name}...")
+                self.text_results.appendPlainText(f"Calculating {engine_name}...")
                 
                 idx = self.combo_engine.findText(engine_name)
                 self.combo_engine.setCurrentIndex(idx)
@@ -2436,11 +2439,11 @@ class ShipDesViewWidget(QWidget):
             self.btn_export_battle.setEnabled(True)
 
             self._show_battle_graph(battle_results)
-            self.text_results.append("Battle Complete.\n")
+            self.text_results.appendPlainText("Battle Complete.\n")
             
             if total_skipped > 0:
                 summary_msg = f"{total_skipped} calculation(s) were skipped due to physical constraints."
-                self.text_results.append(f"Note: {summary_msg}")
+                self.text_results.appendPlainText(f"Note: {summary_msg}")
                 QMessageBox.warning(self, "Calculations Skipped", summary_msg)
 
         except Exception as e:
@@ -3141,6 +3144,9 @@ class ShipDesViewWidget(QWidget):
         self.Kstype = self.combo_ship.currentIndex() + 1
         self.MdfEnable[0] = (self.m_Lbratio or self.m_Bvalue)
         self.MdfEnable[1] = self.m_Cbvalue
+        if self.dlg_modify is None:
+            from dialog_modify import ModifyDialog
+            self.dlg_modify = ModifyDialog(self)
         self.dlg_modify.set_enable(self.MdfEnable)
         
         data = {
@@ -3208,13 +3214,19 @@ class ShipDesViewWidget(QWidget):
 
     def on_dialog_outopt(self):
         """Port of OnDialogOutopt"""
+        if self.dlg_outopt is None:
+            from dialog_outopt import OutoptDialog
+            self.dlg_outopt = OutoptDialog(self)
 
         self.dlg_outopt.set_data(self.outopt_data)
         if self.dlg_outopt.exec():
-            self.outopt_data = self.dlg_outopt.get_data()
+            self.outopt_data = self.dlg_outopt.get_data().as_dict()
             
     def on_dialog_readme(self):
         """Called from main window menu"""
+        if self.dlg_readme is None:
+            from dialog_readme import ReadmeDialog
+            self.dlg_readme = ReadmeDialog(self)
 
         self.dlg_readme.exec()
 
@@ -3963,7 +3975,7 @@ class ShipDesViewWidget(QWidget):
         else:
             self.m_Results = formatted_output
             
-        self.text_results.setText(self.m_Results)
+        self.text_results.setPlainText(self.m_Results)
         self.text_results.verticalScrollBar().setValue(self.text_results.verticalScrollBar().maximum())
             
         return True
\ No newline at end of file
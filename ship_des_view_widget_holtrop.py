@@ -1,18 +1,31 @@
 import sys
 import math
-import csv
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from functools import lru_cache
 import numpy as np
+from ship_kernels import (
+    solve_pitch, legacy_beam, legacy_block, teu_capacity, freeboard_m, gm_margin,
+    taylor_resist,
+)
 from PySide6.QtWidgets import (
     QWidget, QFormLayout, QLineEdit, QComboBox, QCheckBox,
-    QTextEdit, QPushButton, QVBoxLayout, QGroupBox, QRadioButton,
+    QPlainTextEdit, QPushButton, QVBoxLayout, QGroupBox, QRadioButton,
     QHBoxLayout, QMessageBox, QFileDialog, QLabel, QGridLayout,
     QApplication, QDialog, QTableWidget, QTableWidgetItem, QHeaderView,
-    QInputDialog, QListWidget, QAbstractItemView, QScrollArea
+    QInputDialog, QListWidget, QAbstractItemView, QScrollArea, QStackedWidget
 )
 
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
 
 try:
+    import matplotlib
+    matplotlib.use('QtAgg')
+    # Let Agg drop sub-pixel vertices and render long sweeps in chunks
+    matplotlib.rcParams['path.simplify'] = True
+    matplotlib.rcParams['path.simplify_threshold'] = 1.0
+    matplotlib.rcParams['agg.path.chunksize'] = 10000
     from matplotlib.backends.backend_qtagg import (
         FigureCanvasQTAgg as FigureCanvas,
         NavigationToolbar2QT as NavigationToolbar,
@@ -93,6 +106,241 @@ def mpl_safe(s: str) -> str:
     return s.replace("$", r"\$")
 
 
+# Range-sweep parameter -> calculation member it sets. During a sweep
+# only that entry of _ui_snapshot changes per step.
+SWEEP_MEMBERS = {
+    "Speed(knts)":         'm_Speed',
+    "Cargo deadweight(t)": 'm_Weight',
+    "TEU Capacity":        'm_TEU',
+    "L/B Ratio":           'm_LbratioV',
+    "B(m)":                'm_BvalueV',
+    "B/T Ratio":           'm_BtratioV',
+    "Block Co.":           'm_CbvalueV',
+    "Reactor Cost ($/kW)": 'm_Reactor_Cost_per_kW',
+    "Range (nm)":          'm_Range',
+    "Fuel Cost ($/t)":     'm_Fuel',
+    "Interest Rate (%)":   'm_Interest',
+    "Carbon Tax ($/t)":    'm_CarbonTax',
+    "Sea days/year":       'm_Seadays',
+    "Methane Slip (%)":    'm_MethaneSlip',
+    "Air Lub Eff. (%)":    'm_AirLubEff',
+    "Wind Power Sav. (%)": 'm_WindSav',
+}
+
+# Members set outside the form (Modify dialog, route profiler, battle
+# overrides, basis combo) that feed on_calculate. Together with the form
+# widgets and _ui_snapshot they make up the sweep memo key.
+CALC_MEMBER_INPUTS = (
+    'Lb01', 'Lb02', 'Lb03', 'Lb04', 'Lb05', 'maxit', 'ignspd', 'ignpth',
+    'Cb11', 'Cb12', 'Cb13', 'Cb14', 'Cb15', 'L111', 'L112', 'L113',
+    'Cb21', 'Cb22', 'Cb23', 'Cb24', 'Cb25', 'L121', 'L122', 'L123',
+    'Cb31', 'Cb32', 'Cb33', 'Cb34', 'Cb35', 'L131', 'L132', 'L133',
+    'm_S1_Steel1', 'm_S2_Steel2', 'm_S3_Outfit1', 'm_S4_Outfit2',
+    'm_S5_Machinery1', 'm_S6_Machinery2', 'm_H3_Maint_Percent', 'm_H2_Crew',
+    'm_H4_Port', 'm_H5_Stores', 'm_H6_Overhead',
+    'm_Power_Factor', 'm_CarbonOverride', 'empirical_basis',
+)
+
+# Result members the sweeps read back after on_calculate; a memoised
+# step restores exactly these.
+SWEEP_RESULT_ATTRS = (
+    'CalculatedOk', 'L1', 'B', 'D', 'T', 'C', 'V', 'M', 'S', 'W1', 'W5',
+    'H1', 'H7', 'P1', 'P2', 'Rf', 'm_LHV', 'm_MethaneSlip', 'm_GWP_methane',
+    'm_TEU_Avg_Weight', 'cost_steel_M', 'cost_outfit_M', 'cost_machinery_M',
+    'annual_fuel_cost_only', 'annual_carbon_tax', 'annual_opex',
+    'attained_cii', 'required_cii', 'cii_rating',
+    'vol_avail', 'vol_cargo', 'vol_fuel', 'vol_mach', 'vol_stores',
+    'vol_expansion_iters', 'vol_utilisation_pct', 'fuel_vol_pct_hull',
+)
+_MISSING = object()
+
+CALC_CACHE_SIZE = 4096
+
+# Brake horsepower to kW; the power members (P, P1, P2) are all in BHP
+BHP_TO_KW = 0.7457
+
+# Plot outputs (combo_param_y entries) that are a _solve_batch column
+# times a unit factor
+SWEEP_OUTPUT_COLUMNS = {
+    "Lbp(m)":             ('L1', 1.0),
+    "B(m)":               ('B', 1.0),
+    "D(m)":               ('D', 1.0),
+    "T(m)":               ('T', 1.0),
+    "CB":                 ('C', 1.0),
+    "Displacement(t)":    ('M', 1.0),
+    "CargoDW(t)":         ('W1', 1.0),
+    "TotalDW(t)":         ('W5', 1.0),
+    "ServicePower(kW)":   ('P1', BHP_TO_KW),
+    "InstalledPower(kW)": ('P2', BHP_TO_KW),
+    "AttainedCII":        ('attained_cii', 1.0),
+    "FuelVolume(m3)":     ('vol_fuel', 1.0),
+    "VolFuel(m3)":        ('vol_fuel', 1.0),
+    "FuelVol%Hull":       ('fuel_vol_pct_hull', 1.0),
+    "VolCargo(m3)":       ('vol_cargo', 1.0),
+    "VolMachinery(m3)":   ('vol_mach', 1.0),
+    "VolStores(m3)":      ('vol_stores', 1.0),
+    "VolUtilisation%":    ('vol_utilisation_pct', 1.0),
+}
+
+# Plot outputs (combo_param_y entries) that need the economics box ticked
+ECON_OUTPUTS = frozenset((
+    "RFR($/tonne or $/TEU)", "BuildCost(M$)", "AnnualFuelCost(M$)",
+    "AnnualCarbonTax(M$)", "AnnualisedCAPEX(M$)", "AnnualOPEX(M$)",
+))
+
+# Per-engine-type (Ketype) constants of Sub_power/Sub_mass: transmission
+# efficiency F9 and, for the legacy diesel and steam plants, the machinery
+# mass regression and voyage fuel coefficient. None means the machinery
+# and fuel are sized from FuelConfig instead.
+EngineProfile = namedtuple('EngineProfile', 'f9 machinery_mass fuel_coef')
+
+
+def _diesel_machinery_mass(P2, N1, K3):
+    """Direct/geared diesel M3: 9.38*(P2/N1)^0.84 + K3*P2^0.7 (P2 in HP)."""
+    N1_safe = N1 if N1 > 0 else 1e-9
+    return 9.38 * ((P2 / N1_safe) ** 0.84) + K3 * (P2 ** 0.7)
+
+
+def _steam_machinery_mass(P2, N1, K3):
+    """Steam turbine M3: 0.16*P2^0.89 (P2 in HP)."""
+    return 0.16 * (P2 ** 0.89)
+
+
+ENGINE_PROFILES = {
+    1: EngineProfile(0.98, _diesel_machinery_mass, 0.15), # Direct Diesel
+    2: EngineProfile(0.95, _diesel_machinery_mass, 0.15), # Geared Diesel
+    3: EngineProfile(0.95, _steam_machinery_mass, 0.28),  # Steam
+    4: EngineProfile(0.95, None, None),                   # Nuclear
+}
+DEFAULT_ENGINE_PROFILE = EngineProfile(0.96, None, None)
+
+
+# _check_data table for the "you can also specify" constraints: (flag
+# member, value member, upper bound, message, edit to focus). A ticked
+# constraint's value must lie in (0, upper]. The prop. dia. ratio entry
+# is kept last; it is the only one also checked in ship-dimensions mode.
+_CONSTRAINT_CHECKS = (
+    ('m_Lbratio',  'm_LbratioV',  math.inf, "L/B ratio must be positive!",        'edit_lbratio'),
+    ('m_Bvalue',   'm_BvalueV',   math.inf, "B value must be positive!",          'edit_bvalue'),
+    ('m_Btratio',  'm_BtratioV',  math.inf, "B/T ratio must be positive!",        'edit_btratio'),
+    ('m_Cbvalue',  'm_CbvalueV',  1.0,      "CB must be positive and < 1.0!",     'edit_cbvalue'),
+    ('m_Pdtratio', 'm_PdtratioV', math.inf, "Prop.dia ratio must be positive!",   'edit_pdtratio'),
+)
+
+
+class InputError(ValueError):
+    """A calculation input failed validation in _check_data.
+
+    widget is the form field to focus when the error is reported, or None.
+    """
+    def __init__(self, message, widget=None):
+        super().__init__(message)
+        self.widget = widget
+
+
+@contextmanager
+def _signals_blocked(widgets):
+    """Blocks Qt signals on widgets for the duration of a with-block."""
+    previous = [w.blockSignals(True) for w in widgets]
+    try:
+        yield
+    finally:
+        for w, was_blocked in zip(widgets, previous):
+            w.blockSignals(was_blocked)
+
+
+def _round6(a, b=1.0):
+    """a / b rounded to 6 decimals (the C++ 1.0e-6*int(1.0e6*x+0.5) idiom)."""
+    return round(a / b, 6) if b else 0.0
+
+
+# Static coefficient tables, shared by every ShipDesViewWidget instance.
+# np.fromiter with an explicit count fills each array straight from the
+# literal, without the intermediate list np.array() builds.
+
+# Wageningen B-series propeller polynomial coefficients (1-based, index 0
+# unused).
+_A6 = np.fromiter((0.0, 0.2461132, -0.4579327, -0.1716513, 0.4350189,
+                   3.681142e-02, -5.782276e-02, -3.677581e-02, 8.540912e-02),
+                  dtype=np.float64, count=9)
+_B6 = np.fromiter((0.0, 0.5545783, -4.203888e-02, -0.7284746, 0.0,
+                   0.1089609, -5.997375e-02, -0.1277425),
+                  dtype=np.float64, count=8)
+_C6 = np.fromiter((0.0, 8.077402e-02, 0.6003515, 0.0, 0.0, 0.0884936,
+                   6.762783e-02), dtype=np.float64, count=7)
+_D6 = np.fromiter((0.0, -0.2862038, 0.0, 0.0, 0.0, -2.004734e-02),
+                  dtype=np.float64, count=6)
+
+# Taylor standard series speed-length ratios V0 (1-based, index 0 unused).
+_V1 = np.fromiter((0.0, 0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.8),
+                  dtype=np.float64, count=8)
+
+# Python-float copies for the scalar arithmetic in _power; indexing these
+# doesn't box a NumPy scalar per coefficient.
+_A6_T = tuple(_A6.tolist())
+_B6_T = tuple(_B6.tolist())
+_C6_T = tuple(_C6.tolist())
+_D6_T = tuple(_D6.tolist())
+_V1_T = tuple(_V1.tolist())
+
+# Taylor standard series resistance regression: one row of 16
+# coefficients per speed-length station _V1[1].._V1[7], dotted with the
+# basis vector built in ShipDesViewWidget._resist.
+_X1 = np.fromiter((
+    -0.7750, 0.2107, 0.0872, 0.0900, 0.0116, 0.0883, 0.0081, 0.0631,
+    0.0429, -0.0249, -0.0124, 0.0236, -0.0301, 0.0877, -0.1243, -0.0269,  # V0 = 0.50
+    -0.7612, 0.2223, 0.0911, 0.0768, 0.0354, 0.0842, 0.0151, 0.0644,
+    0.0650, -0.0187, 0.0292, -0.0245, -0.0442, 0.1124, -0.1341, -0.0006,  # V0 = 0.55
+    -0.7336, 0.2339, 0.0964, 0.0701, 0.0210, 0.0939, 0.0177, 0.0656,
+    0.1062, -0.0270, 0.0647, -0.0776, -0.0537, 0.1151, -0.0775, 0.1145,  # V0 = 0.60
+    -0.6836, 0.2765, 0.0995, 0.0856, 0.0496, 0.1270, 0.0175, 0.0957,
+    0.1463, -0.0502, 0.1629, -0.1313, -0.0863, 0.1133, 0.0355, 0.2255,  # V0 = 0.65
+    -0.5760, 0.3161, 0.1108, 0.1563, 0.2020, 0.1790, 0.0170, 0.1193,
+    0.1706, -0.0699, 0.3574, -0.3034, -0.0944, 0.0839, 0.1715, 0.2006,  # V0 = 0.70
+    -0.3290, 0.3562, 0.1134, 0.4449, 0.3557, 0.1272, 0.0066, 0.1415,
+    0.1238, -0.0051, 0.2882, -0.2508, -0.0115, -0.0156, 0.2569, 0.0138,  # V0 = 0.75
+    -0.0384, 0.4550, 0.0661, 1.0124, 0.2985, 0.0930, 0.0118, 0.5080,
+    0.2203, -0.0514, 0.2110, 0.0486, 0.0046, -0.1433, 0.2680, 0.2283,  # V0 = 0.80
+), dtype=np.float64, count=112).reshape(7, 16)
+
+
+def _inverse_quadratic(x0, r0, x1, r1, x2, r2):
+    """Root estimate through three (x, residual) points by inverse
+    quadratic interpolation, or None when two residuals nearly coincide."""
+    tol = 1e-12 * max(abs(r0), abs(r1), abs(r2))
+    if abs(r0 - r1) <= tol or abs(r0 - r2) <= tol or abs(r1 - r2) <= tol:
+        return None
+    return (x0 * r1 * r2 / ((r0 - r1) * (r0 - r2))
+            + x1 * r0 * r2 / ((r1 - r0) * (r1 - r2))
+            + x2 * r0 * r1 / ((r2 - r0) * (r2 - r1)))
+
+
+@lru_cache(maxsize=128)
+def _freeboard_cached(L1, T, D, C, E5, Y1, Y2, type1_table, kstype1):
+    """Memoised freeboard_m, keyed on the exact inputs: F5 moves 0.25 m
+    per metre of D, so rounding D/T/L1 would shift the displacement by
+    more than the L1 search tolerance. Hits come from repeated probes and
+    from sweep steps that revisit a hull."""
+    return freeboard_m(L1, T, D, C, E5, Y1, Y2, type1_table, kstype1)
+
+
+@lru_cache(maxsize=64)
+def _capital_recovery(I, N):
+    """Sub_cost capital recovery factor for I % interest over N years."""
+    I_rate = I * 0.01
+    H0 = (1.0 + I_rate) ** N
+    if (H0 - 1.0) == 0: H0 = 1e-9 # Avoid div by zero
+    return I_rate * H0 / (H0 - 1.0)
+
+
+@lru_cache(maxsize=4096)
+def _resist_cached(row, L1, B, T, C, W0, X0):
+    """Memoised taylor_resist on the row-th _X1 regression. Keyed on the
+    exact inputs: sweeps over speed-independent inputs (costs, tax, sea
+    days) size the same hull at every step."""
+    return taylor_resist(_X1[row], L1, B, T, C, W0, X0)
+
+
 class FuelConfig:
     """
     Central database for fuel properties.
@@ -545,11 +793,40 @@ class GraphWindow(QWidget):
     Includes interactive matplotlib toolbar (zoom/pan/save) and a
     high-resolution PNG export button.
     """
+    # 2D sweeps longer than this are drawn as a plain line; per-point
+    # markers dominate render time and just merge into a band anyway.
+    MAX_MARKER_POINTS = 200
     def __init__(self, x_data, y_data, z_data=None, x_label="", y_label="", z_label="", title=""):
         super().__init__()
-        self.setWindowTitle(title)
         self.setMinimumSize(900, 720)
 
+        layout = QVBoxLayout(self)
+        self.fig = Figure(figsize=(8, 6), dpi=100)
+        self.fig.patch.set_facecolor('white')
+        self.canvas = FigureCanvas(self.fig)
+        self.ax = None
+        self.line = None # 2D line reused by update_plot
+
+        # Matplotlib's built-in toolbar gives free zoom / pan / save / home
+        layout.addWidget(NavigationToolbar(self.canvas, self))
+        layout.addWidget(self.canvas)
+
+        # Dedicated one-click high-res PNG export
+        btn_save = QPushButton("Save as PNG (300 dpi)")
+        btn_save.clicked.connect(self._save_png)
+        layout.addWidget(btn_save)
+
+        self.update_plot(x_data, y_data, z_data, x_label, y_label, z_label, title)
+
+    def update_plot(self, x_data, y_data, z_data=None, x_label="", y_label="", z_label="", title=""):
+        """
+        (Re)draws the graph. A 2D plot following a 2D plot keeps the same
+        axes and line and only swaps the data, a 3D plot following a 3D
+        plot clears and reuses the 3D axes; anything else rebuilds the
+        axes on the existing figure and canvas.
+        """
+        self.setWindowTitle(title)
+
         # Convert internal dropdown codes to readable labels, then escape
         # any '$' so matplotlib doesn't enter mathtext mode (see mpl_safe).
         x_label = mpl_safe(pretty_label(x_label))
@@ -560,39 +837,46 @@ class GraphWindow(QWidget):
         # title without remapping. Window title (Qt) is unaffected.
         mpl_title = mpl_safe(title)
 
-        layout = QVBoxLayout(self)
-        self.fig = Figure(figsize=(8, 6), dpi=100)
-        self.fig.patch.set_facecolor('white')
-        canvas = FigureCanvas(self.fig)
+        marker = 'o'
+        if y_data is not None and len(y_data) > self.MAX_MARKER_POINTS:
+            marker = 'None'
 
         if z_data is not None:
-            ax = self.fig.add_subplot(111, projection='3d')
+            if self.ax is not None and self.ax.name == '3d':
+                ax = self.ax
+                ax.clear()
+            else:
+                self.fig.clear()
+                self.line = None
+                ax = self.fig.add_subplot(111, projection='3d')
             ax.plot_wireframe(x_data, y_data, z_data, color='#1f4e79', linewidth=0.6)
             ax.set_xlabel(x_label, fontsize=11, labelpad=10)
             ax.set_ylabel(y_label, fontsize=11, labelpad=10)
             ax.set_zlabel(z_label, fontsize=11, labelpad=10)
+        elif self.line is not None:
+            ax = self.ax
+            self.line.set_data(x_data, y_data)
+            self.line.set_marker(marker)
+            ax.relim()
+            ax.autoscale_view()
+            ax.set_xlabel(x_label, fontsize=11)
+            ax.set_ylabel(y_label, fontsize=11)
         else:
+            self.fig.clear()
             ax = self.fig.add_subplot(111)
             if x_data is not None and y_data is not None:
-                ax.plot(x_data, y_data, marker='o', linestyle='-',
-                        color='#1f4e79', markersize=6, linewidth=2)
+                self.line, = ax.plot(x_data, y_data, marker=marker, linestyle='-',
+                                     color='#1f4e79', markersize=6, linewidth=2)
             ax.set_xlabel(x_label, fontsize=11)
             ax.set_ylabel(y_label, fontsize=11)
             ax.grid(True, alpha=0.3, linestyle='--')
             ax.spines['top'].set_visible(False)
             ax.spines['right'].set_visible(False)
 
+        self.ax = ax
         ax.set_title(mpl_title, fontsize=13, fontweight='bold', pad=15)
         self.fig.tight_layout()
-
-        # Matplotlib's built-in toolbar gives free zoom / pan / save / home
-        layout.addWidget(NavigationToolbar(canvas, self))
-        layout.addWidget(canvas)
-
-        # Dedicated one-click high-res PNG export
-        btn_save = QPushButton("Save as PNG (300 dpi)")
-        btn_save.clicked.connect(self._save_png)
-        layout.addWidget(btn_save)
+        self.canvas.draw_idle()
 
     def _save_png(self):
         fileName, _ = QFileDialog.getSaveFileName(
@@ -901,15 +1185,25 @@ class ShipDesViewWidget(QWidget):
     Replaces CShipDesView.
     This is the main form, holding all UI and logic.
     """
+    @property
+    def m_Results(self):
+        """Results text, joined from the chunks in self._result_lines."""
+        return "".join(self._result_lines)
+
+    @m_Results.setter
+    def m_Results(self, text):
+        self._result_lines = [text]
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.NOT_CONVERGE = 2
-        self.SPEED_LOW = 3 #
-        self.SPEED_HIGH = 5 #
-        self.PITCH_LOW = 7 #
-        self.PITCH_HIGH = 11 #
-        self.RESISTANCE_OUT_OF_RANGE = 13 # Selected resistance method outside its valid Fn/CB range
+        # Kpwrerr bit flags; 0 means _power succeeded
+        self.NOT_CONVERGE = 1
+        self.SPEED_LOW = 2 #
+        self.SPEED_HIGH = 4 #
+        self.PITCH_LOW = 8 #
+        self.PITCH_HIGH = 16 #
+        self.RESISTANCE_OUT_OF_RANGE = 32 # Selected resistance method outside its valid Fn/CB range
 
         self.m_Econom = True #
         self.m_VolumeLimit = True
@@ -927,6 +1221,7 @@ class ShipDesViewWidget(QWidget):
         self.m_Range = 12000.0 #
         self.m_Repay = 15.0 #        
         self.m_Results = "Press the Calculate button\r\nto find ship dimensions ..." #
+        self._results_blocks = -1 # text_results block count after _outvdu's last update
         self.m_Seadays = 340.0 #
         self.m_Speed = 15.0 #
         self.m_Voyages = 17.0 #
@@ -936,9 +1231,9 @@ class ShipDesViewWidget(QWidget):
         self.m_Lbratio = False #
         self.m_Btratio = False #
         self.m_Cbvalue = False #
-        self.m_BtratioV = 1.0e-6 * int(1.0e6 * self.m_Breadth / (self.m_Draught if self.m_Draught != 0 else 1e-9) + 0.5) #
+        self.m_BtratioV = _round6(self.m_Breadth, self.m_Draught) #
         self.m_CbvalueV = self.m_Block #
-        self.m_LbratioV = 1.0e-6 * int(1.0e6 * self.m_Length / (self.m_Breadth if self.m_Breadth != 0 else 1e-9) + 0.5) #
+        self.m_LbratioV = _round6(self.m_Length, self.m_Breadth) #
         self.m_Bvalue = False #
         self.m_BvalueV = self.m_Breadth #
         self.m_PdtratioV = 0.6 #
@@ -964,6 +1259,10 @@ class ShipDesViewWidget(QWidget):
         self.m_ResUncertPct = 0.0      # Global Pe multiplier (Holtrop sensitivity)
         self.m_RetrofitMode = False    # If True, machinery cost is discounted
         self.m_RetrofitFactor = 0.40   # Default machinery cost discount
+        self.m_AirLub = False          # Energy-saving devices (ESD panel)
+        self.m_AirLubEff = 5.0         # % bottom-friction reduction
+        self.m_Wind = False
+        self.m_WindSav = 10.0          # % of Pe saved by wind assist
 
         # Per-run override of fuel_data["Carbon"] (tCO2 / t fuel).  None
         # means "use the FuelConfig value".  Set by the Battle Mode dialog
@@ -982,12 +1281,21 @@ class ShipDesViewWidget(QWidget):
         self.Kcases = 0 #
         self.Ketype = 1 #
         self.Kstype = 1 #
-        self.Kpwrerr = 1 #
+        # Combo texts for Kstype/Ketype, read by the calculation subroutines
+        self.ship_name = next(iter(ShipConfig.DATA))
+        self.engine_name = next(iter(FuelConfig.DATA))
+        self.Kpwrerr = 0 #
         self.CalculatedOk = False #
         self.Ksaved = True #
+        self._ui_snapshot = None # Parsed form inputs reused across a range sweep
+        self.is_batch_mode = False # True while a range/plot/battle sweep runs
+        self._calc_cache = OrderedDict() # Sweep-step memo, see _calculate_cached
+        self._input_getters = None
+        self._deferred_errors = None # Held-back probe errors, see on_calculate
         self.Savefile = "SDout.txt" #
         self.design_mode = 0 # 0=Cargo, 1=Ship, 2=TEU
         self.target_teu = 0
+        self.est_teu = 0.0 # Capacity estimate of the last TEU-mode design
         self.Lb01=4.0; self.Lb02=0.025; self.Lb03=30.0; self.Lb04=6.5; self.Lb05=130.0
         self.Cb11=0.93; self.Cb12=0.110; self.Cb13=1.23; self.Cb14=0.395; self.Cb15=1.0 #
         self.Cb21=0.93; self.Cb22=0.110; self.Cb23=1.23; self.Cb24=0.395; self.Cb25=1.0 #
@@ -1040,8 +1348,8 @@ class ShipDesViewWidget(QWidget):
         self.cstern = 0           # Afterbody form: -25, 0, +10
         self.s_app_override = None  # Appendage wetted area, m^2 (None = 4% of S)
 
-        from dialog_outopt import OutoptDialog
-        self.outopt_data = OutoptDialog().get_data() # Get defaults
+        from dialog_outopt import OutoptFlags
+        self._set_outopt_data(OutoptFlags()) # Get defaults
 
         self.L1 = 0.0; self.B = 0.0; self.D = 0.0; self.T = 0.0; self.C = 0.0
         self.R = 0.0; self.V = 0.0; self.N1 = 0.0; self.N2 = 0.0; self.V7 = 0.0
@@ -1053,38 +1361,8 @@ class ShipDesViewWidget(QWidget):
         self.S = 0.0; self.F0 = 0.0; self.F5 = 0.0; self.F9 = 0.0
         self.G6 = 0.0; self.H1 = 0.0; self.H7 = 0.0; self.Kcount = 0
 
-        self._V1 = (0.0, 0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.8)
-        self._A6 = (0.0, 0.2461132, -0.4579327, -0.1716513, 0.4350189,
-                    3.681142e-02, -5.782276e-02, -3.677581e-02, 8.540912e-02)
-        self._B6 = (0.0, 0.5545783, -4.203888e-02, -0.7284746, 0.0,
-                    0.1089609, -5.997375e-02, -0.1277425)
-        self._C6 = (0.0, 8.077402e-02, 0.6003515, 0.0, 0.0, 0.0884936, 6.762783e-02)
-        self._D6 = (0.0, -0.2862038, 0.0, 0.0, 0.0, -2.004734e-02)
-        self._X1 = (
-            0.0, # Index 0 (not used)
-            -0.7750, 0.2107, 0.0872, 0.0900, 0.0116, 0.0883, 0.0081, 0.0631, # 1-8
-            0.0429, -0.0249, -0.0124, 0.0236, -0.0301, 0.0877, -0.1243, -0.0269, # 9-16
-            -0.7612, 0.2223, 0.0911, 0.0768, 0.0354, 0.0842, 0.0151, 0.0644, # 17-24
-            0.0650, -0.0187, 0.0292, -0.0245, -0.0442, 0.1124, -0.1341, -0.0006, # 25-32
-            -0.7336, 0.2339, 0.0964, 0.0701, 0.0210, 0.0939, 0.0177, 0.0656, # 33-40
-            0.1062, -0.0270, 0.0647, -0.0776, -0.0537, 0.1151, -0.0775, 0.1145, # 41-48
-            -0.6836, 0.2765, 0.0995, 0.0856, 0.0496, 0.1270, 0.0175, 0.0957, # 49-56
-            0.1463, -0.0502, 0.1629, -0.1313, -0.0863, 0.1133, 0.0355, 0.2255, # 57-64
-            -0.5760, 0.3161, 0.1108, 0.1563, 0.2020, 0.1790, 0.0170, 0.1193, # 65-72
-            0.1706, -0.0699, 0.3574, -0.3034, -0.0944, 0.0839, 0.1715, 0.2006, # 73-80
-            -0.3290, 0.3562, 0.1134, 0.4449, 0.3557, 0.1272, 0.0066, 0.1415, # 81-88
-            0.1238, -0.0051, 0.2882, -0.2508, -0.0115, -0.0156, 0.2569, 0.0138, # 89-96
-            -0.0384, 0.4550, 0.0661, 1.0124, 0.2985, 0.0930, 0.0118, 0.5080, # 97-104
-            0.2203, -0.0514, 0.2110, 0.0486, 0.0046, -0.1433, 0.2680, 0.2283 # 105-112
-        )
         
         self._E5=0.2; self._Y1=0.5; self._Y2=0.0
-        self._L2 = (30, 40, 60, 80, 100, 120, 140, 160, 180, 200,
-                    220, 240, 260, 280, 300, 320, 340, 360)
-        self._F1 = (250, 334, 573, 841, 1135, 1459, 1803, 2126, 2393, 2612,
-                    2792, 2946, 3072, 3176, 3262, 3331, 3382, 3425)
-        self._F2 = (250, 334, 573, 887, 1271, 1690, 2109, 2520, 2915, 3264,
-                    3586, 3880, 4152, 4397, 4630, 4844, 5055, 5260)
 
         self.m_S1_Steel1 = 22000.0   # Steel cost param 1
         self.m_S2_Steel2 = 3800.0    # Steel cost param 2
@@ -1106,12 +1384,10 @@ class ShipDesViewWidget(QWidget):
         self.m_H6_Overhead = 1500000.0 # Annual overhead
         self.m_H8_Other = 0.0       # Annual other
 
-        from dialog_modify import ModifyDialog
-        from dialog_readme import ReadmeDialog
-
-        self.dlg_modify = ModifyDialog(self)
-        self.dlg_outopt = OutoptDialog(self)
-        self.dlg_readme = ReadmeDialog(self)
+        # Dialogs are built on first use (see on_dialog_modify etc.)
+        self.dlg_modify = None
+        self.dlg_outopt = None
+        self.dlg_readme = None
 
         self.combo_ship = QComboBox()
         self.combo_ship.addItems(list(ShipConfig.DATA.keys()))
@@ -1192,9 +1468,10 @@ class ShipDesViewWidget(QWidget):
         self.edit_decom_cost = QLineEdit()
         self.edit_interest = QLineEdit() #
         self.edit_repay = QLineEdit() #
-        self.text_results = QTextEdit()
+        self.text_results = QPlainTextEdit()
         self.text_results.setReadOnly(True)
-        self.text_results.setFontFamily("Courier New")
+        self.text_results.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.text_results.setFont(QFont("Courier New"))
         self.btn_modify = QPushButton("&Modify parameters") #
         self.btn_outopt = QPushButton("&Output options") #
 
@@ -1593,13 +1870,33 @@ class ShipDesViewWidget(QWidget):
         eco_grid.addWidget(QLabel("Sea days per year:"), 0, 3)
         eco_grid.addWidget(self.edit_seadays, 0, 4)
 
-        eco_grid.addWidget(self.label_fuel, 1, 0)
-        eco_grid.addWidget(self.edit_fuel, 1, 1)
-
+        # Fuel-burning and nuclear cost inputs are mutually exclusive, so
+        # they live on two pages of a stack; _reset_dlg flips the page.
         self.label_lhv = QLabel("Energy Density (MJ/kg):")
         self.edit_lhv = QLineEdit() 
-        eco_grid.addWidget(self.label_lhv, 1, 3)
-        eco_grid.addWidget(self.edit_lhv, 1, 4)
+
+        self.fuel_page = QWidget()
+        fuel_grid = QGridLayout(self.fuel_page)
+        fuel_grid.setContentsMargins(0, 0, 0, 0)
+        fuel_grid.addWidget(self.label_fuel, 0, 0)
+        fuel_grid.addWidget(self.edit_fuel, 0, 1)
+        fuel_grid.addWidget(self.label_lhv, 0, 2)
+        fuel_grid.addWidget(self.edit_lhv, 0, 3)
+
+        self.nuclear_page = QWidget()
+        nuclear_grid = QGridLayout(self.nuclear_page)
+        nuclear_grid.setContentsMargins(0, 0, 0, 0)
+        nuclear_grid.addWidget(self.label_reactor_cost, 0, 0)
+        nuclear_grid.addWidget(self.edit_reactor_cost, 0, 1)
+        nuclear_grid.addWidget(self.label_core_life, 0, 2)
+        nuclear_grid.addWidget(self.edit_core_life, 0, 3)
+        nuclear_grid.addWidget(self.label_decom_cost, 1, 0)
+        nuclear_grid.addWidget(self.edit_decom_cost, 1, 1)
+
+        self.engine_stack = QStackedWidget()
+        self.engine_stack.addWidget(self.fuel_page)     # index 0
+        self.engine_stack.addWidget(self.nuclear_page)  # index 1
+        eco_grid.addWidget(self.engine_stack, 1, 0, 1, 5)
 
         tax_layout = QHBoxLayout()
         self.check_carbon_tax = QCheckBox("Carbon Tax?")
@@ -1614,19 +1911,11 @@ class ShipDesViewWidget(QWidget):
         
         eco_grid.addLayout(tax_layout, 2, 0, 1, 5)
 
-        eco_grid.addWidget(self.label_reactor_cost, 3, 0)
-        eco_grid.addWidget(self.edit_reactor_cost, 3, 1)
-        eco_grid.addWidget(self.label_core_life, 3, 3)
-        eco_grid.addWidget(self.edit_core_life, 3, 4)
-        
         eco_grid.addWidget(QLabel("Interest rate (%):"), 4, 0)
         eco_grid.addWidget(self.edit_interest, 4, 1)
         eco_grid.addWidget(QLabel("No. years to repay:"), 4, 3)
         eco_grid.addWidget(self.edit_repay, 4, 4)
 
-        eco_grid.addWidget(self.label_decom_cost, 5, 0)
-        eco_grid.addWidget(self.edit_decom_cost, 5, 1)
-
         self.check_eedi = QCheckBox("Calculate EEDI (Phase 3)")
         self.check_eedi.setToolTip("Calculates Energy Efficiency Design Index against IMO Reference Lines")
         self.check_eedi.toggled.connect(self._reset_dlg) # Connect to reset logic
@@ -1951,8 +2240,13 @@ class ShipDesViewWidget(QWidget):
         if basis_name in EmpiricalBasisConfig.DATA:
             self.empirical_basis = basis_name
 
-    def _update_ui_to_data(self):
-        """Port of UpdateData(TRUE) - Pulls values from UI to members"""
+    def _read_ui_once(self):
+        """Parses every calculation input on the form.
+
+        Returns a dict of member name -> value; raises ValueError on a bad
+        field. Range sweeps call this once and then only overwrite the
+        swept member in the copy held in self._ui_snapshot.
+        """
 
         def _safe_float(widget, default=0.0):
             try:
@@ -1963,219 +2257,307 @@ class ShipDesViewWidget(QWidget):
             except ValueError:
                 raise ValueError(f"Invalid number in field")
 
-        try:
-            self.m_Weight = _safe_float(self.edit_weight)
-            self.m_Error = _safe_float(self.edit_error)
-            
-            self.m_TEU = _safe_float(self.edit_teu)
-            self.m_TEU_Avg_Weight = _safe_float(self.edit_teu_weight)
-            
-            self.m_LbratioV = _safe_float(self.edit_lbratio)
-            self.m_BvalueV = _safe_float(self.edit_bvalue)
-            self.m_BtratioV = _safe_float(self.edit_btratio)
-            self.m_CbvalueV = _safe_float(self.edit_cbvalue)
-            self.m_PdtratioV = _safe_float(self.edit_pdtratio)
-            
-            self.m_Length = _safe_float(self.edit_length)
-            self.m_Breadth = _safe_float(self.edit_breadth)
-            self.m_Draught = _safe_float(self.edit_draught)
-            self.m_Depth = _safe_float(self.edit_depth)
-            self.m_Block = _safe_float(self.edit_block)
-            
-            self.m_Speed = _safe_float(self.edit_speed)
-            
-            if self.edit_range.text() == "Infinite":
-                self.m_Range = float('inf')
-            else:
-                new_range = _safe_float(self.edit_range)
-                self.m_Range = new_range
-                if not (self.combo_engine.currentIndex() == 3): # Not Nuclear
-                     self.m_conventional_Range = new_range
-            
-            self.m_Prpm = _safe_float(self.edit_prpm)
-            self.m_Erpm = _safe_float(self.edit_erpm)
-            self.m_Voyages = _safe_float(self.edit_voyages)
-            self.m_Seadays = _safe_float(self.edit_seadays)
+        values = {}
+        values['m_Weight'] = _safe_float(self.edit_weight)
+        values['m_Error'] = _safe_float(self.edit_error)
+        
+        values['m_TEU'] = _safe_float(self.edit_teu)
+        values['m_TEU_Avg_Weight'] = _safe_float(self.edit_teu_weight)
+        
+        values['m_LbratioV'] = _safe_float(self.edit_lbratio)
+        values['m_BvalueV'] = _safe_float(self.edit_bvalue)
+        values['m_BtratioV'] = _safe_float(self.edit_btratio)
+        values['m_CbvalueV'] = _safe_float(self.edit_cbvalue)
+        values['m_PdtratioV'] = _safe_float(self.edit_pdtratio)
+        
+        values['m_Length'] = _safe_float(self.edit_length)
+        values['m_Breadth'] = _safe_float(self.edit_breadth)
+        values['m_Draught'] = _safe_float(self.edit_draught)
+        values['m_Depth'] = _safe_float(self.edit_depth)
+        values['m_Block'] = _safe_float(self.edit_block)
+        
+        values['m_Speed'] = _safe_float(self.edit_speed)
+        
+        if self.edit_range.text() == "Infinite":
+            values['m_Range'] = float('inf')
+        else:
+            values['m_Range'] = _safe_float(self.edit_range)
+        
+        values['m_Prpm'] = _safe_float(self.edit_prpm)
+        values['m_Erpm'] = _safe_float(self.edit_erpm)
+        values['m_Voyages'] = _safe_float(self.edit_voyages)
+        values['m_Seadays'] = _safe_float(self.edit_seadays)
 
-            self.m_Fuel = _safe_float(self.edit_fuel)
+        values['m_Fuel'] = _safe_float(self.edit_fuel)
 
-            val_lhv = _safe_float(self.edit_lhv, default=-1.0)
-            if val_lhv > 0:
-                self.m_LHV = val_lhv
-            else:
-                self.m_LHV = 42.7
-            
-            self.m_CarbonTax = _safe_float(self.edit_ctax_rate)
-            self.m_Reactor_Cost_per_kW = _safe_float(self.edit_reactor_cost)
-            self.m_Core_Life = _safe_float(self.edit_core_life)
-            self.m_Decom_Cost = _safe_float(self.edit_decom_cost)
-            self.m_Interest = _safe_float(self.edit_interest)
-            self.m_Repay = _safe_float(self.edit_repay)
-
-            # Sensitivity & retrofit knobs (chapter 5 additions).
-            self.m_MethaneSlip   = _safe_float(self.edit_methane_slip,   default=0.0)
-            self.m_ResUncertPct  = _safe_float(self.edit_res_uncert,     default=0.0)
-            self.m_RetrofitMode  = self.check_retrofit.isChecked()
-            self.m_RetrofitFactor = _safe_float(self.edit_retrofit_factor, default=0.40)
-            # Clamp retrofit factor to a sane band so a typo can't produce
-            # negative or runaway costs.
-            if self.m_RetrofitFactor < 0.0:
-                self.m_RetrofitFactor = 0.0
-            if self.m_RetrofitFactor > 1.5:
-                self.m_RetrofitFactor = 1.5
-
-            self.m_VolumeLimit = self.check_vol_limit.isChecked()
-            
-            if self.edit_density.isVisible():
-                 self.m_CustomDensity = _safe_float(self.edit_density, default=-1.0)
-            else:
-                 self.m_CustomDensity = -1.0 
-
-            if self.radio_cargo.isChecked():
-                self.m_Cargo = 0
-            elif self.radio_ship.isChecked():
-                self.m_Cargo = 1
-            elif self.radio_teu.isChecked():
-                self.m_Cargo = 2
-
-            self.m_Econom = self.check_econom.isChecked()
-            self.m_Lbratio = self.check_lbratio.isChecked()
-            self.m_Bvalue = self.check_bvalue.isChecked()
-            self.m_Btratio = self.check_btratio.isChecked()
-            self.m_Cbvalue = self.check_cbvalue.isChecked()
-            self.m_Pdtratio = self.check_pdtratio.isChecked()
-            self.m_Append = self.check_append.isChecked()
-            
-            self.Kstype = self.combo_ship.currentIndex() + 1
-            self.Ketype = self.combo_engine.currentIndex() + 1
-
-            # ----------------------------------------------------------------
-            # Resistance method state
-            # ----------------------------------------------------------------
-            self.resistance_method = self.combo_resistance_method.currentText()
-
-            # Holtrop hull-form overrides. Empty field = None = "auto-derive"
-            # inside _calc_pe_holtrop(). This lets the user override any subset
-            # of parameters without being forced to fill in all of them.
-            def _opt_float(widget):
-                txt = widget.text().strip()
-                if not txt:
-                    return None
-                try:
-                    return float(txt)
-                except ValueError:
-                    raise ValueError(f"Invalid number in Holtrop field")
-
-            self.lcb_pct = _opt_float(self.edit_lcb_pct)
-            self.iE_deg = _opt_float(self.edit_iE_deg)
-            self.cm = _opt_float(self.edit_cm)
-            self.cwp = _opt_float(self.edit_cwp)
-            self.has_bulb = self.check_bulb.isChecked()
-            self.abt = _safe_float(self.edit_abt) if self.edit_abt.text().strip() else 0.0
-            self.hb = _safe_float(self.edit_hb) if self.edit_hb.text().strip() else 0.0
-            self.has_transom = self.check_transom.isChecked()
-            self.at = _safe_float(self.edit_at) if self.edit_at.text().strip() else 0.0
-            # combo_cstern items are "-25 ..", "0 ..", "+10 .."; first token is the value
-            cstern_text = self.combo_cstern.currentText().split()[0]
+        val_lhv = _safe_float(self.edit_lhv, default=-1.0)
+        if val_lhv > 0:
+            values['m_LHV'] = val_lhv
+        else:
+            values['m_LHV'] = 42.7
+        
+        values['m_CarbonTax'] = _safe_float(self.edit_ctax_rate)
+        values['m_Reactor_Cost_per_kW'] = _safe_float(self.edit_reactor_cost)
+        values['m_Core_Life'] = _safe_float(self.edit_core_life)
+        values['m_Decom_Cost'] = _safe_float(self.edit_decom_cost)
+        values['m_Interest'] = _safe_float(self.edit_interest)
+        values['m_Repay'] = _safe_float(self.edit_repay)
+
+        # Sensitivity & retrofit knobs (chapter 5 additions).
+        values['m_MethaneSlip']   = _safe_float(self.edit_methane_slip,   default=0.0)
+        values['m_ResUncertPct']  = _safe_float(self.edit_res_uncert,     default=0.0)
+        values['m_RetrofitMode']  = self.check_retrofit.isChecked()
+        # Clamp retrofit factor to a sane band so a typo can't produce
+        # negative or runaway costs.
+        retrofit_factor = _safe_float(self.edit_retrofit_factor, default=0.40)
+        values['m_RetrofitFactor'] = min(max(retrofit_factor, 0.0), 1.5)
+
+        # ESD percentages fall back to their defaults instead of failing
+        # the run on a bad entry.
+        values['m_AirLub'] = self.check_als.isChecked()
+        values['m_Wind'] = self.check_wind.isChecked()
+        for name, edit, default in (('m_AirLubEff', self.edit_als_eff, 5.0),
+                                    ('m_WindSav', self.edit_wind_sav, 10.0)):
             try:
-                self.cstern = int(cstern_text)
+                values[name] = float(edit.text())
             except ValueError:
-                self.cstern = 0
-            self.s_app_override = _opt_float(self.edit_sapp)
+                values[name] = default
 
-            return True
-            
+        values['m_VolumeLimit'] = self.check_vol_limit.isChecked()
+        
+        if self.edit_density.isVisible():
+             values['m_CustomDensity'] = _safe_float(self.edit_density, default=-1.0)
+        else:
+             values['m_CustomDensity'] = -1.0 
+
+        if self.radio_cargo.isChecked():
+            values['m_Cargo'] = 0
+        elif self.radio_ship.isChecked():
+            values['m_Cargo'] = 1
+        elif self.radio_teu.isChecked():
+            values['m_Cargo'] = 2
+
+        values['m_Econom'] = self.check_econom.isChecked()
+        values['m_Lbratio'] = self.check_lbratio.isChecked()
+        values['m_Bvalue'] = self.check_bvalue.isChecked()
+        values['m_Btratio'] = self.check_btratio.isChecked()
+        values['m_Cbvalue'] = self.check_cbvalue.isChecked()
+        values['m_Pdtratio'] = self.check_pdtratio.isChecked()
+        values['m_Append'] = self.check_append.isChecked()
+        
+        values['Kstype'] = self.combo_ship.currentIndex() + 1
+        values['Ketype'] = self.combo_engine.currentIndex() + 1
+        values['ship_name'] = self.combo_ship.currentText()
+        values['engine_name'] = self.combo_engine.currentText()
+
+        # ----------------------------------------------------------------
+        # Resistance method state
+        # ----------------------------------------------------------------
+        values['resistance_method'] = self.combo_resistance_method.currentText()
+
+        # Holtrop hull-form overrides. Empty field = None = "auto-derive"
+        # inside _calc_pe_holtrop(). This lets the user override any subset
+        # of parameters without being forced to fill in all of them.
+        def _opt_float(widget):
+            txt = widget.text().strip()
+            if not txt:
+                return None
+            try:
+                return float(txt)
+            except ValueError:
+                raise ValueError(f"Invalid number in Holtrop field")
+
+        values['lcb_pct'] = _opt_float(self.edit_lcb_pct)
+        values['iE_deg'] = _opt_float(self.edit_iE_deg)
+        values['cm'] = _opt_float(self.edit_cm)
+        values['cwp'] = _opt_float(self.edit_cwp)
+        values['has_bulb'] = self.check_bulb.isChecked()
+        values['abt'] = _safe_float(self.edit_abt) if self.edit_abt.text().strip() else 0.0
+        values['hb'] = _safe_float(self.edit_hb) if self.edit_hb.text().strip() else 0.0
+        values['has_transom'] = self.check_transom.isChecked()
+        values['at'] = _safe_float(self.edit_at) if self.edit_at.text().strip() else 0.0
+        # combo_cstern items are "-25 ..", "0 ..", "+10 .."; first token is the value
+        cstern_text = self.combo_cstern.currentText().split()[0]
+        try:
+            values['cstern'] = int(cstern_text)
+        except ValueError:
+            values['cstern'] = 0
+        values['s_app_override'] = _opt_float(self.edit_sapp)
+
+        return values
+
+    def _update_ui_to_data(self):
+        """Port of UpdateData(TRUE) - Pulls values from UI to members"""
+        try:
+            values = self._ui_snapshot
+            if values is None:
+                values = self._read_ui_once()
         except ValueError as e:
             self._show_error(f"Invalid input format.\n\nPlease check that all visible fields contain valid numbers.\n(Error: {e})")
             return False
 
+        for name, value in values.items():
+            setattr(self, name, value)
+        if self.m_Range != float('inf') and self.Ketype != 4: # Not Nuclear
+            self.m_conventional_Range = self.m_Range
+        return True
+
     def _update_data_to_ui(self):
         """Port of UpdateData(FALSE) - Pushes member values to UI"""
-        self.combo_ship.setCurrentIndex(self.Kstype - 1)
-        self.combo_engine.setCurrentIndex(self.Ketype - 1)
-        
-        self.edit_weight.setText(f"{self.m_Weight:.6g}")
-        self.edit_error.setText(f"{self.m_Error:.6g}")
-        self.edit_teu.setText(f"{self.m_TEU:.6g}")
-        self.edit_teu_weight.setText(f"{self.m_TEU_Avg_Weight:.6g}")
-        self.edit_lbratio.setText(f"{self.m_LbratioV:.6g}")
-        self.edit_bvalue.setText(f"{self.m_BvalueV:.6g}")
-        self.edit_btratio.setText(f"{self.m_BtratioV:.6g}")
-        self.edit_cbvalue.setText(f"{self.m_CbvalueV:.6g}")
-        self.edit_pdtratio.setText(f"{self.m_PdtratioV:.6g}")
-        self.edit_length.setText(f"{self.m_Length:.6g}")
-        self.edit_breadth.setText(f"{self.m_Breadth:.6g}")
-        self.edit_draught.setText(f"{self.m_Draught:.6g}")
-        self.edit_depth.setText(f"{self.m_Depth:.6g}")
-        self.edit_block.setText(f"{self.m_Block:.6g}")
-        self.edit_speed.setText(f"{self.m_Speed:.6g}")
-        
-        self.edit_prpm.setText(f"{self.m_Prpm:.6g}")
-        self.edit_erpm.setText(f"{self.m_Erpm:.6g}")
-        self.edit_voyages.setText(f"{self.m_Voyages:.6g}")
-        self.edit_seadays.setText(f"{self.m_Seadays:.6g}")
-
-        self.edit_fuel.setText(f"{self.m_Fuel:.6g}")
-
-        self.edit_lhv.setText(f"{self.m_LHV:.6g}")
-        self.edit_reactor_cost.setText(f"{self.m_Reactor_Cost_per_kW:.6g}")
-        
-        self.edit_core_life.setText(f"{self.m_Core_Life:.6g}")
-        self.edit_decom_cost.setText(f"{self.m_Decom_Cost:.6g}")
-        self.edit_interest.setText(f"{self.m_Interest:.6g}")
-        self.edit_repay.setText(f"{self.m_Repay:.6g}")
-
-        self.check_vol_limit.setChecked(self.m_VolumeLimit)
-        
-        self.check_econom.setChecked(self.m_Econom)
-        self.radio_cargo.setChecked(self.m_Cargo == 0)
-        self.radio_ship.setChecked(self.m_Cargo == 1)
-        self.radio_teu.setChecked(self.m_Cargo == 2)
-        self.check_lbratio.setChecked(self.m_Lbratio)
-        self.check_bvalue.setChecked(self.m_Bvalue)
-        self.check_btratio.setChecked(self.m_Btratio)
-        self.check_cbvalue.setChecked(self.m_Cbvalue)
-        self.check_pdtratio.setChecked(self.m_Pdtratio)
-        self.check_append.setChecked(self.m_Append)
-
-        # ---- Resistance method state ----
-        # Push the selected method back to the dropdown. The signal handler
-        # (_on_resistance_method_changed) will hide/show the Holtrop panel
-        # automatically — no need to repeat that logic here.
-        method_name = getattr(self, 'resistance_method', "Taylor's Series (Legacy)")
-        if method_name in ResistanceMethodConfig.DATA:
-            self.combo_resistance_method.setCurrentText(method_name)
-
-        # Holtrop hull-form fields. None -> blank (the placeholder "auto"
-        # text remains visible). Numeric values are stamped into the field.
-        def _opt_text(val):
-            return "" if val is None else f"{val:.6g}"
-
-        self.edit_lcb_pct.setText(_opt_text(self.lcb_pct))
-        self.edit_iE_deg.setText(_opt_text(self.iE_deg))
-        self.edit_cm.setText(_opt_text(self.cm))
-        self.edit_cwp.setText(_opt_text(self.cwp))
-        self.check_bulb.setChecked(self.has_bulb)
-        self.edit_abt.setText("" if self.abt == 0.0 else f"{self.abt:.6g}")
-        self.edit_hb.setText("" if self.hb == 0.0 else f"{self.hb:.6g}")
-        self.check_transom.setChecked(self.has_transom)
-        self.edit_at.setText("" if self.at == 0.0 else f"{self.at:.6g}")
-        # combo_cstern: items are "-25 ..", "0 ..", "+10 .."
-        cstern_idx = {-25: 0, 0: 1, 10: 2}.get(self.cstern, 1)
-        self.combo_cstern.setCurrentIndex(cstern_idx)
-        self.edit_sapp.setText(_opt_text(self.s_app_override))
-
-        # ---- Sensitivity & retrofit state (chapter 5) ----
-        # Push these back so reload-from-saved-state preserves them.
-        self.edit_methane_slip.setText(f"{self.m_MethaneSlip:.6g}")
-        self.edit_res_uncert.setText(f"{self.m_ResUncertPct:.6g}")
-        self.check_retrofit.setChecked(self.m_RetrofitMode)
-        self.edit_retrofit_factor.setText(f"{self.m_RetrofitFactor:.6g}")
-
-        self.text_results.setText(self.m_Results)
+        # Members are already consistent, so the per-widget toggled /
+        # index-changed handlers (and their cascades into _reset_dlg) are
+        # muted; callers run _reset_dlg() once afterwards.
+        with self._mute():
+            self.combo_ship.setCurrentIndex(self.Kstype - 1)
+            self.combo_engine.setCurrentIndex(self.Ketype - 1)
+        
+            self.edit_weight.setText(f"{self.m_Weight:.6g}")
+            self.edit_error.setText(f"{self.m_Error:.6g}")
+            self.edit_teu.setText(f"{self.m_TEU:.6g}")
+            self.edit_teu_weight.setText(f"{self.m_TEU_Avg_Weight:.6g}")
+            self.edit_lbratio.setText(f"{self.m_LbratioV:.6g}")
+            self.edit_bvalue.setText(f"{self.m_BvalueV:.6g}")
+            self.edit_btratio.setText(f"{self.m_BtratioV:.6g}")
+            self.edit_cbvalue.setText(f"{self.m_CbvalueV:.6g}")
+            self.edit_pdtratio.setText(f"{self.m_PdtratioV:.6g}")
+            self.edit_length.setText(f"{self.m_Length:.6g}")
+            self.edit_breadth.setText(f"{self.m_Breadth:.6g}")
+            self.edit_draught.setText(f"{self.m_Draught:.6g}")
+            self.edit_depth.setText(f"{self.m_Depth:.6g}")
+            self.edit_block.setText(f"{self.m_Block:.6g}")
+            self.edit_speed.setText(f"{self.m_Speed:.6g}")
+        
+            self.edit_prpm.setText(f"{self.m_Prpm:.6g}")
+            self.edit_erpm.setText(f"{self.m_Erpm:.6g}")
+            self.edit_voyages.setText(f"{self.m_Voyages:.6g}")
+            self.edit_seadays.setText(f"{self.m_Seadays:.6g}")
+
+            self.edit_fuel.setText(f"{self.m_Fuel:.6g}")
+
+            self.edit_lhv.setText(f"{self.m_LHV:.6g}")
+            self.edit_reactor_cost.setText(f"{self.m_Reactor_Cost_per_kW:.6g}")
+        
+            self.edit_core_life.setText(f"{self.m_Core_Life:.6g}")
+            self.edit_decom_cost.setText(f"{self.m_Decom_Cost:.6g}")
+            self.edit_interest.setText(f"{self.m_Interest:.6g}")
+            self.edit_repay.setText(f"{self.m_Repay:.6g}")
+
+            self.check_vol_limit.setChecked(self.m_VolumeLimit)
+        
+            self.check_econom.setChecked(self.m_Econom)
+            self.radio_cargo.setChecked(self.m_Cargo == 0)
+            self.radio_ship.setChecked(self.m_Cargo == 1)
+            self.radio_teu.setChecked(self.m_Cargo == 2)
+            self.check_lbratio.setChecked(self.m_Lbratio)
+            self.check_bvalue.setChecked(self.m_Bvalue)
+            self.check_btratio.setChecked(self.m_Btratio)
+            self.check_cbvalue.setChecked(self.m_Cbvalue)
+            self.check_pdtratio.setChecked(self.m_Pdtratio)
+            self.check_append.setChecked(self.m_Append)
+
+            # ---- Resistance method state ----
+            # Push the selected method back to the dropdown. The signal handler
+            # (_on_resistance_method_changed) will hide/show the Holtrop panel
+            # automatically — no need to repeat that logic here.
+            method_name = getattr(self, 'resistance_method', "Taylor's Series (Legacy)")
+            if method_name in ResistanceMethodConfig.DATA:
+                self.combo_resistance_method.setCurrentText(method_name)
+
+            # Holtrop hull-form fields. None -> blank (the placeholder "auto"
+            # text remains visible). Numeric values are stamped into the field.
+            def _opt_text(val):
+                return "" if val is None else f"{val:.6g}"
+
+            self.edit_lcb_pct.setText(_opt_text(self.lcb_pct))
+            self.edit_iE_deg.setText(_opt_text(self.iE_deg))
+            self.edit_cm.setText(_opt_text(self.cm))
+            self.edit_cwp.setText(_opt_text(self.cwp))
+            self.check_bulb.setChecked(self.has_bulb)
+            self.edit_abt.setText("" if self.abt == 0.0 else f"{self.abt:.6g}")
+            self.edit_hb.setText("" if self.hb == 0.0 else f"{self.hb:.6g}")
+            self.check_transom.setChecked(self.has_transom)
+            self.edit_at.setText("" if self.at == 0.0 else f"{self.at:.6g}")
+            # combo_cstern: items are "-25 ..", "0 ..", "+10 .."
+            cstern_idx = {-25: 0, 0: 1, 10: 2}.get(self.cstern, 1)
+            self.combo_cstern.setCurrentIndex(cstern_idx)
+            self.edit_sapp.setText(_opt_text(self.s_app_override))
+
+            # ---- Sensitivity & retrofit state (chapter 5) ----
+            # Push these back so reload-from-saved-state preserves them.
+            self.edit_methane_slip.setText(f"{self.m_MethaneSlip:.6g}")
+            self.edit_res_uncert.setText(f"{self.m_ResUncertPct:.6g}")
+            self.check_retrofit.setChecked(self.m_RetrofitMode)
+            self.edit_retrofit_factor.setText(f"{self.m_RetrofitFactor:.6g}")
+
+            self.text_results.setPlainText(self.m_Results)
+
+    def _mute(self):
+        """Context manager blocking signals on the widgets whose handlers
+        only re-derive member state or call _reset_dlg."""
+        return _signals_blocked((
+            self.combo_ship, self.combo_engine,
+            self.radio_cargo, self.radio_ship, self.radio_teu,
+            self.check_econom, self.check_vol_limit,
+            self.check_lbratio, self.check_bvalue, self.check_btratio,
+            self.check_cbvalue, self.check_pdtratio,
+            self.check_bulb, self.check_transom, self.check_retrofit,
+        ))
+
+    def _log(self, text):
+        """Appends a progress/diagnostic line to the results pane, except
+        during headless sweeps where it would only pile up per step."""
+        if self.is_batch_mode:
+            return
+        self.text_results.appendPlainText(text)
+
+    def _calc_cache_key(self):
+        """Hashable snapshot of everything on_calculate reads."""
+        if self._input_getters is None:
+            # Form widgets only; dialogs parented to self are skipped.
+            top = self.window()
+            widgets = [w for cls in (QLineEdit, QCheckBox, QRadioButton, QComboBox)
+                       for w in self.findChildren(cls) if w.window() is top]
+            self._input_getters = tuple(
+                w.text if isinstance(w, QLineEdit)
+                else w.currentIndex if isinstance(w, QComboBox)
+                else w.isChecked
+                for w in widgets)
+        snapshot = self._ui_snapshot
+        return (tuple(sorted(snapshot.items())) if snapshot else None,
+                tuple(get() for get in self._input_getters),
+                tuple(getattr(self, name, None) for name in CALC_MEMBER_INPUTS))
+
+    def _calculate_cached(self):
+        """on_calculate for sweep steps, memoised on the full input state.
+
+        Sweeps that revisit a point (a re-plot of the same range, the
+        shared x values of the battle engines) restore the stored result
+        members instead of running the solver again.
+        """
+        key = self._calc_cache_key()
+        cache = self._calc_cache
+        results = cache.get(key)
+        if results is not None:
+            cache.move_to_end(key)
+            for name, value in results.items():
+                setattr(self, name, value)
+            return
+
+        self.on_calculate()
+        results = {}
+        for name in SWEEP_RESULT_ATTRS:
+            value = getattr(self, name, _MISSING)
+            if value is not _MISSING:
+                results[name] = value
+        cache[key] = results
+        if len(cache) > CALC_CACHE_SIZE:
+            cache.popitem(last=False)
 
     def _show_error(self, message, title="Input error"):
         """Helper for porting MessageBox"""
+        if self._deferred_errors is not None:
+            self._deferred_errors.append((message, title))
+            return
         if getattr(self, 'is_batch_mode', False):
             return 
             
@@ -2188,87 +2570,61 @@ class ShipDesViewWidget(QWidget):
                                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if ret == QMessageBox.StandardButton.No: 
             self.dbgmd = False
-            self.dlg_modify.data['dbgmd'] = False
+            if self.dlg_modify is not None:
+                self.dlg_modify.params.dbgmd = False
             return False
         return True
 
 
     def _check_data(self):
-        """Port of Sub_checkdata"""
+        """Port of Sub_checkdata.
+
+        Raises InputError for the first bad value instead of showing a
+        message box, so callers decide how to report it.
+        """
         num_types = len(ShipConfig.DATA)
         
         if self.Kstype < 1 or self.Kstype > num_types:
-            self._show_error(f"Fatal error: Ship type {self.Kstype} unknown!", "Input error")
-            return False
+            raise InputError(f"Fatal error: Ship type {self.Kstype} unknown!")
         num_engines = len(FuelConfig.DATA) 
         if self.Ketype < 1 or self.Ketype > num_engines:
-            self._show_error(f"Fatal error: Engine type {self.Ketype} unknown!", "Input error")
-            return False
+            raise InputError(f"Fatal error: Engine type {self.Ketype} unknown!")
 
         if self.m_Cargo == 0: # Cargo mode
             if self.W <= 0.0 or self.E <= 0.0:
-                self._show_error("Fatal error: Cargo Weight/Error must be positive!", "Input error")
-                self.edit_weight.setFocus()
-                return False
+                raise InputError("Fatal error: Cargo Weight/Error must be positive!", self.edit_weight)
         elif self.m_Cargo == 2: # TEU mode
              if self.m_TEU <= 0.0 or self.m_TEU_Avg_Weight <= 0.0:
-                self._show_error("Fatal error: TEU and Avg. Weight must be positive!", "Input error")
-                self.edit_teu.setFocus()
-                return False
+                raise InputError("Fatal error: TEU and Avg. Weight must be positive!", self.edit_teu)
         elif self.m_Cargo == 1: # Ship dimensions mode
             if self.L1 <= 0.0 or self.B <= 0.0 or self.D <= 0.0 or self.T <= 0.0 or self.C <= 0.0:
-                self._show_error("Fatal error: Ship dimensions must be positive!", "Input error")
-                self.edit_length.setFocus()
-                return False
+                raise InputError("Fatal error: Ship dimensions must be positive!", self.edit_length)
             if self.C > 1.0:
-                self._show_error("Fatal error: CB should be less than 1.0!", "Input error")
-                self.edit_block.setFocus()
-                return False
+                raise InputError("Fatal error: CB should be less than 1.0!", self.edit_block)
         
         if self.m_Cargo != 1: # Cargo or TEU mode
-            if self.m_Lbratio and self.m_LbratioV <= 0:
-                self._show_error("Fatal error: L/B ratio must be positive!", "Input error")
-                self.edit_lbratio.setFocus()
-                return False
-            if self.m_Bvalue and self.m_BvalueV <= 0:
-                self._show_error("Fatal error: B value must be positive!", "Input error")
-                self.edit_bvalue.setFocus()
-                return False
-            if self.m_Btratio and self.m_BtratioV <= 0:
-                self._show_error("Fatal error: B/T ratio must be positive!", "Input error")
-                self.edit_btratio.setFocus()
-                return False
-            if self.m_Cbvalue and (self.m_CbvalueV <= 0 or self.m_CbvalueV > 1.0):
-                self._show_error("Fatal error: CB must be positive and < 1.0!", "Input error")
-                self.edit_cbvalue.setFocus()
-                return False
-        
-        if self.m_Pdtratio and self.m_PdtratioV <= 0.0:
-            self._show_error("Fatal error: Prop.dia ratio must be positive!", "Input error")
-            self.edit_pdtratio.setFocus()
-            return False
+            checks = _CONSTRAINT_CHECKS
+        else:
+            checks = _CONSTRAINT_CHECKS[-1:] # Prop. dia. ratio only
+        for flag, value, upper, message, edit in checks:
+            if getattr(self, flag):
+                v = getattr(self, value)
+                if v <= 0.0 or v > upper:
+                    raise InputError(f"Fatal error: {message}", getattr(self, edit))
         
         if self.V <= 0.0 or self.R <= 0.0 or self.N1 <= 0.0 or self.N2 <= 0.0:
-            self._show_error("Fatal error: Speed, Range, and RPMs must be positive!", "Input error")
-            self.edit_speed.setFocus()
-            return False
+            raise InputError("Fatal error: Speed, Range, and RPMs must be positive!", self.edit_speed)
             
         if self.m_Econom:
             if self.V7 <= 0.0 or self.D1 <= 0.0 or self.I < 0.0 or self.N < 1:
-                self._show_error("Fatal error: Economic values must be positive (Interest >= 0)!", "Input error")
-                self.edit_voyages.setFocus()
-                return False
+                raise InputError("Fatal error: Economic values must be positive (Interest >= 0)!", self.edit_voyages)
             
             if self.Ketype == 4: # Nuclear
                 if self.m_Reactor_Cost_per_kW <= 0 or self.m_Core_Life <= 0 or self.m_Decom_Cost < 0:
-                    self._show_error("Fatal error: Nuclear costs must be positive!", "Input error")
-                    self.edit_reactor_cost.setFocus()
-                    return False
+                    raise InputError("Fatal error: Nuclear costs must be positive!", self.edit_reactor_cost)
             else: # Fossil
                 if self.F8 <= 0.0:
-                    self._show_error("Fatal error: Fuel cost must be positive!", "Input error")
-                    self.edit_fuel.setFocus()
-                    return False
+                    raise InputError("Fatal error: Fuel cost must be positive!", self.edit_fuel)
 
         # ----------------------------------------------------------------
         # Resistance method-specific validation
@@ -2281,64 +2637,50 @@ class ShipDesViewWidget(QWidget):
             # When Hollenbach or another method is added, give it its own
             # branch here keyed off its own config flag.
             if self.lcb_pct is not None and (self.lcb_pct < -5.0 or self.lcb_pct > 5.0):
-                self._show_error(
+                raise InputError(
                     "Holtrop validation: LCB outside regression range "
                     "(approximately -5% to +5% of L from midships).",
-                    "Input error",
+                    self.edit_lcb_pct,
                 )
-                self.edit_lcb_pct.setFocus()
-                return False
             for name, val in (
                 ("CM",  self.cm),
                 ("CWP", self.cwp),
             ):
                 if val is not None and (val <= 0.0 or val > 1.0):
-                    self._show_error(
+                    raise InputError(
                         f"Holtrop validation: {name} must be in (0, 1].",
-                        "Input error",
                     )
-                    return False
             # CP is derived from CB/CM inside _calc_pe_holtrop, but if CM is
             # set such that CP > 1 the regression breaks. Catch it here.
             if self.cm is not None and self.cm > 0:
                 cp_check = self.C / self.cm
                 if cp_check > 1.0:
-                    self._show_error(
+                    raise InputError(
                         f"Holtrop validation: CP = CB/CM = {cp_check:.3f} > 1.0. "
                         "Increase CM or reduce CB.",
-                        "Input error",
                     )
-                    return False
             if self.has_bulb:
                 if self.abt <= 0.0:
-                    self._show_error(
+                    raise InputError(
                         "Holtrop validation: bulb is enabled but ABT is not positive.",
-                        "Input error",
+                        self.edit_abt,
                     )
-                    self.edit_abt.setFocus()
-                    return False
                 if self.hb >= self.T:
-                    self._show_error(
+                    raise InputError(
                         f"Holtrop validation: bulb height hB ({self.hb}) must be "
                         f"less than draught T ({self.T}). The bulb must be submerged.",
-                        "Input error",
+                        self.edit_hb,
                     )
-                    self.edit_hb.setFocus()
-                    return False
             if self.has_transom and self.at <= 0.0:
-                self._show_error(
+                raise InputError(
                     "Holtrop validation: transom is enabled but AT is not positive.",
-                    "Input error",
+                    self.edit_at,
                 )
-                self.edit_at.setFocus()
-                return False
             if self.cstern not in (-25, 0, 10):
-                self._show_error(
+                raise InputError(
                     f"Holtrop validation: CSTERN must be one of -25, 0, +10 "
                     f"(got {self.cstern}).",
-                    "Input error",
                 )
-                return False
 
         return True
 
@@ -2349,26 +2691,14 @@ class ShipDesViewWidget(QWidget):
         MODIFIED: Using research paper (Abramowski, et al., 2018).
         Based on inverted formula (38): LBD = f(TEU).
         """
-        try:
-            LBD_product = L * B * D
-            
-            if LBD_product <= 0:
-                return 0
-                
-            
-            teu_est = ( (LBD_product + 20143.62) / 104.422 ) ** (1.0 / 0.9)
-            
-            return teu_est
-            
-        except (ValueError, OverflowError):
-            return 0
+        return teu_capacity(float(L), float(B), float(D))
 
     def _get_volume_status(self):
         """
         Calculates Required vs Available Volume.
         """
-        ship_data = ShipConfig.get(self.combo_ship.currentText())
-        fuel_data = FuelConfig.get(self.combo_engine.currentText())
+        ship_data = ShipConfig.get(self.ship_name)
+        fuel_data = FuelConfig.get(self.engine_name)
         
         vol_hull = self.L1 * self.B * self.D * self.C
         vol_avail = vol_hull * ship_data.get("Profile_Factor", 1.0)
@@ -2403,7 +2733,7 @@ class ShipDesViewWidget(QWidget):
         if raw_mass > 0 and fuel_data["Density"] > 0:
             vol_fuel = (raw_mass * 1000.0) / fuel_data["Density"] * fuel_data["VolFactor"]
         
-        vol_mach = (self.P2 * 0.7457) * 0.4 
+        vol_mach = (self.P2 * BHP_TO_KW) * 0.4 
         # Stores volume should scale with Lightship Mass (M1+M2+M3), not Cargo DWT (W1)
         lightship = getattr(self, 'M1', 0) + getattr(self, 'M2', 0) + getattr(self, 'M3', 0)
         vol_stores = lightship * 0.05
@@ -2431,9 +2761,9 @@ class ShipDesViewWidget(QWidget):
         if ratio <= 1.0:
             return True 
 
-        self.text_results.append(f"\n--- VOLUME LIMIT DETECTED ---")
-        self.text_results.append(f"Required: {int(req)} m3 | Available: {int(avail)} m3")
-        self.text_results.append(f"Expanding ship dimensions...")
+        self._log(f"\n--- VOLUME LIMIT DETECTED ---")
+        self._log(f"Required: {int(req)} m3 | Available: {int(avail)} m3")
+        self._log(f"Expanding ship dimensions...")
 
         target_payload = self.W 
         L_orig, B_orig, D_orig = self.L1, self.B, self.D
@@ -2447,7 +2777,7 @@ class ShipDesViewWidget(QWidget):
             for i in range(50):
                 self.vol_expansion_iters = i + 1  # 1-indexed for human reading
                 # Use a slightly more aggressive expansion for volume-heavy fuels (H2, NH3)
-                fuel_data_local = FuelConfig.get(self.combo_engine.currentText())
+                fuel_data_local = FuelConfig.get(self.engine_name)
                 expansion_factor = 1.03 if fuel_data_local.get("VolFactor", 1.0) >= 1.5 else 1.02
                 
                 self.L1 *= expansion_factor
@@ -2493,12 +2823,12 @@ class ShipDesViewWidget(QWidget):
                 req, avail, ratio = self._get_volume_status()
                 
                 if ratio <= 1.0:
-                    self.text_results.append(f"-> Converged at L={self.L1:.1f}m after {self.vol_expansion_iters} iter(s)")
-                    self.text_results.append(f"-> Draft adjusted to {self.T:.1f}m (New Disp: {int(self.M)}t)")
+                    self._log(f"-> Converged at L={self.L1:.1f}m after {self.vol_expansion_iters} iter(s)")
+                    self._log(f"-> Draft adjusted to {self.T:.1f}m (New Disp: {int(self.M)}t)")
                     self.W1 = self.M - new_lightship - fuel_mass - misc_mass
                     return True 
 
-            self.text_results.append(f"-> WARNING: Volume expansion limit reached after {self.vol_expansion_iters} iter(s).")
+            self._log(f"-> WARNING: Volume expansion limit reached after {self.vol_expansion_iters} iter(s).")
             return False
         finally:
             self.ignspd = prev_ignspd
@@ -2537,8 +2867,9 @@ class ShipDesViewWidget(QWidget):
             
             self.m_Cargo = 0
             
-            self.edit_weight.setText(str(self.W))
-            self.edit_error.setText(str(self.m_Error))
+            if not self.is_batch_mode:
+                self.edit_weight.setText(str(self.W))
+                self.edit_error.setText(str(self.m_Error))
         
         elif self.design_mode == 0:
             self.W = self.m_Weight
@@ -2546,19 +2877,25 @@ class ShipDesViewWidget(QWidget):
             
         if self.Ketype == 1: 
             self.m_Prpm = self.m_Erpm
-            self.edit_prpm.setText(str(self.m_Prpm))
+            if not self.is_batch_mode: self.edit_prpm.setText(str(self.m_Prpm))
             
         self._initdata(0) 
+        self._set_mass_constants()
         self.CalculatedOk = False 
         self.btn_save.setEnabled(False) 
         
-        if not self._check_data(): 
+        try:
+            self._check_data()
+        except InputError as e:
+            self._show_error(str(e), "Input error")
+            if e.widget is not None and not self.is_batch_mode:
+                e.widget.setFocus()
             self.m_Cargo = self.design_mode
             return
             
         if self.m_Cargo == 0:
             W1 = self.W + 2.0 * self.E + 10.0 
-            Z = 0; Y = 1; J = 10.0; L3 = 0.0; W2 = 0.0 
+            J = 10.0 # First step in L1 before a secant slope exists
             self.Kcount = 0 
 
             # ---- Active empirical basis dispatch -----------------------
@@ -2603,171 +2940,203 @@ class ShipDesViewWidget(QWidget):
                     return _coefs["DT_m"] * D_val + _coefs["DT_c"]
                 return None
 
+            # Legacy L1 and CB fit coefficients of this ship type; types
+            # past 2 share the third set.
+            k = self.Kstype if self.Kstype in (1, 2) else 3
+            fit_L = tuple(getattr(self, f"L1{k}{i}") for i in range(1, 4))
+            cb = tuple(getattr(self, f"Cb{k}{i}") for i in range(1, 6))
+
             # ---- Initial L1 guess --------------------------------------
             # Use basis when active+available, else fall back to the
             # user-tweakable legacy self.L1xx parameters (Watson/Gilfillan).
             _L_basis = _basis_L_initial(self.W)
             if _L_basis is not None:
                 self.L1 = _L_basis
-            elif self.Kstype == 1:
-                self.L1 = self.L111 + self.L112 * ((self.W / self.L113) ** (1/3))
-            elif self.Kstype == 2:
-                self.L1 = self.L121 + self.L122 * ((self.W / self.L123) ** (1/3))
             else:
-                self.L1 = self.L131 + self.L132 * ((self.W / self.L133) ** (1/3))
-                
-            if self.dbgmd:
-                msg = f"Initial ship length: L1={self.L1:7.2f}\r\n"
-                msg += f"and the target DW = {self.W:8.2f}\r\n"
-                QMessageBox.information(self, "Info. from OnButtonCal in debug mode", msg)
-
-            while self.Kcount < 500 and abs(self.W - W1) > self.E: 
-                self.Kcount += 1
-                
-                if self.Kcount > 1:
-                    if Y != Z + 1: 
-                        self.L1 -= 0.5 * J; Y += 1
-                    elif self.W >= W1: 
-                        L3 = self.L1; W2 = W1; self.L1 += J
-                    else: 
-                        if (W1 - W2) == 0: W1 = W2 + 1e-9 # Avoid division by zero
-                        L = L3 + (self.W - W2) * (self.L1 - L3) / (W1 - W2)
-                        self.L1 = L; J = 0.25 * J; Y += 1; Z += 2
-                
-                if self.L1 <= 0: self.L1 = 1e-9 # Prevent negative length leading to complex numbers
-                vosl = self.V / (math.sqrt(self.L1) if self.L1 > 0 else 1e-9)
+                L11, L12, L13 = fit_L
+                self.L1 = L11 + L12 * ((self.W / L13) ** (1/3))
                 
-                if self.Kstype == 1: # Tanker
-                    if self.m_Lbratio: self.B = self.L1 / self.m_LbratioV 
-                    elif self.m_Bvalue: self.B = self.m_BvalueV 
-                    else:
-                        _B = _basis_B(self.L1)
-                        if _B is not None:
-                            self.B = _B
-                        elif self.L1 <= self.Lb05: self.B = self.L1 / (self.Lb01 + self.Lb02 * (self.L1 - self.Lb03)) 
-                        else: self.B = self.L1 / self.Lb04 
-                    if self.m_Cbvalue: self.C = self.m_CbvalueV 
-                    else: 
-                        if vosl < self.Cb15: self.C = self.Cb11 - self.Cb12 * vosl 
-                        else: self.C = self.Cb13 - self.Cb14 * vosl 
-                    if self.m_Btratio: 
-                        self.T = self.B / self.m_BtratioV
-                        self.D = self.T / 0.78
-                        if not self._freeboard(): return
-                    else:
-                        _D = _basis_D(self.L1)
-                        self.D = _D if _D is not None else self.L1 / 13.5
-                        _T = _basis_T(self.D)
-                        self.T = _T if _T is not None else 0.78 * self.D
-                        if not self._freeboard(): return
-                        self.T = self.D - self.F5 
-                elif self.Kstype == 2: # Bulk carrier
-                    if self.m_Lbratio: self.B = self.L1 / self.m_LbratioV
-                    elif self.m_Bvalue: self.B = self.m_BvalueV
-                    else:
-                        _B = _basis_B(self.L1)
-                        if _B is not None:
-                            self.B = _B
-                        elif self.L1 <= self.Lb05: self.B = self.L1 / (self.Lb01 + self.Lb02 * (self.L1 - self.Lb03))
-                        else: self.B = self.L1 / self.Lb04
-                    if self.m_Cbvalue: self.C = self.m_CbvalueV
-                    else:
-                        if vosl < self.Cb25: self.C = self.Cb21 - self.Cb22 * vosl
-                        else: self.C = self.Cb23 - self.Cb24 * vosl
-                    if self.m_Btratio:
-                        self.T = self.B / self.m_BtratioV
-                        self.D = self.T / 0.70
-                        if not self._freeboard(): return
-                    else:
-                        _D = _basis_D(self.L1)
-                        self.D = _D if _D is not None else self.L1 / 11.75
-                        _T = _basis_T(self.D)
-                        self.T = _T if _T is not None else 0.7 * self.D
-                        if not self._freeboard(): return
-                        self.T = self.D - self.F5
-                elif self.Kstype == 4:  # Container Ship
-                    if self.m_Lbratio: self.B = self.L1 / self.m_LbratioV
-                    elif self.m_Bvalue: self.B = self.m_BvalueV
-                    else:
-                        _B = _basis_B(self.L1)
-                        if _B is not None:
-                            self.B = _B
-                        elif self.L1 <= self.Lb05: self.B = self.L1 / (self.Lb01 + self.Lb02 * (self.L1 - self.Lb03))
-                        else: self.B = self.L1 / self.Lb04
-                    
-                    # --- ADDED: Container ships need a block coefficient ---
-                    if self.m_Cbvalue: self.C = self.m_CbvalueV
-                    else:
-                        if vosl < self.Cb35: self.C = self.Cb31 - self.Cb32 * vosl
-                        else: self.C = self.Cb33 - self.Cb34 * vosl
-
-                    # Container ships: D/L ~ 1/13.5, T/D ~ 0.72 (legacy
-                    # fallbacks; the Japan-basis T(D) regression failed
-                    # the R^2 reliability gate so DT is always None for
-                    # container ships and the legacy 0.72 ratio applies).
-                    _D = _basis_D(self.L1)
-                    self.D = _D if _D is not None else self.L1 / 13.5
-                    _T = _basis_T(self.D)
-                    self.T = _T if _T is not None else 0.72 * self.D
-                    if not self._freeboard(): return
-                    self.T = self.D - self.F5
-                else: # Cargo vessel
-                    if self.m_Lbratio: self.B = self.L1 / self.m_LbratioV
-                    elif self.m_Bvalue: self.B = self.m_BvalueV
-                    else:
-                        if self.L1 <= self.Lb05: self.B = self.L1 / (self.Lb01 + self.Lb02 * (self.L1 - self.Lb03))
-                        else: self.B = self.L1 / self.Lb04
-                    if self.m_Cbvalue: self.C = self.m_CbvalueV
-                    else:
-                        if vosl < self.Cb35: self.C = self.Cb31 - self.Cb32 * vosl
-                        else: self.C = self.Cb33 - self.Cb34 * vosl
-                    if self.m_Btratio:
-                        self.T = self.B / self.m_BtratioV; self.D = self.T / 0.7
-                        if not self._freeboard(): return
-                    else:
-                        self.D = (self.B - 2.74) / 1.4; self.T = 0.7 * self.D
-                        if not self._freeboard(): return
+            # Debug mode collects one line per iteration and shows them
+            # together once the search ends (never during a sweep).
+            dbgmd = self.dbgmd and not self.is_batch_mode
+            debug_log = []
+            if dbgmd:
+                debug_log.append(f"Initial ship length: L1={self.L1:7.2f}, target DW={self.W:8.2f}")
+
+            # Legacy L/B fit coefficients
+            lb = (self.Lb01, self.Lb02, self.Lb03, self.Lb04, self.Lb05)
+
+            # Inputs that stay fixed for the whole search, bound once
+            V = self.V; Kstype = self.Kstype
+            m_Lbratio = self.m_Lbratio; m_LbratioV = self.m_LbratioV
+            m_Bvalue = self.m_Bvalue; m_BvalueV = self.m_BvalueV
+            m_Cbvalue = self.m_Cbvalue; m_CbvalueV = self.m_CbvalueV
+            m_Btratio = self.m_Btratio; m_BtratioV = self.m_BtratioV
+
+            # Kstype is fixed for the whole search, so pick the sizing rule
+            # once. Tanker, bulk carrier and container ship share one rule
+            # with per-type depth/draught ratios: (T/D when B/T is given,
+            # or None if B/T is not honoured; L/D; T/D).
+            hull_ratios = {1: (0.78, 13.5, 0.78),  # Tanker
+                           2: (0.70, 11.75, 0.7),  # Bulk carrier
+                           4: (None, 13.5, 0.72),  # Container ship
+                           }.get(Kstype)
+
+            def _beam_and_block(L1, vosl, use_basis):
+                if m_Lbratio: self.B = L1 / m_LbratioV
+                elif m_Bvalue: self.B = m_BvalueV
+                else:
+                    _B = _basis_B(L1) if use_basis else None
+                    self.B = _B if _B is not None else legacy_beam(L1, *lb)
+                if m_Cbvalue: self.C = m_CbvalueV
+                else: self.C = legacy_block(vosl, *cb)
+
+            def _size_ratio_hull(L1, vosl):
+                _beam_and_block(L1, vosl, True)
+                td_given_bt, dl, td = hull_ratios
+                if td_given_bt is not None and m_Btratio:
+                    self.T = self.B / m_BtratioV
+                    self.D = self.T / td_given_bt
+                    return self._freeboard()
+                # Container ships: the Japan-basis T(D) regression failed
+                # the R^2 reliability gate, so DT is always None for them
+                # and the legacy 0.72 ratio applies.
+                _D = _basis_D(L1)
+                self.D = _D if _D is not None else L1 / dl
+                _T = _basis_T(self.D)
+                self.T = _T if _T is not None else td * self.D
+                if not self._freeboard(): return False
+                self.T = self.D - self.F5
+                return True
+
+            def _size_cargo_vessel(L1, vosl):
+                _beam_and_block(L1, vosl, False)
+                if m_Btratio:
+                    self.T = self.B / m_BtratioV; self.D = self.T / 0.7
+                else:
+                    self.D = (self.B - 2.74) / 1.4; self.T = 0.7 * self.D
+                return self._freeboard()
+
+            size_hull = _size_ratio_hull if hull_ratios is not None else _size_cargo_vessel
+
+            def _eval_L1():
+                """Sizes the hull for the current L1 and runs
+                stability/power/mass. Returns the resulting cargo DW,
+                or None when a sub-calculation failed."""
+                L1 = self.L1
+                if L1 <= 0: L1 = self.L1 = 1e-9 # Prevent negative length leading to complex numbers
+                vosl = V / math.sqrt(L1)
+                if not size_hull(L1, vosl): return
+                if min(self.B, self.T, self.C) <= 0:
+                    # e.g. the CB fit goes negative at a very low V/sqrt(L)
+                    self._show_error(f"No valid hull at L1 = {L1:7.2f} m "
+                                     f"(B = {self.B:.2f}, T = {self.T:.2f}, CB = {self.C:.3f})",
+                                     "Fatal error")
+                    return
 
-                self.M = 1.025 * self.L1 * self.B * self.T * self.C 
+                self.M = 1.025 * L1 * self.B * self.T * self.C 
                 if not self._stability(): return 
                 
                 if not self._power():
                      return
                 
                 if not self._mass(): return 
+                return self.W1
+
+            # Secant search on L1 for W1(L1) = W, stepping up to inverse
+            # quadratic interpolation once three points are known.
+            # Lengths either side of the target are kept as a bracket; a
+            # step that leaves it falls back to bisection, and before a
+            # bracket exists a step that made the residual worse is cut back
+            # by `shrink`, which tightens on repeated worsening and relaxes
+            # back towards a halving as the residual improves.
+            # A probe whose sub-calculation fails (e.g. propeller pitch out
+            # of range at that length) is not fatal: it is moved halfway back
+            # to the last good length and retried, and later steps stay
+            # short of the nearest failed length on either side. Errors the
+            # probes raise are held back, and only the last one is reported
+            # if the search has to give up.
+            L_prev = W_prev = None
+            L_pp = r_pp = None
+            L_lo = L_hi = None
+            L_bad_lo = 0.0; L_bad_hi = math.inf # Nearest failed probes either side
+            shrink = 0.5
+            self._deferred_errors = []
+            try:
+                while self.Kcount < 500 and abs(self.W - W1) > self.E: 
+                    self.Kcount += 1
                 
-                W1 = self.W1 
+                    if self.Kcount > 1:
+                        resid = W1 - self.W
+                        if resid < 0: L_lo = self.L1
+                        else: L_hi = self.L1
+                        worse = W_prev is not None and abs(resid) > abs(W_prev - self.W)
+                        if W_prev is None or W1 == W_prev:
+                            L_next = self.L1 + (J if resid < 0 else -J)
+                        elif (L_lo is None or L_hi is None) and worse:
+                            L_next = L_prev + shrink * (self.L1 - L_prev)
+                            shrink = max(0.1, 0.4 * shrink)
+                        else:
+                            if not worse: shrink = min(0.5, 1.5 * shrink)
+                            L_next = None
+                            if L_pp is not None:
+                                L_next = _inverse_quadratic(L_pp, r_pp, L_prev, W_prev - self.W,
+                                                            self.L1, resid)
+                            if L_next is None:
+                                L_next = self.L1 - resid * (self.L1 - L_prev) / (W1 - W_prev)
+                        if L_lo is not None and L_hi is not None:
+                            if not min(L_lo, L_hi) < L_next < max(L_lo, L_hi):
+                                L_next = 0.5 * (L_lo + L_hi)
+                        elif L_next <= 0.5 * self.L1:
+                            L_next = 0.5 * self.L1
+                        if not L_bad_lo < L_next < L_bad_hi:
+                            L_next = 0.5 * (self.L1 + (L_bad_lo if L_next <= L_bad_lo else L_bad_hi))
+                        if W_prev is not None:
+                            L_pp, r_pp = L_prev, W_prev - self.W
+                        L_prev, W_prev = self.L1, W1
+                        self.L1 = L_next
+
+                    W1 = _eval_L1()
+                    while W1 is None:
+                        if L_prev is None or self.Kcount >= 500 or abs(self.L1 - L_prev) < 1e-3:
+                            break
+                        if self.L1 > L_prev: L_bad_hi = self.L1
+                        else: L_bad_lo = self.L1
+                        self.Kcount += 1
+                        self.L1 = 0.5 * (self.L1 + L_prev)
+                        W1 = _eval_L1()
+                    if W1 is None: break
                 
-                if self.dbgmd: 
-                    msg = f"This is at the end of iteration {self.Kcount:3d}\r\n"
-                    msg += f" The current L1={self.L1:7.2f}, B={self.B:6.2f}\r\n"
-                    msg += f" T={self.T:6.2f}, CB={self.C:6.3f} and D={self.D:6.2f}.\r\n"
-                    msg += f" Error code: Kpwrerr={self.Kpwrerr:3d}\r\n"
-                    msg += f" The present value: DW={W1:8.2f}.\r\n"
-                    msg += f" (The target DW={self.W:8.2f}).\r\n\r\n"
-                    if self.Kpwrerr == 1: msg += " This iteration is all right.\r\n"
-                    else: msg += " An error was detected in this iteration.\r\n"
-                    if W1 <= 0.0: msg += "\r\n (This is hopeless now, please\r\n   get out of the debug mode!)\r\n"
-                    if self.Kcount < 5: msg += "\r\n Continue in the debug mode?\r\n"
-                    elif self.Kcount < 10: msg += "\r\n Still stay in the debug mode?\r\n"
-                    else:
-                        if W1 <= 0.0: msg += "\r\n  ***** Stop debugging now! *****\r\n"
-                        else: msg += "\r\n Keep running in the debug mode?\r\n"
-                    if W1 <= 0.0 and self.Kcount >= 10:
-                        QMessageBox.critical(self, "Info. from OnButtonCal in debug mode", msg)
-                        self.dbgmd = False; self.dlg_modify.data['dbgmd'] = False
-                    else:
-                        if not self._show_debug_msg(msg): break
+                    if dbgmd: 
+                        debug_log.append(
+                            f"{self.Kcount:3d}: L1={self.L1:7.2f} B={self.B:6.2f} "
+                            f"T={self.T:6.2f} CB={self.C:6.3f} D={self.D:6.2f} "
+                            f"DW={W1:8.2f} Kpwrerr={self.Kpwrerr:3d}"
+                            + ("" if not self.Kpwrerr else " (error)"))
+            finally:
+                errors, self._deferred_errors = self._deferred_errors, None
+            if W1 is None:
+                if errors:
+                    self._show_error(*errors[-1])
+                self.m_Cargo = self.design_mode
+                return
+
+            if debug_log:
+                msg = "\r\n".join(debug_log)
+                msg += f"\r\n\r\nTarget DW={self.W:8.2f} after {self.Kcount} iterations.\r\n"
+                if W1 <= 0.0: msg += "\r\n (This is hopeless now, please\r\n   get out of the debug mode!)\r\n"
+                msg += "\r\n Stay in the debug mode?\r\n"
+                self._show_debug_msg(msg)
             
 
-            if self.Kpwrerr != 1: 
+            if self.Kpwrerr: 
                 msg = "The program tried its best but\r\n"
                 msg += "calculation has failed because\r\n"
-                if self.Kpwrerr % self.SPEED_LOW == 0: msg += " -- ship speed is too low!\r\n"
-                if self.Kpwrerr % self.SPEED_HIGH == 0: msg += " -- ship speed is too high!\r\n"
-                if self.Kpwrerr % self.PITCH_LOW == 0: msg += " -- prop. pitch out of range (|->)!\r\n"
-                if self.Kpwrerr % self.PITCH_HIGH == 0: msg += " -- prop. pitch out of range (<-|)!\r\n"
-                if self.Kpwrerr % self.RESISTANCE_OUT_OF_RANGE == 0:
+                if self.Kpwrerr & self.SPEED_LOW: msg += " -- ship speed is too low!\r\n"
+                if self.Kpwrerr & self.SPEED_HIGH: msg += " -- ship speed is too high!\r\n"
+                if self.Kpwrerr & self.PITCH_LOW: msg += " -- prop. pitch out of range (|->)!\r\n"
+                if self.Kpwrerr & self.PITCH_HIGH: msg += " -- prop. pitch out of range (<-|)!\r\n"
+                if self.Kpwrerr & self.RESISTANCE_OUT_OF_RANGE:
                     msg += " -- Fn/CB outside valid range for selected resistance method!\r\n"
                 self._show_error(msg, "Fatal error (Input data wrong?)")
                 # Restore original mode
@@ -2797,13 +3166,13 @@ class ShipDesViewWidget(QWidget):
         retries = 0
         while not self._power() and retries < 15:
             
-            if self.Kpwrerr % self.PITCH_LOW == 0:
-                self.text_results.append(f"[Auto-Correcting: Pitch > 1.4. Increasing RPM from {self.N2:.1f} to {self.N2*1.05:.1f}]")
+            if self.Kpwrerr & self.PITCH_LOW:
+                self._log(f"[Auto-Correcting: Pitch > 1.4. Increasing RPM from {self.N2:.1f} to {self.N2*1.05:.1f}]")
                 self.N2 *= 1.05
                 self.N1 *= 1.05
                 
-            elif self.Kpwrerr % self.PITCH_HIGH == 0:
-                self.text_results.append(f"[Auto-Correcting: Pitch < 0.5. Decreasing RPM from {self.N2:.1f} to {self.N2*0.95:.1f}]")
+            elif self.Kpwrerr & self.PITCH_HIGH:
+                self._log(f"[Auto-Correcting: Pitch < 0.5. Decreasing RPM from {self.N2:.1f} to {self.N2*0.95:.1f}]")
                 self.N2 *= 0.95
                 self.N1 *= 0.95
                 
@@ -2812,10 +3181,10 @@ class ShipDesViewWidget(QWidget):
                 
             retries += 1
             
-        if self.Kpwrerr != 1:
-            self.text_results.append("\nERROR: Propeller design fundamentally failed!")
-            self.text_results.append("The physics engine cannot balance the thrust required for this weight/speed.")
-            self.text_results.append("Try: 1) Reducing Speed, 2) Reducing Range, or 3) Unchecking 'Prop.dia. to T ratio'.")
+        if self.Kpwrerr:
+            self._log("\nERROR: Propeller design fundamentally failed!")
+            self._log("The physics engine cannot balance the thrust required for this weight/speed.")
+            self._log("Try: 1) Reducing Speed, 2) Reducing Range, or 3) Unchecking 'Prop.dia. to T ratio'.")
             return
         self._apply_resistance_breakdown()
 
@@ -2832,9 +3201,9 @@ class ShipDesViewWidget(QWidget):
         if not self._mass(): return
 
         if self.W1 <= 0:
-             self.m_Results += "\n!!! CRITICAL WARNING !!!\n"
-             self.m_Results += "Auxiliary weight > Cargo Capacity.\n"
-             self.m_Results += "Increase Ship Dimensions or decrease Aux Load.\n"
+             self._result_lines.append("\n!!! CRITICAL WARNING !!!\n"
+                                       "Auxiliary weight > Cargo Capacity.\n"
+                                       "Increase Ship Dimensions or decrease Aux Load.\n")
 
         if self.m_Econom: 
             if not self._cost(): return
@@ -2856,10 +3225,11 @@ class ShipDesViewWidget(QWidget):
                 "on long ranges. Reduce Range or Speed.\r\n"
                 "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!\r\n"
             )
-            self.m_Results = warning + self.m_Results
+            self._result_lines.insert(0, warning)
 
         if self.design_mode == 2:
-            estimated_capacity = self._estimate_teu_capacity(self.L1, self.B, self.D)
+            # Kept for the report, which prints the same estimate
+            self.est_teu = estimated_capacity = self._estimate_teu_capacity(self.L1, self.B, self.D)
             if estimated_capacity < self.target_teu:
                 warning = (
                     "\r\n\r\n"
@@ -2880,9 +3250,9 @@ class ShipDesViewWidget(QWidget):
                     "!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!!\r\n"
                 )
                 if self.m_Append and self.Kcases > 0:
-                    self.m_Results += warning
+                    self._result_lines.append(warning)
                 else:
-                    self.m_Results = warning + self.m_Results
+                    self._result_lines.insert(0, warning)
 
         
         self.text_results.setEnabled(True) 
@@ -2891,13 +3261,86 @@ class ShipDesViewWidget(QWidget):
         # or on output checkboxes being ticked.
         self._compute_cii()
         self._capture_volume_budget()
-        self._outvdu() 
+        # Sweeps only read the numbers back, so the report and the form
+        # write-back are left to the sweep's own end-of-run handling.
+        if not self.is_batch_mode:
+            self._outvdu() 
         self.btn_save.setEnabled(True) 
         
         self._initdata(1) 
-        self._update_data_to_ui() 
+        if not self.is_batch_mode:
+            self._update_data_to_ui() 
         self._reset_dlg() 
         
+    def _solve_batch(self, set_value, values, on_step=None):
+        """Runs one sweep step per entry of values and collects the results.
+
+        set_value(v) applies a step's input (a _ui_snapshot write or a form
+        edit); on_step(k, v), if given, is called before each step. Each
+        step is solved exactly as Calculate would solve it on its own.
+        Returns {member: ndarray} for SWEEP_RESULT_ATTRS, NaN where a step
+        never set the member; 'CalculatedOk' is a bool array and 'cii_rating'
+        an object array.
+        """
+        n = len(values)
+        res = {name: np.full(n, np.nan) for name in SWEEP_RESULT_ATTRS}
+        res['CalculatedOk'] = np.zeros(n, dtype=bool)
+        res['cii_rating'] = np.full(n, 'N/A', dtype=object)
+        pump_every = max(5, n // 50) # Keep the UI alive, ~50 pumps at most
+        for k, v in enumerate(values):
+            if on_step is not None: on_step(k, v)
+            set_value(v)
+            self._calculate_cached()
+            for name, col in res.items():
+                value = getattr(self, name, None)
+                if value is not None:
+                    col[k] = value
+            if k % pump_every == pump_every - 1: QApplication.processEvents()
+        return res
+
+    def _sweep_result(self, res, name):
+        """One plot output (combo_param_y entry) over a _solve_batch result.
+
+        Failed steps, and economic outputs with the economics box off, are NaN.
+        """
+        column = SWEEP_OUTPUT_COLUMNS.get(name)
+        if column is not None:
+            member, scale = column
+            y = res[member] if scale == 1.0 else scale * res[member]
+            return np.where(res['CalculatedOk'], y, np.nan)
+
+        is_econom = self.check_econom.isChecked()
+        econ = (lambda a: a) if is_econom else (lambda a: np.full_like(a, np.nan))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if name == "RFR($/tonne or $/TEU)":
+                rf = res['Rf'] * res['m_TEU_Avg_Weight'] if self.radio_teu.isChecked() else res['Rf']
+                y = econ(rf)
+            elif name == "BuildCost(M$)": y = econ(res['S'])
+            # ----- New chapter-5 result options -----
+            elif name == "AnnualFuelCost(M$)": y = econ(res['H7'] / 1e6)
+            elif name == "AnnualCarbonTax(M$)":
+                y = econ(np.nan_to_num(res['annual_carbon_tax']) / 1e6)
+            elif name == "AnnualisedCAPEX(M$)":
+                y = econ(np.nan_to_num(res['H1']) / 1e6)
+            elif name == "AnnualOPEX(M$)":
+                y = econ(np.nan_to_num(res['annual_opex']) / 1e6)
+            elif name == "EEDI(gCO2/t.nm)":
+                engine = self.combo_engine.currentText()
+                fd = FuelConfig.get(engine)
+                lhv = np.where(res['m_LHV'] > 0, res['m_LHV'], 42.7)
+                sfc_g_kwh = 3600.0 / (lhv * fd["Efficiency"])
+                cap = np.maximum(res['W1'], 1.0)
+                p_me = 0.75 * (res['P2'] * BHP_TO_KW)
+                cf = np.full(len(cap), float(self._effective_carbon_factor(fd)))
+                if engine == "LNG (Dual Fuel)":
+                    slip = res['m_MethaneSlip']
+                    cf += np.where(slip > 0, (slip / 100.0) * res['m_GWP_methane'], 0.0)
+                V = res['V']
+                y = np.where(V > 0, (p_me * cf * sfc_g_kwh) / (cap * V), np.nan)
+            else:
+                y = np.zeros(len(res['CalculatedOk']))
+        return np.where(res['CalculatedOk'], y, np.nan)
+
     def on_run_range(self):
         """
         Runs a calculation over a range of values
@@ -2922,6 +3365,14 @@ class ShipDesViewWidget(QWidget):
             self._show_error(f"Invalid number in range inputs: {e}")
             return
 
+        # Check the whole form up front: errors are suppressed once the
+        # sweep is in batch mode.
+        try:
+            self._read_ui_once()
+        except ValueError as e:
+            self._show_error(f"Invalid input format.\n\nPlease check that all visible fields contain valid numbers.\n(Error: {e})")
+            return
+
         fileName, _ = QFileDialog.getSaveFileName(self, "Save Range Analysis CSV",
             "ship_range_analysis.csv", "CSV Files (*.csv);;All Files (*)")
         
@@ -2957,7 +3408,7 @@ class ShipDesViewWidget(QWidget):
                 header.append("RFR($/tonne)")
 
         self.m_Results = f"Running range analysis for '{param_name}'...\r\nSaving to {fileName}\r\n"
-        self.text_results.setText(self.m_Results)
+        self.text_results.setPlainText(self.m_Results)
         self.Kcases = 0 
 
         original_ui_state = {
@@ -2987,155 +3438,154 @@ class ShipDesViewWidget(QWidget):
 
         try:
             with open(fileName, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(header)
-                
                 is_teu_mode = original_ui_state['teu_r']
+                member = SWEEP_MEMBERS[param_name]
+                value = value_range[0]
+
+                # Step one sets up the form (checkboxes, radios, edit) and
+                # parses it into _ui_snapshot; every step then only
+                # overwrites the swept member.
+                if param_name == "Speed(knts)":
+                    self.edit_speed.setText(str(value))
+                elif param_name == "Cargo deadweight(t)":
+                    self.radio_cargo.setChecked(True)
+                    self.edit_weight.setText(str(value))
+                elif param_name == "TEU Capacity":
+                    self.radio_teu.setChecked(True)
+                    self.edit_teu.setText(str(value))
+                elif param_name == "L/B Ratio":
+                    if not (is_teu_mode or original_ui_state['cargo_r']): self.radio_cargo.setChecked(True)
+                    self.check_lbratio.setChecked(True)
+                    self.edit_lbratio.setText(str(value))
+                elif param_name == "B(m)":
+                    if not (is_teu_mode or original_ui_state['cargo_r']): self.radio_cargo.setChecked(True)
+                    self.check_bvalue.setChecked(True)
+                    self.edit_bvalue.setText(str(value))
+                elif param_name == "B/T Ratio":
+                    if not (is_teu_mode or original_ui_state['cargo_r']): self.radio_cargo.setChecked(True)
+                    self.check_btratio.setChecked(True)
+                    self.edit_btratio.setText(str(value))
+                elif param_name == "Block Co.":
+                    if not (is_teu_mode or original_ui_state['cargo_r']): self.radio_cargo.setChecked(True)
+                    self.check_cbvalue.setChecked(True)
+                    self.edit_cbvalue.setText(str(value))
                 
-                for i, value in enumerate(value_range):
-                    self.text_results.append(f"Running step {i+1}/{steps} ({param_name} = {value:.4f})...")
-                    QApplication.processEvents()
-
-                    if param_name == "Speed(knts)":
-                        self.edit_speed.setText(str(value))
-                    elif param_name == "Cargo deadweight(t)":
-                        self.radio_cargo.setChecked(True)
-                        self.edit_weight.setText(str(value))
-                    elif param_name == "TEU Capacity":
-                        self.radio_teu.setChecked(True)
-                        self.edit_teu.setText(str(value))
-                    elif param_name == "L/B Ratio":
-                        if not (is_teu_mode or original_ui_state['cargo_r']): self.radio_cargo.setChecked(True)
-                        self.check_lbratio.setChecked(True)
-                        self.edit_lbratio.setText(str(value))
-                    elif param_name == "B(m)":
-                        if not (is_teu_mode or original_ui_state['cargo_r']): self.radio_cargo.setChecked(True)
-                        self.check_bvalue.setChecked(True)
-                        self.edit_bvalue.setText(str(value))
-                    elif param_name == "B/T Ratio":
-                        if not (is_teu_mode or original_ui_state['cargo_r']): self.radio_cargo.setChecked(True)
-                        self.check_btratio.setChecked(True)
-                        self.edit_btratio.setText(str(value))
-                    elif param_name == "Block Co.":
-                        if not (is_teu_mode or original_ui_state['cargo_r']): self.radio_cargo.setChecked(True)
-                        self.check_cbvalue.setChecked(True)
-                        self.edit_cbvalue.setText(str(value))
-                    
-                    elif param_name == "Reactor Cost ($/kW)":
-                        self.edit_reactor_cost.setText(str(value))
-                    elif param_name == "Range (nm)":
-                        self.edit_range.setText(str(value))
-                    elif param_name == "Fuel Cost ($/t)":
-                        self.edit_fuel.setText(str(value))
-                    elif param_name == "Interest Rate (%)":
-                        self.edit_interest.setText(str(value))
-                    elif param_name == "Carbon Tax ($/t)":
-                        self.edit_ctax_rate.setText(str(value))
-                        self.check_carbon_tax.setChecked(True)
-                    # ----- New chapter-5 sweep parameters -----
-                    elif param_name == "Sea days/year":
-                        self.edit_seadays.setText(str(value))
-                    elif param_name == "Air Lub Eff. (%)":
-                        # Auto-tick the checkbox so the ESD physics actually engages.
-                        # Sweeping the percentage with the checkbox unticked would
-                        # silently produce flat curves and confuse the user.
-                        self.check_als.setChecked(True)
-                        self.edit_als_eff.setText(str(value))
-                    elif param_name == "Wind Power Sav. (%)":
-                        self.check_wind.setChecked(True)
-                        self.edit_wind_sav.setText(str(value))
-                    elif param_name == "Methane Slip (%)":
-                        self.edit_methane_slip.setText(str(value))
-                        # Methane slip only matters if the carbon tax is on,
-                        # since it's applied through the effective carbon factor.
-                        # Tick it automatically so the user sees the effect.
-                        self.check_carbon_tax.setChecked(True)
-                    
-                    self.on_calculate() 
-                    
-                    row = [f"{value:.6g}"]
-                    if not self.CalculatedOk:
-                        total_skipped += 1
-                        row.extend(["CALCULATION FAILED"] * (len(header) - 1))
-                    else:
-                        # Core dimensional / mass / power block (unchanged
-                        # column order so old CSVs and existing scripts still
-                        # parse).
-                        row.extend([
-                            f"{self.L1:.2f}",
-                            f"{self.B:.2f}",
-                            f"{self.D:.2f}",
-                            f"{self.T:.2f}",
-                            f"{self.C:.4f}",
-                            f"{self.M:.0f}",  # Displacement
-                            f"{self.W1:.0f}", # Cargo DW
-                            f"{self.W5:.0f}", # Total DW
-                            f"{0.7457 * self.P1:.0f}", # ServicePower(kW)
-                            f"{0.7457 * self.P2:.0f}", # InstalledPower(kW)
-                            f"{self.S:.3f}" if is_econom_on else "N/A", # BuildCost(M$)
-                        ])
-
-                        # ----- New cost decomposition (chapter 5) -----
-                        if is_econom_on:
-                            row.extend([
-                                f"{getattr(self, 'cost_steel_M', 0.0):.3f}",
-                                f"{getattr(self, 'cost_outfit_M', 0.0):.3f}",
-                                f"{getattr(self, 'cost_machinery_M', 0.0):.3f}",
-                                f"{getattr(self, 'H1', 0.0):.0f}",
-                                f"{getattr(self, 'annual_opex', 0.0):.0f}",
-                                f"{getattr(self, 'annual_fuel_cost_only', 0.0):.0f}",
-                                f"{getattr(self, 'annual_carbon_tax', 0.0):.0f}",
-                            ])
-                        else:
-                            row.extend(["N/A"] * 7)
-
-                        # ----- Volume budget (sec 5.1) -----
-                        row.extend([
-                            f"{getattr(self, 'vol_cargo', 0.0):.0f}",
-                            f"{getattr(self, 'vol_fuel', 0.0):.0f}",
-                            f"{getattr(self, 'vol_mach', 0.0):.0f}",
-                            f"{getattr(self, 'vol_stores', 0.0):.0f}",
-                            f"{getattr(self, 'vol_avail', 0.0):.0f}",
-                            f"{getattr(self, 'vol_utilisation_pct', 0.0):.2f}",
-                            f"{getattr(self, 'vol_fuel', 0.0):.0f}",  # FuelVolume(m3)
-                            f"{getattr(self, 'fuel_vol_pct_hull', 0.0):.2f}",
-                            f"{getattr(self, 'vol_expansion_iters', 0)}",
-                        ])
-
-                        # ----- CII (sec 5.2 / 5.5) -----
-                        row.extend([
-                            f"{getattr(self, 'attained_cii', 0.0):.3f}",
-                            f"{getattr(self, 'required_cii', 0.0):.3f}",
-                            getattr(self, 'cii_rating', 'N/A'),
-                        ])
-
-                        # ----- EEDI (computed inline; matches battle code) -----
-                        try:
-                            fd = FuelConfig.get(self.combo_engine.currentText())
-                            lhv = self.m_LHV if self.m_LHV > 0 else 42.7
-                            sfc_g_kwh = 3600.0 / (lhv * fd["Efficiency"])
-                            cap = self.W1 if self.W1 > 1.0 else 1.0
-                            p_me = 0.75 * (self.P2 * 0.7457)
-                            cf = fd["Carbon"]
-                            if self.combo_engine.currentText() == "LNG (Dual Fuel)" and self.m_MethaneSlip > 0:
-                                cf += (self.m_MethaneSlip / 100.0) * self.m_GWP_methane
-                            eedi = (p_me * cf * sfc_g_kwh) / (cap * self.V) if self.V > 0 else 0.0
-                            row.append(f"{eedi:.2f}")
-                        except Exception:
-                            row.append("N/A")
-
-                        # ----- RFR (kept last, matches legacy column position
-                        # when the econom flag is on) -----
-                        if is_econom_on:
-                            if is_teu_mode:
-                                rfr_val = self.Rf * self.m_TEU_Avg_Weight
-                            else:
-                                rfr_val = self.Rf
-                            row.append(f"{rfr_val:.4f}")
-
-                    writer.writerow(row)
+                elif param_name == "Reactor Cost ($/kW)":
+                    self.edit_reactor_cost.setText(str(value))
+                elif param_name == "Range (nm)":
+                    self.edit_range.setText(str(value))
+                elif param_name == "Fuel Cost ($/t)":
+                    self.edit_fuel.setText(str(value))
+                elif param_name == "Interest Rate (%)":
+                    self.edit_interest.setText(str(value))
+                elif param_name == "Carbon Tax ($/t)":
+                    self.edit_ctax_rate.setText(str(value))
+                    self.check_carbon_tax.setChecked(True)
+                # ----- New chapter-5 sweep parameters -----
+                elif param_name == "Sea days/year":
+                    self.edit_seadays.setText(str(value))
+                elif param_name == "Air Lub Eff. (%)":
+                    # Auto-tick the checkbox so the ESD physics actually engages.
+                    # Sweeping the percentage with the checkbox unticked would
+                    # silently produce flat curves and confuse the user.
+                    self.check_als.setChecked(True)
+                    self.edit_als_eff.setText(str(value))
+                elif param_name == "Wind Power Sav. (%)":
+                    self.check_wind.setChecked(True)
+                    self.edit_wind_sav.setText(str(value))
+                elif param_name == "Methane Slip (%)":
+                    self.edit_methane_slip.setText(str(value))
+                    # Methane slip only matters if the carbon tax is on,
+                    # since it's applied through the effective carbon factor.
+                    # Tick it automatically so the user sees the effect.
+                    self.check_carbon_tax.setChecked(True)
+
+                self._ui_snapshot = snapshot = self._read_ui_once()
+
+                def set_value(v):
+                    snapshot[member] = float(v)
+
+                # Progress lines go to the pane in blocks of ~1/20 of the
+                # sweep rather than one appendPlainText (and layout) per step.
+                status_buf = []
+                flush_every = max(1, steps // 20)
+
+                def flush_status():
+                    if status_buf:
+                        self.text_results.appendPlainText("\n".join(status_buf))
+                        status_buf.clear()
+
+                def on_step(k, v):
+                    status_buf.append(f"Running step {k+1}/{steps} ({param_name} = {v:.4f})...")
+                    if len(status_buf) >= flush_every:
+                        flush_status()
+
+                res = self._solve_batch(set_value, value_range, on_step)
+                flush_status()
+                ok = res['CalculatedOk']
+                total_skipped = int(np.count_nonzero(~ok))
+
+                # Format whole columns at once; members a step never set
+                # read as 0, as the per-row getattr defaults did.
+                def col(fmt, values):
+                    return np.char.mod(fmt, np.where(np.isnan(values), 0.0, values))
+
+                na = np.full(steps, "N/A")
+                def econ(fmt, values):
+                    return col(fmt, values) if is_econom_on else na
+
+                # Core dimensional / mass / power block (unchanged column
+                # order so old CSVs and existing scripts still parse).
+                columns = [
+                    col('%.2f', res['L1']),
+                    col('%.2f', res['B']),
+                    col('%.2f', res['D']),
+                    col('%.2f', res['T']),
+                    col('%.4f', res['C']),
+                    col('%.0f', res['M']),   # Displacement
+                    col('%.0f', res['W1']),  # Cargo DW
+                    col('%.0f', res['W5']),  # Total DW
+                    col('%.0f', BHP_TO_KW * res['P1']), # ServicePower(kW)
+                    col('%.0f', BHP_TO_KW * res['P2']), # InstalledPower(kW)
+                    econ('%.3f', res['S']),  # BuildCost(M$)
+                    # ----- New cost decomposition (chapter 5) -----
+                    econ('%.3f', res['cost_steel_M']),
+                    econ('%.3f', res['cost_outfit_M']),
+                    econ('%.3f', res['cost_machinery_M']),
+                    econ('%.0f', res['H1']),
+                    econ('%.0f', res['annual_opex']),
+                    econ('%.0f', res['annual_fuel_cost_only']),
+                    econ('%.0f', res['annual_carbon_tax']),
+                    # ----- Volume budget (sec 5.1) -----
+                    col('%.0f', res['vol_cargo']),
+                    col('%.0f', res['vol_fuel']),
+                    col('%.0f', res['vol_mach']),
+                    col('%.0f', res['vol_stores']),
+                    col('%.0f', res['vol_avail']),
+                    col('%.2f', res['vol_utilisation_pct']),
+                    col('%.0f', res['vol_fuel']),  # FuelVolume(m3)
+                    col('%.2f', res['fuel_vol_pct_hull']),
+                    col('%.0f', res['vol_expansion_iters']),
+                    # ----- CII (sec 5.2 / 5.5) -----
+                    col('%.3f', res['attained_cii']),
+                    col('%.3f', res['required_cii']),
+                    res['cii_rating'].astype(str),
+                    # ----- EEDI (same formula as the plot/battle code) -----
+                    col('%.2f', self._sweep_result(res, "EEDI(gCO2/t.nm)")),
+                ]
+                # ----- RFR (kept last, matches legacy column position
+                # when the econom flag is on) -----
+                if is_econom_on:
+                    rfr = res['Rf'] * res['m_TEU_Avg_Weight'] if is_teu_mode else res['Rf']
+                    columns.append(col('%.4f', rfr))
+
+                table = np.column_stack(columns).astype(object)
+                table[~ok] = "CALCULATION FAILED"
+                table = np.column_stack([np.char.mod('%.6g', value_range), table])
+                np.savetxt(f, table, fmt='%s', delimiter=',',
+                           header=','.join(header), comments='')
             
-            self.text_results.append(f"\r\n... Range analysis complete. ...")
+            self.text_results.appendPlainText(f"\r\n... Range analysis complete. ...")
             
             msg = f"Successfully saved {steps} rows to {fileName}"
             if total_skipped > 0:
@@ -3147,6 +3597,7 @@ class ShipDesViewWidget(QWidget):
         
         finally:
             self.is_batch_mode = False
+            self._ui_snapshot = None
             
             self.edit_speed.setText(original_ui_state['speed'])
             self.edit_weight.setText(original_ui_state['weight'])
@@ -3169,7 +3620,7 @@ class ShipDesViewWidget(QWidget):
             self.ignpth = original_ui_state['ignpth']
             
             self.m_Results = "Press the Calculate button\r\nto find ship dimensions ..."
-            self.text_results.setText(self.m_Results)
+            self.text_results.setPlainText(self.m_Results)
             self.CalculatedOk = False
             self.Kcases = 0
             self._reset_dlg()
@@ -3210,6 +3661,20 @@ class ShipDesViewWidget(QWidget):
             self._show_error(f"Invalid input: {e}")
             return
 
+        # Every point would come back N/A, so don't run the sweep at all
+        if y_param_name in ECON_OUTPUTS and not self.check_econom.isChecked():
+            self._show_error(f"{y_param_name} needs the economic analysis.\n"
+                             "Tick 'Economic analysis required' and run the plot again.")
+            return
+
+        # Check the whole form up front: errors are suppressed once the
+        # sweep is in batch mode.
+        try:
+            self._read_ui_once()
+        except ValueError as e:
+            self._show_error(f"Invalid input format.\n\nPlease check that all visible fields contain valid numbers.\n(Error: {e})")
+            return
+
         original_ui_state = {
             'speed': self.edit_speed.text(),
             'weight': self.edit_weight.text(),
@@ -3248,10 +3713,6 @@ class ShipDesViewWidget(QWidget):
             if is_3d:
                 range_2 = np.linspace(start_2, end_2, steps_2)
                 X, Y = np.meshgrid(range_1, range_2)
-                Z = np.zeros((steps_2, steps_1))
-                
-                total_steps = steps_1 * steps_2
-                current_step = 0
             else:
                 X, Y, Z = [], [], None
 
@@ -3294,115 +3755,58 @@ class ShipDesViewWidget(QWidget):
                     self.edit_methane_slip.setText(str(val))
                     self.check_carbon_tax.setChecked(True)
 
-            def get_result_value(name):
-                if not self.CalculatedOk: return np.nan
-                is_econom = self.check_econom.isChecked()
-                is_teu = self.radio_teu.isChecked()
-                
-                if name == "RFR($/tonne or $/TEU)":
-                    if not is_econom: return np.nan
-                    return self.Rf * self.m_TEU_Avg_Weight if is_teu else self.Rf
-                
-                elif name == "Lbp(m)": return self.L1
-                elif name == "B(m)": return self.B
-                elif name == "D(m)": return self.D
-                elif name == "T(m)": return self.T
-                elif name == "CB": return self.C
-                elif name == "Displacement(t)": return self.M
-                elif name == "CargoDW(t)": return self.W1
-                elif name == "TotalDW(t)": return self.W5
-                
-                elif name == "ServicePower(kW)": return 0.7457 * self.P1
-                elif name == "InstalledPower(kW)": return 0.7457 * self.P2
-                
-                elif name == "BuildCost(M$)": return self.S if is_econom else np.nan
-                # ----- New chapter-5 result options -----
-                elif name == "AnnualFuelCost(M$)":
-                    return (self.H7 / 1e6) if is_econom else np.nan
-                elif name == "AnnualCarbonTax(M$)":
-                    return (getattr(self, 'annual_carbon_tax', 0.0) / 1e6) if is_econom else np.nan
-                elif name == "AnnualisedCAPEX(M$)":
-                    return (getattr(self, 'H1', 0.0) / 1e6) if is_econom else np.nan
-                elif name == "AnnualOPEX(M$)":
-                    return (getattr(self, 'annual_opex', 0.0) / 1e6) if is_econom else np.nan
-                elif name == "EEDI(gCO2/t.nm)":
-                    try:
-                        fd = FuelConfig.get(self.combo_engine.currentText())
-                        lhv = self.m_LHV if self.m_LHV > 0 else 42.7
-                        sfc_g_kwh = 3600.0 / (lhv * fd["Efficiency"])
-                        cap = self.W1 if self.W1 > 1.0 else 1.0
-                        p_me = 0.75 * (self.P2 * 0.7457)
-                        cf = fd["Carbon"]
-                        if self.combo_engine.currentText() == "LNG (Dual Fuel)" and self.m_MethaneSlip > 0:
-                            cf += (self.m_MethaneSlip / 100.0) * self.m_GWP_methane
-                        return (p_me * cf * sfc_g_kwh) / (cap * self.V) if self.V > 0 else np.nan
-                    except Exception:
-                        return np.nan
-                elif name == "AttainedCII":
-                    return getattr(self, 'attained_cii', np.nan)
-                elif name == "FuelVolume(m3)":
-                    return getattr(self, 'vol_fuel', np.nan)
-                elif name == "FuelVol%Hull":
-                    return getattr(self, 'fuel_vol_pct_hull', np.nan)
-                elif name == "VolCargo(m3)":
-                    return getattr(self, 'vol_cargo', np.nan)
-                elif name == "VolFuel(m3)":
-                    return getattr(self, 'vol_fuel', np.nan)
-                elif name == "VolMachinery(m3)":
-                    return getattr(self, 'vol_mach', np.nan)
-                elif name == "VolStores(m3)":
-                    return getattr(self, 'vol_stores', np.nan)
-                elif name == "VolUtilisation%":
-                    return getattr(self, 'vol_utilisation_pct', np.nan)
-                
-                return 0.0
+            self.text_results.appendPlainText("Starting analysis...")
+
+            # Set up the form for the swept input(s) once, then parse it a
+            # single time; each step only overwrites the swept members.
+            set_param_value(param_name_1, range_1[0])
+            if is_3d:
+                set_param_value(param_name_2, range_2[0])
+            self._ui_snapshot = snapshot = self._read_ui_once()
+            member_1 = SWEEP_MEMBERS[param_name_1]
 
-            self.text_results.append("Starting analysis...")
+            def set_value(v):
+                snapshot[member_1] = float(v)
             
             if is_3d:
-                for i in range(steps_2):
-                    val_2 = range_2[i]
-                    set_param_value(param_name_2, val_2)
-                    
-                    for j in range(steps_1):
-                        val_1 = range_1[j]
-                        set_param_value(param_name_1, val_1)
-                        
-                        self.on_calculate()
-                    
-                        if not self.CalculatedOk:
-                            total_skipped += 1
-                            
-                        Z[i, j] = get_result_value(y_param_name)
-                        
-                        current_step += 1
-                        if current_step % 5 == 0: QApplication.processEvents()
+                # The whole grid is one batch, walked row by row.
+                member_2 = SWEEP_MEMBERS[param_name_2]
+                xs = X.ravel()
+                ys = Y.ravel()
+
+                def set_point(k):
+                    snapshot[member_1] = float(xs[k])
+                    snapshot[member_2] = float(ys[k])
+
+                res = self._solve_batch(set_point, range(xs.size))
+                total_skipped += int(np.count_nonzero(~res['CalculatedOk']))
+                Z = self._sweep_result(res, y_param_name)
+                Z = Z.reshape(steps_2, steps_1)
                         
-                self.graph_window = GraphWindow(X, Y, Z, param_name_1, param_name_2, y_param_name, 
-                                              f"{y_param_name} (Wireframe)")
+                plot_args = (X, Y, Z, param_name_1, param_name_2, y_param_name,
+                             f"{y_param_name} (Wireframe)")
             else:
-                x_data = []; y_data = []
-                for val in range_1:
-                    set_param_value(param_name_1, val)
-                    self.on_calculate()
-                    
-                    if not self.CalculatedOk:
-                        total_skipped += 1
-                        
-                    res = get_result_value(y_param_name)
-                    if not np.isnan(res):
-                        x_data.append(val)
-                        y_data.append(res)
+                # Drop the NaN (failed/N/A) points with one mask
+                res = self._solve_batch(set_value, range_1)
+                total_skipped += int(np.count_nonzero(~res['CalculatedOk']))
+                y_data = self._sweep_result(res, y_param_name)
                 
-                self.graph_window = GraphWindow(x_data, y_data, None, param_name_1, y_param_name, "", 
-                                              f"{y_param_name} vs {param_name_1}")
+                valid = ~np.isnan(y_data)
+                plot_args = (range_1[valid], y_data[valid], None, param_name_1, y_param_name, "",
+                             f"{y_param_name} vs {param_name_1}")
 
+            # Re-plots reuse the open window's figure and canvas
+            if self.graph_window is None:
+                self.graph_window = GraphWindow(*plot_args)
+            else:
+                self.graph_window.update_plot(*plot_args)
             self.graph_window.show()
-            self.text_results.append("Plot complete.")
+            self.graph_window.raise_()
+            self.text_results.appendPlainText("Plot complete.")
             
             if total_skipped > 0:
                 summary_msg = f"{total_skipped} calculation(s) were skipped/omitted from the plot due to physical constraints."
-                self.text_results.append(f"Note: {summary_msg}")
+                self.text_results.appendPlainText(f"Note: {summary_msg}")
                 QMessageBox.warning(self, "Plot Missing Data", summary_msg)
 
         except Exception as e:
@@ -3412,6 +3816,7 @@ class ShipDesViewWidget(QWidget):
 
         finally:
             self.is_batch_mode = False
+            self._ui_snapshot = None
             
             self.edit_speed.setText(original_ui_state['speed'])
             self.edit_weight.setText(original_ui_state['weight'])
@@ -3529,7 +3934,7 @@ class ShipDesViewWidget(QWidget):
         self.is_batch_mode = True
         total_skipped = 0
 
-        # Helpers for setting and getting dynamic parameters
+        # Sets up the form for a swept input
         def set_param_value(name, val):
             if name == "Speed(knts)": self.edit_speed.setText(str(val))
             elif name == "Cargo deadweight(t)": self.edit_weight.setText(str(val)); self.radio_cargo.setChecked(True)
@@ -3553,71 +3958,13 @@ class ShipDesViewWidget(QWidget):
                 self.edit_methane_slip.setText(str(val))
                 self.check_carbon_tax.setChecked(True)
 
-        def get_result_value(name):
-            if not self.CalculatedOk: return np.nan
-            is_econom = self.check_econom.isChecked()
-            is_teu = self.radio_teu.isChecked()
-            
-            if name == "RFR($/tonne or $/TEU)":
-                if not is_econom: return np.nan
-                return self.Rf * self.m_TEU_Avg_Weight if is_teu else self.Rf
-            elif name == "Lbp(m)": return self.L1
-            elif name == "B(m)": return self.B
-            elif name == "D(m)": return self.D
-            elif name == "T(m)": return self.T
-            elif name == "CB": return self.C
-            elif name == "Displacement(t)": return self.M
-            elif name == "CargoDW(t)": return self.W1
-            elif name == "TotalDW(t)": return self.W5
-            elif name == "ServicePower(kW)": return 0.7457 * self.P1
-            elif name == "InstalledPower(kW)": return 0.7457 * self.P2
-            elif name == "BuildCost(M$)": return self.S if is_econom else np.nan
-            elif name == "AnnualFuelCost(M$)": return self.H7 / 1e6 if is_econom else np.nan
-            elif name == "AnnualCarbonTax(M$)":
-                return (getattr(self, 'annual_carbon_tax', 0.0) / 1e6) if is_econom else np.nan
-            elif name == "AnnualisedCAPEX(M$)":
-                return (getattr(self, 'H1', 0.0) / 1e6) if is_econom else np.nan
-            elif name == "AnnualOPEX(M$)":
-                return (getattr(self, 'annual_opex', 0.0) / 1e6) if is_econom else np.nan
-            elif name == "EEDI(gCO2/t.nm)":
-                try:
-                    fuel_data = FuelConfig.get(self.combo_engine.currentText())
-                    lhv = self.m_LHV if self.m_LHV > 0 else 42.7
-                    eff = fuel_data["Efficiency"]
-                    sfc_g_kwh = 3600.0 / (lhv * eff)
-                    capacity = self.W1 if self.W1 > 1.0 else 1.0
-                    p_me = 0.75 * (self.P2 * 0.7457)
-                    cf = self._effective_carbon_factor(fuel_data)
-                    if self.combo_engine.currentText() == "LNG (Dual Fuel)" and self.m_MethaneSlip > 0:
-                        cf += (self.m_MethaneSlip / 100.0) * self.m_GWP_methane
-                    return (p_me * cf * sfc_g_kwh) / (capacity * self.V)
-                except:
-                    return np.nan
-            elif name == "AttainedCII":
-                return getattr(self, 'attained_cii', np.nan)
-            elif name == "FuelVolume(m3)":
-                return getattr(self, 'vol_fuel', np.nan)
-            elif name == "FuelVol%Hull":
-                return getattr(self, 'fuel_vol_pct_hull', np.nan)
-            elif name == "VolCargo(m3)":
-                return getattr(self, 'vol_cargo', np.nan)
-            elif name == "VolFuel(m3)":
-                return getattr(self, 'vol_fuel', np.nan)
-            elif name == "VolMachinery(m3)":
-                return getattr(self, 'vol_mach', np.nan)
-            elif name == "VolStores(m3)":
-                return getattr(self, 'vol_stores', np.nan)
-            elif name == "VolUtilisation%":
-                return getattr(self, 'vol_utilisation_pct', np.nan)
-            return 0.0
-
         try:
-            self.text_results.append(f"\n--- MULTI-ENGINE BATTLE ---")
-            self.text_results.append(f"Comparing: {', '.join(selected_engines)}")
-            self.text_results.append(f"X-Axis: {param_x} | Y-Axis: {param_y}")
+            self.text_results.appendPlainText(f"\n--- MULTI-ENGINE BATTLE ---")
+            self.text_results.appendPlainText(f"Comparing: {', '.join(selected_engines)}")
+            self.text_results.appendPlainText(f"X-Axis: {param_x} | Y-Axis: {param_y}")
             
             for engine_name in selected_engines:
-                self.text_results.append(f"Calculating {engine_name}...")
+                self.text_results.appendPlainText(f"Calculating {engine_name}...")
                 
                 idx = self.combo_engine.findText(engine_name)
                 self.combo_engine.setCurrentIndex(idx)
@@ -3634,22 +3981,21 @@ class ShipDesViewWidget(QWidget):
                 
                 QApplication.processEvents() 
                 
-                valid_x = []
-                valid_y = []
-                
-                for val in x_values:
-                    set_param_value(param_x, val)
-                    self.on_calculate()
-                    
-                    if self.CalculatedOk:
-                        res = get_result_value(param_y)
-                        if not np.isnan(res):
-                            valid_x.append(val)
-                            valid_y.append(res)
-                    else:
-                        total_skipped += 1
-                
-                battle_results[engine_name] = (valid_x, valid_y)
+                # Tick/select the form for the swept input once, then each
+                # step only overwrites its member in the snapshot.
+                set_param_value(param_x, x_values[0])
+                self._ui_snapshot = snapshot = self._read_ui_once()
+                member = SWEEP_MEMBERS[param_x]
+
+                def set_value(v):
+                    snapshot[member] = float(v)
+
+                res = self._solve_batch(set_value, x_values)
+                self._ui_snapshot = None
+                total_skipped += int(np.count_nonzero(~res['CalculatedOk']))
+                # Full-length columns, NaN where a step failed or is N/A
+                battle_results[engine_name] = (x_values,
+                                               self._sweep_result(res, param_y))
 
             # Store metadata for plotting and exporting
             self.last_battle_results = battle_results
@@ -3658,11 +4004,11 @@ class ShipDesViewWidget(QWidget):
             self.btn_export_battle.setEnabled(True)
 
             self._show_battle_graph(battle_results)
-            self.text_results.append("Battle Complete.\n")
+            self.text_results.appendPlainText("Battle Complete.\n")
             
             if total_skipped > 0:
                 summary_msg = f"{total_skipped} calculation(s) were skipped due to physical constraints."
-                self.text_results.append(f"Note: {summary_msg}")
+                self.text_results.appendPlainText(f"Note: {summary_msg}")
                 QMessageBox.warning(self, "Calculations Skipped", summary_msg)
 
         except Exception as e:
@@ -3670,6 +4016,7 @@ class ShipDesViewWidget(QWidget):
             
         finally:
             self.is_batch_mode = False 
+            self._ui_snapshot = None
             # Carbon-factor override only applies during a battle run; clear
             # it here so subsequent ordinary calculations use the FuelConfig
             # default again.
@@ -3760,8 +4107,9 @@ class ShipDesViewWidget(QWidget):
                   '#F0E442', '#56B4E9', '#E69F00', '#000000']
 
         for i, (engine_name, (x_data, y_data)) in enumerate(results_dict.items()):
-            if x_data and y_data:
-                ax.plot(x_data, y_data,
+            valid = ~np.isnan(y_data)
+            if valid.any():
+                ax.plot(x_data[valid], y_data[valid],
                         marker=markers[i % len(markers)],
                         color=colors[i % len(colors)],
                         label=engine_name,
@@ -3802,40 +4150,30 @@ class ShipDesViewWidget(QWidget):
             return
             
         try:
+            engines = list(self.last_battle_results.keys())
+            # Every engine ran the same x sweep; rows where all engines
+            # failed are left out.
+            x_values = self.last_battle_results[engines[0]][0]
+            ys = np.column_stack([self.last_battle_results[eng][1] for eng in engines])
+            keep = ~np.isnan(ys).all(axis=1)
+            x_values = x_values[keep]
+            ys = ys[keep]
+
+            x_label = getattr(self, 'battle_x_label', "Input Variable")
+            y_label = getattr(self, 'battle_y_label', "Output Variable")
+            if y_label == "RFR($/tonne or $/TEU)":
+                unit = "$/TEU" if self.radio_teu.isChecked() else "$/tonne"
+                y_label = f"RFR ({unit})"
+
+            header = [x_label] + [f"{eng} - {y_label}" for eng in engines]
+
+            columns = [np.char.mod('%.4f', x_values)]
+            columns.extend(np.where(np.isnan(col), "N/A", np.char.mod('%.4f', col))
+                           for col in ys.T)
+
             with open(fileName, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                
-                engines = list(self.last_battle_results.keys())
-                
-                # Retrieve the longest X-array in case some engines failed early
-                x_values = []
-                for eng in engines:
-                    if len(self.last_battle_results[eng][0]) > len(x_values):
-                        x_values = self.last_battle_results[eng][0]
-                
-                x_label = getattr(self, 'battle_x_label', "Input Variable")
-                y_label = getattr(self, 'battle_y_label', "Output Variable")
-                if y_label == "RFR($/tonne or $/TEU)":
-                    unit = "$/TEU" if self.radio_teu.isChecked() else "$/tonne"
-                    y_label = f"RFR ({unit})"
-                
-                header = [x_label] + [f"{eng} - {y_label}" for eng in engines]
-                writer.writerow(header)
-                
-                for i in range(len(x_values)):
-                    row = [f"{x_values[i]:.4f}"]
-                    for engine in engines:
-                        eng_x = self.last_battle_results[engine][0]
-                        eng_y = self.last_battle_results[engine][1]
-                        
-                        # Match X values exactly to handle differing failure points
-                        try:
-                            idx = eng_x.index(x_values[i])
-                            row.append(f"{eng_y[idx]:.4f}")
-                        except ValueError:
-                            row.append("N/A")
-                            
-                    writer.writerow(row)
+                np.savetxt(f, np.column_stack(columns), fmt='%s', delimiter=',',
+                           header=','.join(header), comments='')
                     
             QMessageBox.information(self, "Export Complete", f"Successfully saved battle results to:\n{fileName}")
             
@@ -3844,81 +4182,19 @@ class ShipDesViewWidget(QWidget):
 
     def _freeboard(self):
         """Port of Sub_freeboard"""
-
-        ship_name = self.combo_ship.currentText()
-        ship_data = ShipConfig.get(ship_name)
-        
-        eff_type = ship_data["ID"] 
-
-        if self.L1 <= self._L2[0]: 
-            l = 0
-        elif self.L1 < self._L2[-1]:
-            l = 0
-            while l < 17 and self.L1 > self._L2[l]:
-                l += 1
-            if l > 0: l -= 1
-        else:
-            l = 16
-        
-        L2_l = self._L2[l]
-        L2_l1 = self._L2[l+1]
-        
-        if eff_type == 1:
-            F1_l = self._F1[l]
-            F1_l1 = self._F1[l+1]
-            self.F5 = F1_l + (self.L1 - L2_l) * (F1_l1 - F1_l) / (L2_l1 - L2_l)
-        else:
-            F2_l = self._F2[l]
-            F2_l1 = self._F2[l+1]
-            self.F5 = F2_l + (self.L1 - L2_l) * (F2_l1 - F2_l) / (L2_l1 - L2_l)
-            
-        if eff_type != 1 and self.L1 < 100:
-             self.F5 += 0.75 * (100.0 - self.L1) * (0.35 - self._E5)
-            
-        T_safe = self.T if self.T != 0 else 1e-9
-        C9 = self.C + (0.85 * self.D - self.T) / (10.0 * T_safe)
-        if C9 >= 0.68:
-            self.F5 *= (C9 + 0.68) / 1.36
-            
-        if self.D >= self.L1 / 15.0:
-            if self.L1 <= 120:
-                self.F5 += ((self.D - self.L1 / 15.0) * self.L1 / 0.48)
-            else:
-                self.F5 += ((self.D - self.L1 / 15.0) * 250.0)
-                
-        if self.L1 <= 85:
-            E9 = 350 + (self.L1 - 24) * (860.0 - 350.0) / (85.0 - 24.0)
-        elif self.L1 <= 122:
-            E9 = 860 + (self.L1 - 85) * (1070.0 - 860.0) / (122.0 - 85.0)
-        else:
-            E9 = 1070
-            
-        if self.Kstype == 1:
-            E9 *= (self._E5 ** 1.23)
-        else:
-            E9 *= (self._E5 ** 1.3)
-            
-        self.F5 -= E9
-        E0 = (self.L1 / 3.0 + 10.0) * (8.3375 * (1.0 - self._Y1) + 4.16875 * (1.0 - self._Y2))
-        E0 *= (0.75 - 0.5 * self._E5)
-        self.F5 += E0
-        self.F5 *= 0.001
-        
+        ship_data = ShipConfig.get(self.ship_name)
+        self.F5 = _freeboard_cached(float(self.L1), float(self.T),
+                                    float(self.D), float(self.C),
+                                    float(self._E5), float(self._Y1),
+                                    float(self._Y2),
+                                    ship_data["ID"] == 1, self.Kstype == 1)
         return True
 
     def _stability(self):
         """Port of Sub_stability"""
-        ship_name = self.combo_ship.currentText()
-        ship_data = ShipConfig.get(ship_name)
-        
-        G3 = ship_data["Stability_Factor"] * self.D
-        C7 = 0.67 * self.C + 0.32
-        C_safe = self.C if self.C != 0 else 1e-9
-        T_safe = self.T if self.T != 0 else 1e-9
-        G4 = self.T * (5.0 * C7 - 2.0 * self.C) / (6.0 * C7)
-        C8 = 1.1 * self.C - 0.12
-        G5 = C8 * self.B * self.B / (12.0 * T_safe * C_safe)
-        self.G6 = G4 + G5 - G3
+        ship_data = ShipConfig.get(self.ship_name)
+        self.G6 = gm_margin(float(self.B), float(self.T), float(self.D),
+                             float(self.C), float(ship_data["Stability_Factor"]))
         return True
         
     def _cost(self):
@@ -3944,11 +4220,12 @@ class ShipDesViewWidget(QWidget):
         
         S0_nuclear = 0.0
         if self.Ketype == 4: # Nuclear
-            installed_power_kw = self.P2 * 0.7457
+            installed_power_kw = self.P2 * BHP_TO_KW
             S0_nuclear = self.m_Reactor_Cost_per_kW * installed_power_kw
             S0 = S0_nuclear
         else: # Fossil
-            S0 = self.m_S5_Machinery1 * (self.P1 ** 0.82) + self.m_S6_Machinery2 * (self.P1 ** 0.82)
+            P1_082 = self.P1 ** 0.82
+            S0 = self.m_S5_Machinery1 * P1_082 + self.m_S6_Machinery2 * P1_082
 
         # ----------------------------------------------------------------
         # Retrofit machinery cost discount (sec 5.4).
@@ -3972,18 +4249,13 @@ class ShipDesViewWidget(QWidget):
         self.cost_outfit_M    = S9 / 1.0e6
         self.cost_machinery_M = S0 / 1.0e6
         
-        I_rate = self.I * 0.01
-        H0 = (1.0 + I_rate) ** self.N
-        if (H0 - 1.0) == 0: H0 = 1e-9 # Avoid div by zero
-        H0 = I_rate * H0 / (H0 - 1.0)
-        
-        self.H1 = H0 * self.S 
+        self.H1 = _capital_recovery(self.I, self.N) * self.S 
 
         # Maintenance split (see _cost docstring). Hull + outfit at the
         # legacy flat percentage; machinery at a fuel-specific percentage
         # from FuelConfig. Falling back to m_H3_Maint_Percent if a fuel
         # entry is missing the new field keeps user-defined fuels working.
-        _fuel_for_maint = FuelConfig.get(self.combo_engine.currentText())
+        _fuel_for_maint = FuelConfig.get(self.engine_name)
         _machinery_maint_pct = _fuel_for_maint.get(
             "MaintenancePct", self.m_H3_Maint_Percent
         )
@@ -3993,7 +4265,7 @@ class ShipDesViewWidget(QWidget):
         self.annual_fuel_cost_only = 0.0
         self.annual_carbon_tax = 0.0
 
-        engine_name = self.combo_engine.currentText()
+        engine_name = self.engine_name
         fuel_data = FuelConfig.get(engine_name)
         
         if fuel_data["IsNuclear"]:
@@ -4005,7 +4277,7 @@ class ShipDesViewWidget(QWidget):
             self.annual_fuel_cost_only = annual_core_cost
             
         else:         
-            service_power_kw = self.P1 * 0.7457
+            service_power_kw = self.P1 * BHP_TO_KW
             annual_energy_MJ = service_power_kw * (self.D1 * 24.0) * 3.6
             if self.m_LHV > 0:
                  annual_fuel_tonnes = (annual_energy_MJ / (self.m_LHV * fuel_data["Efficiency"])) / 1000.0
@@ -4095,7 +4367,7 @@ class ShipDesViewWidget(QWidget):
 
         eff_propulsive = self.Q if self.Q > 0 else 0.65
 
-        pe_kw = self.P * 0.7457 # Effective Power in kW
+        pe_kw = self.P * BHP_TO_KW # Effective Power in kW
 
         cb_safe = self.C if self.C > 0 else 0.8
         self.area_wetted = 1.025 * self.L1 * (cb_safe * self.B + 1.7 * self.T)
@@ -4173,11 +4445,8 @@ class ShipDesViewWidget(QWidget):
         self.p_savings_kw = 0.0
         self.esd_log = []
 
-        if self.check_als.isChecked():
-            try:
-                eff_pct = float(self.edit_als_eff.text())
-            except:
-                eff_pct = 5.0
+        if self.m_AirLub:
+            eff_pct = self.m_AirLubEff
 
             area_bottom = self.L1 * self.B * cb_safe
 
@@ -4196,11 +4465,8 @@ class ShipDesViewWidget(QWidget):
             self.res_total -= drag_reduction_kn
             self.res_friction -= drag_reduction_kn
 
-        if self.check_wind.isChecked():
-            try:
-                sav_pct = float(self.edit_wind_sav.text())
-            except:
-                sav_pct = 10.0
+        if self.m_Wind:
+            sav_pct = self.m_WindSav
 
             pe_current = pe_kw - self.p_savings_kw
             wind_sav_kw = pe_current * (sav_pct / 100.0)
@@ -4211,7 +4477,7 @@ class ShipDesViewWidget(QWidget):
             wind_drag_red_kn = wind_sav_kw / V_ms
             self.res_total -= wind_drag_red_kn
 
-        savings_bhp = self.p_savings_kw / 0.7457
+        savings_bhp = self.p_savings_kw / BHP_TO_KW
 
         self.P1_Original = self.P1
         self.P1 -= savings_bhp
@@ -4236,6 +4502,17 @@ class ShipDesViewWidget(QWidget):
             return self.m_CarbonOverride
         return fuel_data["Carbon"]
 
+    def _set_mass_constants(self):
+        """Looks up the ship/engine-type inputs of _mass once per
+        calculation: (K1, outfit intercept, outfit slope, K3, fuel data),
+        and the engine type's EngineProfile for _mass and _power."""
+        self._engine_profile = ENGINE_PROFILES.get(self.Ketype, DEFAULT_ENGINE_PROFILE)
+        ship_data = ShipConfig.get(self.ship_name)
+        self._mass_consts = (ship_data["Steel_K1"], ship_data["Outfit_Intercept"],
+                             ship_data["Outfit_Slope"],
+                             0.59 if ship_data["ID"] == 1 else 0.56,
+                             FuelConfig.get(self.engine_name))
+
     def _mass(self):
         """Port of Sub_mass - FIXED to restore legacy C++ math for standard engines"""
 
@@ -4243,27 +4520,13 @@ class ShipDesViewWidget(QWidget):
         T_safe = self.T if self.T != 0 else 1e-9
         C1 = self.C + (0.8 * self.D - self.T) / (10.0 * T_safe)
         
-        ship_name = self.combo_ship.currentText()
-        ship_data = ShipConfig.get(ship_name)
-        
-        K1 = ship_data["Steel_K1"]
-        
-        if ship_data["Outfit_Slope"] > 0.001:
-            K2 = ship_data["Outfit_Intercept"] - (self.L1 / ship_data["Outfit_Slope"])
-        else:
-            K2 = ship_data["Outfit_Intercept"]
+        K1, K2, outfit_slope, K3, fuel_data = self._mass_consts
+        if outfit_slope > 0.001:
+            K2 -= self.L1 / outfit_slope
             
         self.M1 = K1 * (E1 ** 1.36) * (1.0 + 0.5 * (C1 - 0.7))
         self.M2 = K2 * self.L1 * self.B
 
-        if ship_data["ID"] == 1:
-            K3 = 0.59
-        else:
-            K3 = 0.56
-
-        engine_name = self.combo_engine.currentText()
-        fuel_data = FuelConfig.get(engine_name)
-
         # Fuel-specific structure / outfit penalty (Option B).
         # M1 (steel) and M2 (outfit) above are pure hull-geometry regressions
         # and know nothing about the engine choice. For nuclear we need to
@@ -4280,12 +4543,11 @@ class ShipDesViewWidget(QWidget):
         self.M1 *= fuel_data.get("StructureFactor", 1.0)
         self.M2 *= fuel_data.get("OutfitFactor", 1.0)
 
-        is_legacy_diesel = (self.Ketype == 1 or self.Ketype == 2)
-        is_legacy_steam = (self.Ketype == 3)
+        profile = self._engine_profile
         
         V_safe = self.V if self.V > 0.1 else 0.1
         
-        installed_power_kw = self.P2 * 0.7457 
+        installed_power_kw = self.P2 * BHP_TO_KW 
 
         # ----------------------------------------------------------------
         # Machinery mass M3 (tonnes).  Restores the legacy C++ regressions
@@ -4303,13 +4565,8 @@ class ShipDesViewWidget(QWidget):
         # diesel machinery by roughly an order of magnitude and ignored
         # engine RPM entirely.
         # ----------------------------------------------------------------
-        if is_legacy_diesel:
-            N1_safe = self.N1 if self.N1 > 0 else 1e-9
-            term1 = 9.38 * ((self.P2 / N1_safe) ** 0.84)
-            term2 = K3 * (self.P2 ** 0.7)
-            self.M3 = term1 + term2
-        elif is_legacy_steam:
-            self.M3 = 0.16 * (self.P2 ** 0.89)
+        if profile.machinery_mass is not None:
+            self.M3 = profile.machinery_mass(self.P2, self.N1, K3)
         else:
             if fuel_data["IsNuclear"]:
                 # ~2000 t base for a naval-grade SMR pressure vessel + shielding
@@ -4318,16 +4575,11 @@ class ShipDesViewWidget(QWidget):
                 base_machinery = 200.0
                 self.M3 = base_machinery + (installed_power_kw * fuel_data["Machinery"] * 0.001)
 
-        if is_legacy_diesel:
-            self.calculated_fuel_mass = 0.0011 * (0.15 * self.P1 * self.R / V_safe)
+        if profile.fuel_coef is not None:
+            self.calculated_fuel_mass = 0.0011 * (profile.fuel_coef * self.P1 * self.R / V_safe)
             self.raw_fuel_mass = self.calculated_fuel_mass   # ADDED: legacy has no separate tank multiplier
             W3 = self.calculated_fuel_mass
             
-        elif is_legacy_steam:
-            self.calculated_fuel_mass = 0.0011 * (0.28 * self.P1 * self.R / V_safe)
-            self.raw_fuel_mass = self.calculated_fuel_mass   # ADDED
-            W3 = self.calculated_fuel_mass
-            
         else:
             if fuel_data["IsNuclear"]:
                 W3 = 0.0
@@ -4335,7 +4587,7 @@ class ShipDesViewWidget(QWidget):
                 self.calculated_fuel_mass = 0.0              # ADDED (was implicitly leftover)
             else:
                 voyage_hours = self.R / V_safe
-                service_power_kw = self.P1 * 0.7457
+                service_power_kw = self.P1 * BHP_TO_KW
                 total_energy_MJ = service_power_kw * voyage_hours * 3.6
                 
                 efficiency = fuel_data["Efficiency"]
@@ -4389,17 +4641,21 @@ class ShipDesViewWidget(QWidget):
         Steps 3 and 4 are method-agnostic — they only consume self.P,
         self.Q (computed below), and self.Ketype.
         """
-        self.Kpwrerr = 1
-        L1_safe = self.L1 if self.L1 > 0 else 1e-9
+        self.Kpwrerr = 0
+        # Bind the hull state to locals once; it is read many times below
+        # and _power runs on every retry of every sweep step.
+        L1 = self.L1; V = self.V
+        L1_safe = L1 if L1 > 0 else 1e-9
         g = 9.81
-        v_ms = self.V * 0.5144  # knots to m/s
+        v_ms = V * 0.5144  # knots to m/s
         viscosity = 1.188e-6    # Seawater kinematic viscosity
 
         # Shared quantities used by both resistance methods AND by downstream
         # reporting code (_outvdu reads self.froude_number and friends).
-        self.froude_number = v_ms / math.sqrt(g * L1_safe)
+        froude_number = v_ms / math.sqrt(g * L1_safe)
+        self.froude_number = froude_number
         self.reynolds_number = (v_ms * L1_safe) / viscosity
-        self.lcb_optimal = 8.8 * (self.froude_number - 0.18)
+        self.lcb_optimal = 8.8 * (froude_number - 0.18)
 
         # ------------------------------------------------------------------
         # Resistance method dispatcher
@@ -4453,14 +4709,14 @@ class ShipDesViewWidget(QWidget):
         # ------------------------------------------------------------------
         # Wageningen B-series propeller optimisation (method-agnostic)
         # ------------------------------------------------------------------
-        m0 = 0
         mm = self.maxit
+        C = self.C; P = self.P
 
         D5 = self.Pdt * self.T; N5 = self.N2 / 60.0
-        W9 = 1.1 - 3.4 * self.C + 3.1 * (self.C ** 1.9)
-        T9 = 0.6 * W9; V5 = self.V * 0.515 * (1.0 - W9)
-        V_safe = self.V if self.V != 0 else 1e-9
-        T5 = 0.7461 * self.P / (0.515 * V_safe * (1.0 - T9))
+        W9 = 1.1 - 3.4 * C + 3.1 * (C ** 1.9)
+        T9 = 0.6 * W9; V5 = V * 0.515 * (1.0 - W9)
+        V_safe = V if V != 0 else 1e-9
+        T5 = 0.7461 * P / (0.515 * V_safe * (1.0 - T9))
 
         J1 = 0.4581238; P4 = 0.9304762; L3 = 0.5; L4 = 1.4
         D5_safe = D5 if D5 != 0 else 1e-9
@@ -4470,22 +4726,15 @@ class ShipDesViewWidget(QWidget):
         try: T3 = T5 / (1.025 * (N5_safe ** 2) * (D5_safe ** 4))
         except ZeroDivisionError: T3 = 0
 
-        A6 = self._A6; B6 = self._B6; C6 = self._C6; D6 = self._D6
+        A6 = _A6_T; B6 = _B6_T; C6 = _C6_T; D6 = _D6_T
         Z4 = A6[1] + J2 * (A6[2] + J2 * (A6[3] + J2 * A6[4]))
         Y4 = B6[1] + J2 * (B6[2] + J2 * B6[3])
         X4 = C6[1] + J2 * C6[2]
         Z5 = A6[5] + J2 * (A6[6] + J2 * (A6[7] + J2 * A6[8]))
         Y5 = B6[5] + J2 * (B6[6] + J2 * B6[7])
         X5 = C6[5] + J2 * C6[6]
-        P3 = 1.0; P5 = P3 - P4
-        A9 = Z4 + P5 * (Y4 + P5 * (X4 + P5 * D6[1])) - T3
-
-        while m0 < mm and abs(A9) > 0.00001:
-            m0 += 1
-            B9 = Y4 + P5 * (2.0 * X4 + 3.0 * P5 * D6[1])
-            if B9 == 0: B9 = 1e-9
-            P6 = P5 - A9 / B9; P5 = P6
-            A9 = Z4 + P5 * (Y4 + P5 * (X4 + P5 * D6[1])) - T3
+        P3 = 1.0
+        P5, m0 = solve_pitch(Z4, Y4, X4, D6[1], T3, P3 - P4, mm)
 
         if m0 >= mm:
             self.Kpwrerr = self.NOT_CONVERGE
@@ -4496,39 +4745,37 @@ class ShipDesViewWidget(QWidget):
         T3 = Z4 + P5 * (Y4 + P5 * (X4 + P5 * D6[1]))
         Q3 = Z5 + P5 * (Y5 + P5 * (X5 + P5 * D6[5]))
         if Q3 == 0: Q3 = 1e-9
-        self.Q1 = T3 * J3 / (2.0 * math.pi * Q3)
-        self.Q2 = (1.0 - T9) / (1.0 - W9)
-        self.Q = self.Q1 * self.Q2; P5 += P4
+        Q1 = T3 * J3 / (2.0 * math.pi * Q3)
+        Q2 = (1.0 - T9) / (1.0 - W9)
+        Q = Q1 * Q2; P5 += P4
+        self.Q1 = Q1; self.Q2 = Q2; self.Q = Q
 
-        if self.dbgmd and self.m_Cargo == 0:
+        dbgmd = self.dbgmd; cargo = self.m_Cargo
+        if dbgmd and cargo == 0:
             msg = f"P5={P5:7.4f} (range {L3:4.2f}-{L4:4.2f})"
             QMessageBox.information(self, "Debug P5", msg)
         if P5 > L4:
-            self.Kpwrerr *= self.PITCH_LOW
-            if (not self.ignpth and not self.dbgmd) or self.m_Cargo == 1:
+            self.Kpwrerr |= self.PITCH_LOW
+            if (not self.ignpth and not dbgmd) or cargo == 1:
                 self._show_error(f"Prop. pitch out of range: {P5:7.4f}", "Fatal error")
                 return False
         if P5 < L3:
-            self.Kpwrerr *= self.PITCH_HIGH
-            if (not self.ignpth and not self.dbgmd) or self.m_Cargo == 1:
+            self.Kpwrerr |= self.PITCH_HIGH
+            if (not self.ignpth and not dbgmd) or cargo == 1:
                 self._show_error(f"Prop. pitch out of range: {P5:7.4f}", "Fatal error")
                 return False
 
-        self.F0 = 1.2 - math.sqrt(L1_safe) / 47.0 # SCF
+        F0 = 1.2 - math.sqrt(L1_safe) / 47.0 # SCF
 
-        if self.Ketype == 1: self.F9 = 0.98   # Direct Diesel
-        elif self.Ketype == 2: self.F9 = 0.95 # Geared Diesel
-        elif self.Ketype == 3: self.F9 = 0.95 # Steam
-        elif self.Ketype == 4: self.F9 = 0.95 # Nuclear
-        else:
-            self.F9 = 0.96
+        F9 = self._engine_profile.f9
 
-        Q_safe = self.Q if self.Q != 0 else 1e-9
-        F9_safe = self.F9 if self.F9 != 0 else 1e-9
+        Q_safe = Q if Q != 0 else 1e-9
+        F9_safe = F9 if F9 != 0 else 1e-9
 
-        self.P1 = (self.P / Q_safe) * self.F0 / F9_safe
+        P1 = (P / Q_safe) * F0 / F9_safe
         F6 = 30.0 # Margin %
-        self.P2 = self.P1 * (1.0 + 0.01 * F6)
+        self.F0 = F0; self.F9 = F9
+        self.P1 = P1; self.P2 = P1 * (1.0 + 0.01 * F6)
 
         return True
 
@@ -4580,18 +4827,14 @@ class ShipDesViewWidget(QWidget):
                 self._show_error(f"Ship speed too high: V0 is {V0:6.3f}", "Fatal error")
                 return False
 
-        if V0 < self._V1[1]: l = 1
-        elif V0 < self._V1[7]:
-            i = 1; l = 1
-            while i < 8 and V0 > self._V1[i]:
-                l = i; i += 1
-        else: l = 6
+        # Station l with _V1[l] < V0 <= _V1[l+1], clamped to the table ends
+        l = min(max(int(np.searchsorted(_V1[1:], V0)), 1), 6)
 
         A = [0.0] * 9
-        A[l] = self._resist(16 * (l - 1), W0, X0)
-        A[l+1] = self._resist(16 * l, W0, X0)
+        A[l] = self._resist(l - 1, W0, X0)
+        A[l+1] = self._resist(l, W0, X0)
 
-        R6 = A[l] + (V0 - self._V1[l]) * (A[l+1] - A[l]) / (self._V1[l+1] - self._V1[l])
+        R6 = A[l] + (V0 - _V1_T[l]) * (A[l+1] - A[l]) / (_V1_T[l+1] - _V1_T[l])
         R7 = R6 * W0 / (2.4938 * L1_safe)
 
         if self.L1 >= 122.0: R8 = R7 - 0.1 * (self.L1 - 122.0) / (self.L1 + 66.0)
@@ -4606,7 +4849,7 @@ class ShipDesViewWidget(QWidget):
         # back-fit them. 'total' is in kN: pe_kw / V_ms.
         v_ms = self.V * 0.5144 if self.V > 0 else 0.1
         if v_ms <= 0: v_ms = 0.1
-        pe_kw = pe_hp * 0.7457
+        pe_kw = pe_hp * BHP_TO_KW
         total_kn = pe_kw / v_ms
         components = {
             'total':       total_kn,
@@ -4676,9 +4919,9 @@ class ShipDesViewWidget(QWidget):
         cfg = ResistanceMethodConfig.get(self.resistance_method)
         fn_lo, fn_hi = cfg["valid_fn_range"]
         if Fn < fn_lo or Fn > fn_hi:
-            # Multiply (don't assign) so this code can co-exist with other
-            # error codes already encoded in Kpwrerr.
-            self.Kpwrerr *= self.RESISTANCE_OUT_OF_RANGE
+            # OR in (don't assign) so this code can co-exist with other
+            # error flags already set in Kpwrerr.
+            self.Kpwrerr |= self.RESISTANCE_OUT_OF_RANGE
             if (not self.ignspd and not self.dbgmd) or self.m_Cargo == 1:
                 self._show_error(
                     f"Fn={Fn:.3f} outside Holtrop range [{fn_lo:.2f}, {fn_hi:.2f}]",
@@ -5075,22 +5318,13 @@ class ShipDesViewWidget(QWidget):
             self.diag_eta_h = 0.0
             self.diag_eta_o = 0.0
 
-    def _resist(self, base_idx, W0, X0):
-        """Port of Sub_resist helper function"""
-        Z1 = 1.0
-        Z2 = (self.L1 / W0 - 5.296) / 1.064
-        Z3 = 10.0 * (self.B / self.T - 3.025) / 9.05
-        Z4 = 1000.0 * (self.C - 0.725) / 75.0
-        Z5 = (X0 - 0.77) / 2.77
-        X1 = self._X1
-        R1 = (X1[base_idx + 1] * Z1 + X1[base_idx + 2] * Z2 + X1[base_idx + 3] * Z3 + X1[base_idx + 4] * Z4)
-        R2 = (X1[base_idx + 5] * Z5 + X1[base_idx + 6] * Z2 * Z2 + X1[base_idx + 7] * Z3 * Z3 + X1[base_idx + 8] * Z4 * Z4)
-        R3 = (X1[base_idx + 9] * Z5 * Z5 + X1[base_idx + 10] * Z2 * Z3 + X1[base_idx + 11] * Z2 * Z4)
-        R4 = (X1[base_idx + 12] * Z2 * Z5 + X1[base_idx + 13] * Z3 * Z4 + X1[base_idx + 14] * Z3 * Z5)
-        R5 = (X1[base_idx + 15] * Z4 * Z5 + X1[base_idx + 16] * Z5 * Z4 * Z4)
-        A_val = R1 + R2 + R3 + R4 + R5
-        A_val = A_val * 5.1635 + 13.1035
-        return A_val
+    def _resist(self, row, W0, X0):
+        """Port of Sub_resist helper function.
+
+        Evaluates the row-th _X1 regression with the taylor_resist kernel.
+        """
+        return _resist_cached(row, float(self.L1), float(self.B),
+                              float(self.T), float(self.C), float(W0), float(X0))
 
     def on_button_save(self):
         """Port of OnButtonSave"""
@@ -5114,6 +5348,9 @@ class ShipDesViewWidget(QWidget):
         self.Kstype = self.combo_ship.currentIndex() + 1
         self.MdfEnable[0] = (self.m_Lbratio or self.m_Bvalue)
         self.MdfEnable[1] = self.m_Cbvalue
+        if self.dlg_modify is None:
+            from dialog_modify import ModifyDialog
+            self.dlg_modify = ModifyDialog(self)
         self.dlg_modify.set_enable(self.MdfEnable)
         
         data = {
@@ -5146,6 +5383,7 @@ class ShipDesViewWidget(QWidget):
         self.dlg_modify.set_data(data)
 
         if self.dlg_modify.exec():
+            self._calc_cache.clear()
             data = self.dlg_modify.get_data()
             self.Lb01 = data['Lb01']; self.Lb02 = data['Lb02']; self.Lb03 = data['Lb03']; self.Lb04 = data['Lb04']; self.Lb05 = data['Lb05']
             self.maxit = data['Maxit']; self.ignspd = data['Ignspd']; self.ignpth = data['Ignpth']; self.dbgmd = data['dbgmd']
@@ -5181,13 +5419,29 @@ class ShipDesViewWidget(QWidget):
 
     def on_dialog_outopt(self):
         """Port of OnDialogOutopt"""
+        if self.dlg_outopt is None:
+            from dialog_outopt import OutoptDialog
+            self.dlg_outopt = OutoptDialog(self)
 
         self.dlg_outopt.set_data(self.outopt_data)
         if self.dlg_outopt.exec():
-            self.outopt_data = self.dlg_outopt.get_data()
+            self._set_outopt_data(self.dlg_outopt.get_data())
+
+    def _set_outopt_data(self, data):
+        """
+        Stores the output options and works out, once, whether any design
+        (_ob1) or economic (_ob2) line is selected, for _outvdu to read.
+        """
+        from dialog_outopt import DESIGN_KEYS, ECONOMIC_KEYS
+        self.outopt_data = data
+        self._ob1 = any(getattr(data, key) for key in DESIGN_KEYS)
+        self._ob2 = any(getattr(data, key) for key in ECONOMIC_KEYS)
             
     def on_dialog_readme(self):
         """Called from main window menu"""
+        if self.dlg_readme is None:
+            from dialog_readme import ReadmeDialog
+            self.dlg_readme = ReadmeDialog(self)
 
         self.dlg_readme.exec()
 
@@ -5324,23 +5578,14 @@ class ShipDesViewWidget(QWidget):
         self.edit_interest.setEnabled(is_econom_on)
         self.edit_repay.setEnabled(is_econom_on)
 
-        self.label_fuel.setVisible(is_econom_on and not is_nuclear)
-        self.edit_fuel.setVisible(is_econom_on and not is_nuclear)
-        self.label_lhv.setVisible(is_econom_on and not is_nuclear)
-        self.edit_lhv.setVisible(is_econom_on and not is_nuclear)
+        self.engine_stack.setVisible(is_econom_on)
+        self.engine_stack.setCurrentIndex(1 if is_nuclear else 0)
         
         show_tax = is_econom_on and not is_nuclear
         self.check_carbon_tax.setVisible(show_tax)
         self.label_ctax_rate.setVisible(show_tax and self.check_carbon_tax.isChecked())
         self.edit_ctax_rate.setVisible(show_tax and self.check_carbon_tax.isChecked())
         
-        self.label_reactor_cost.setVisible(is_econom_on and is_nuclear)
-        self.edit_reactor_cost.setVisible(is_econom_on and is_nuclear)
-        self.label_core_life.setVisible(is_econom_on and is_nuclear)
-        self.edit_core_life.setVisible(is_econom_on and is_nuclear)
-        self.label_decom_cost.setVisible(is_econom_on and is_nuclear)
-        self.edit_decom_cost.setVisible(is_econom_on and is_nuclear)
-        
         if is_nuclear:
             self.edit_range.setText("Infinite")
             self.edit_range.setEnabled(False)
@@ -5492,18 +5737,27 @@ class ShipDesViewWidget(QWidget):
         self._reset_dlg()
 
     def on_killfocus_edit_prpm(self):
-        self.Ketype = 1 + self.combo_engine.currentIndex()
-        if self.Ketype == 1: 
-            if self._update_ui_to_data():
-                self.m_Erpm = self.m_Prpm 
-                self.edit_erpm.setText(str(self.m_Erpm)) 
+        self._sync_rpm(from_prop=True)
 
     def on_killfocus_edit_erpm(self):
+        self._sync_rpm(from_prop=False)
+
+    def _sync_rpm(self, from_prop):
+        """
+        Shared body of OnKillfocusEditPrpm/OnKillfocusEditErpm: a direct
+        drive engine (Ketype 1) turns the propeller at engine rpm, so the
+        field just edited is copied into the other one.
+        """
         self.Ketype = 1 + self.combo_engine.currentIndex()
-        if self.Ketype == 1: 
-            if self._update_ui_to_data():
-                self.m_Prpm = self.m_Erpm 
-                self.edit_prpm.setText(str(self.m_Prpm)) 
+        if self.Ketype != 1 or not self._update_ui_to_data():
+            return
+        if from_prop:
+            self.m_Erpm = self.m_Prpm
+            target, value = self.edit_erpm, self.m_Erpm
+        else:
+            self.m_Prpm = self.m_Erpm
+            target, value = self.edit_prpm, self.m_Prpm
+        target.setText(str(value))
 
     def _initdata(self, i):
         """Port of Sub_initdata"""
@@ -5515,11 +5769,11 @@ class ShipDesViewWidget(QWidget):
             self.D1=self.m_Seadays; self.F8=self.m_Fuel; self.I=self.m_Interest; self.N=int(self.m_Repay)
             self.Pdt=self.m_PdtratioV
         else:
-            self.m_Length=1.0e-5*int(1.0e5*self.L1+0.5)
-            self.m_Breadth=1.0e-6*int(1.0e6*self.B+0.5)
-            self.m_Depth=1.0e-6*int(1.0e6*self.D+0.5)
-            self.m_Draught=1.0e-6*int(1.0e6*self.T+0.5)
-            self.m_Block=1.0e-6*int(1.0e6*self.C+0.5)
+            self.m_Length=round(self.L1, 5)
+            self.m_Breadth=_round6(self.B)
+            self.m_Depth=_round6(self.D)
+            self.m_Draught=_round6(self.T)
+            self.m_Block=_round6(self.C)
             self.m_BvalueV=self.m_Breadth
             self.m_PdtratioV=self.Pdt
             self.m_Repay=float(self.N)
@@ -5531,13 +5785,13 @@ class ShipDesViewWidget(QWidget):
         is_ship_mode = (self.design_mode == 1)
         
         if not self.m_Lbratio or is_ship_mode:
-            self.m_LbratioV=1.0e-6*int(1.0e6*L1_safe/B_safe+0.5)
+            self.m_LbratioV=_round6(L1_safe, B_safe)
         if not self.m_Bvalue or is_ship_mode:
-            self.m_BvalueV=1.0e-6*int(1.0e6*self.B+0.5)
+            self.m_BvalueV=_round6(self.B)
         if not self.m_Btratio or is_ship_mode:
-            self.m_BtratioV=1.0e-6*int(1.0e6*B_safe/T_safe+0.5)
+            self.m_BtratioV=_round6(B_safe, T_safe)
         if not self.m_Cbvalue or is_ship_mode:
-            self.m_CbvalueV=1.0e-6*int(1.0e6*self.C+0.5)
+            self.m_CbvalueV=_round6(self.C)
 
     # --------------------------------------------------------------------
     # Helpers added for chapter 5 analysis. These centralise calculations
@@ -5575,7 +5829,7 @@ class ShipDesViewWidget(QWidget):
                 slip_frac = self.m_MethaneSlip / 100.0
                 effective_carbon += slip_frac * self.m_GWP_methane
 
-            service_power_kw = self.P1 * 0.7457
+            service_power_kw = self.P1 * BHP_TO_KW
             annual_hours = self.D1 * 24.0
             annual_energy_MJ = service_power_kw * annual_hours * 3.6
 
@@ -5665,7 +5919,7 @@ class ShipDesViewWidget(QWidget):
             else:
                 vol_fuel = 0.0
 
-            vol_mach = (self.P2 * 0.7457) * 0.4
+            vol_mach = (self.P2 * BHP_TO_KW) * 0.4
             lightship = (getattr(self, 'M1', 0.0) +
                          getattr(self, 'M2', 0.0) +
                          getattr(self, 'M3', 0.0))
@@ -5723,13 +5977,13 @@ class ShipDesViewWidget(QWidget):
         output_lines.append(f"Case {self.Kcases:3d}: {Stype} with {Etype} engine")
         
         opt = self.outopt_data
-        ob1 = (opt['ol'] or opt['ob'] or opt['olb'] or opt['od'] or opt['ot'] or opt['obt'] or opt['ocb'] or
-               opt['odisp'] or opt['ocdw'] or opt['otdw'] or opt['opdt'] or opt['ospeed'] or opt['orange'] or
-               opt['oerpm'] or opt['oprpm'] or opt['ospower'] or opt['oipower'] or opt['ope'] or
-               opt['ono'] or opt['onh'] or opt['oqpc'] or opt['oscf'] or opt['ont'] or opt['omargin'] or
-               opt['osmass'] or opt['oomass'] or opt['ommass'] or opt['ofbd'] or opt['oagm'])
-        ob2 = (opt['ovyear'] or opt['osdyear'] or opt['ofcost'] or opt['oirate'] or opt['oreyear'] or
-               opt['obcost'] or opt['oacc'] or opt['oafc'] or opt['orfr'])
+        ob1 = self._ob1
+        ob2 = self._ob2
+        # Engine and design mode are fixed for the whole report
+        nuclear = (self.Ketype == 4)
+        teu_mode = (self.design_mode == 2)
+        p1_kw = self.P1 * BHP_TO_KW
+        p2_kw = self.P2 * BHP_TO_KW
         
         B_safe = self.B if self.B != 0 else 1e-9
         T_safe = self.T if self.T != 0 else 1e-9
@@ -5740,19 +5994,19 @@ class ShipDesViewWidget(QWidget):
                 output_lines.append("  ------- Dimensions:")
             
             dim_parts1 = []
-            if opt['ol']: dim_parts1.append(f"Lbp(m) = {self.L1:8.2f}")
-            if opt['ob']: dim_parts1.append(f"B(m) = {self.B:7.2f}")
-            if opt['olb']: dim_parts1.append(f"L/B = {L1_safe/B_safe:7.2f}")
+            if opt.ol: dim_parts1.append(f"Lbp(m) = {self.L1:8.2f}")
+            if opt.ob: dim_parts1.append(f"B(m) = {self.B:7.2f}")
+            if opt.olb: dim_parts1.append(f"L/B = {L1_safe/B_safe:7.2f}")
             if dim_parts1: output_lines.append("   " + ", ".join(dim_parts1))
             
             dim_parts2 = []
-            if opt['od']: dim_parts2.append(f"D(m) = {self.D:7.2f}")
-            if opt['ot']: dim_parts2.append(f"T(m) = {self.T:7.2f}")
-            if opt['obt']: dim_parts2.append(f"B/T = {B_safe/T_safe:7.2f}")
+            if opt.od: dim_parts2.append(f"D(m) = {self.D:7.2f}")
+            if opt.ot: dim_parts2.append(f"T(m) = {self.T:7.2f}")
+            if opt.obt: dim_parts2.append(f"B/T = {B_safe/T_safe:7.2f}")
             if dim_parts2: output_lines.append("   " + ", ".join(dim_parts2))
             
-            if opt['ocb']: output_lines.append(f"   CB = {self.C:5.3f}")
-            if opt['odisp']: output_lines.append(f"   Disp. (tonnes) = {int(self.M + 0.5):7d}")
+            if opt.ocb: output_lines.append(f"   CB = {self.C:5.3f}")
+            if opt.odisp: output_lines.append(f"   Disp. (tonnes) = {int(self.M + 0.5):7d}")
             
             if hasattr(self, 'res_total'):
                 # Header includes the active resistance method so the report
@@ -5815,13 +6069,13 @@ class ShipDesViewWidget(QWidget):
                     output_lines.append("   [ESD Active]")
                     for log in self.esd_log:
                         output_lines.append(f"     -> {log}")
-                    orig_kw = self.P1_Original * 0.7457
-                    new_kw = self.P1 * 0.7457
+                    orig_kw = self.P1_Original * BHP_TO_KW
+                    new_kw = p1_kw
                     output_lines.append(f"     -> New Service Power: {int(new_kw)} kW (was {int(orig_kw)})")
 
         self._calculate_detailed_efficiency()
 
-        if opt['ope'] or opt['oqpc']: 
+        if opt.ope or opt.oqpc: 
             output_lines.append("\r\n  ------- Physics & Hydrodynamics:")
             output_lines.append(f"   Froude Number (Fn) = {self.froude_number:.3f}")
             output_lines.append(f"   Reynolds Number (Re)= {self.reynolds_number:.2e}")
@@ -5839,7 +6093,7 @@ class ShipDesViewWidget(QWidget):
             if self.check_aux_enable.isChecked():
                 output_lines.append("\r\n  ------- Power & Hotel Analysis:")
                 
-                prop_kw = self.P1 * 0.7457
+                prop_kw = p1_kw
                 total_load = prop_kw + self.P_aux_total
                 pct_aux = (self.P_aux_total / total_load) * 100 if total_load > 0 else 0
                 
@@ -5858,8 +6112,7 @@ class ShipDesViewWidget(QWidget):
                 try:
                     prem_rate = float(self.edit_aux_prem.text())
                     if prem_rate > 0:
-                        is_teu = (self.design_mode == 2)
-                        cargo_units = self.m_TEU if is_teu else self.W1
+                        cargo_units = self.m_TEU if teu_mode else self.W1
                         
                         extra_income = cargo_units * prem_rate
                         mode = self.combo_aux_mode.currentIndex()
@@ -5873,28 +6126,27 @@ class ShipDesViewWidget(QWidget):
                 except:
                     pass
 
-            if self.design_mode == 2:
-                est_teu = self._estimate_teu_capacity(self.L1, self.B, self.D)
+            if teu_mode:
                 output_lines.append(f"   Target TEU = {int(self.target_teu)}")
-                output_lines.append(f"   Est. Capacity = {int(est_teu)} TEU")
+                output_lines.append(f"   Est. Capacity = {int(self.est_teu)} TEU")
                 output_lines.append(f"   Avg. Weight = {self.m_TEU_Avg_Weight:5.2f} t/TEU")
                 output_lines.append(f"   -> Target Cargo DW = {self.W:7.0f} tonnes")
             
-            if opt['ocdw']: output_lines.append(f"   Cargo DW(tonnes) = {self.W1:7.0f}")
+            if opt.ocdw: output_lines.append(f"   Cargo DW(tonnes) = {self.W1:7.0f}")
             
-            if opt['otdw']: 
+            if opt.otdw: 
                 gt_str = f"   (GT = {int(gross_tonnage)})"
                 output_lines.append(f"   Total DW(tonnes) = {self.W5:7.0f} {gt_str}")
 
-            if opt['opdt']: output_lines.append(f"   Prop.dia./T = {self.Pdt:7.2f}")
-            if opt['ospeed']: output_lines.append(f"   Speed (knots) = {self.V:7.2f}")
+            if opt.opdt: output_lines.append(f"   Prop.dia./T = {self.Pdt:7.2f}")
+            if opt.ospeed: output_lines.append(f"   Speed (knots) = {self.V:7.2f}")
             
-            if self.Ketype == 4: # Nuclear
-                 if opt['orange']: output_lines.append("   Range(N.M.) = Infinite")
+            if nuclear:
+                 if opt.orange: output_lines.append("   Range(N.M.) = Infinite")
             else:
-                if opt['orange']: output_lines.append(f"   Range(N.M.) = {self.R:8.1f}")
+                if opt.orange: output_lines.append(f"   Range(N.M.) = {self.R:8.1f}")
             
-            if self.check_fuel_vol.isChecked() and self.Ketype != 4:
+            if self.check_fuel_vol.isChecked() and not nuclear:
                 fuel_data = FuelConfig.get(self.combo_engine.currentText())
                 if hasattr(self, 'calculated_fuel_mass') and self.calculated_fuel_mass > 0 and fuel_data["Density"] > 0:
                     
@@ -5935,21 +6187,21 @@ class ShipDesViewWidget(QWidget):
                 if getattr(self, 'vol_expansion_iters', 0) > 0:
                     output_lines.append(f"     - Volume-limit expansion iters: {self.vol_expansion_iters}")
 
-            if opt['oerpm']: output_lines.append(f"   Engine RPM = {self.N1:6.1f}")
-            if opt['oprpm']: output_lines.append(f"   Propeller RPM = {self.N2:6.1f}")
-            if opt['ospower']: output_lines.append(f"   Service power = {int(self.P1 + 0.5):6d} BHP / {int(0.7457 * self.P1 + 0.5):6d} KW")
-            if opt['oipower']: output_lines.append(f"   Installed power = {int(self.P2 + 0.5):6d} BHP / {int(0.7457 * self.P2 + 0.5):6d} KW")
+            if opt.oerpm: output_lines.append(f"   Engine RPM = {self.N1:6.1f}")
+            if opt.oprpm: output_lines.append(f"   Propeller RPM = {self.N2:6.1f}")
+            if opt.ospower: output_lines.append(f"   Service power = {int(self.P1 + 0.5):6d} BHP / {int(p1_kw + 0.5):6d} KW")
+            if opt.oipower: output_lines.append(f"   Installed power = {int(self.P2 + 0.5):6d} BHP / {int(p2_kw + 0.5):6d} KW")
             
             power_parts1 = []
-            if opt['ope']: power_parts1.append(f"Pe = {self.P:6.1f}/{0.7457*self.P:6.1f}")
-            if opt['ono']: power_parts1.append(f"NO = {self.Q1:5.3f}")
-            if opt['onh']: power_parts1.append(f"NH = {self.Q2:5.3f}")
+            if opt.ope: power_parts1.append(f"Pe = {self.P:6.1f}/{self.P * BHP_TO_KW:6.1f}")
+            if opt.ono: power_parts1.append(f"NO = {self.Q1:5.3f}")
+            if opt.onh: power_parts1.append(f"NH = {self.Q2:5.3f}")
             
             power_parts2 = []
-            if opt['oqpc']: power_parts2.append(f"QPC = {self.Q:5.3f}")
-            if opt['oscf']: power_parts2.append(f"SCF = {self.F0:5.3f}")
-            if opt['ont']: power_parts2.append(f"NT = {self.F9:5.3f}")
-            if opt['omargin']: power_parts2.append("Margin=30%")
+            if opt.oqpc: power_parts2.append(f"QPC = {self.Q:5.3f}")
+            if opt.oscf: power_parts2.append(f"SCF = {self.F0:5.3f}")
+            if opt.ont: power_parts2.append(f"NT = {self.F9:5.3f}")
+            if opt.omargin: power_parts2.append("Margin=30%")
             
             if power_parts1 or power_parts2:
                 line1 = "    ( " + ", ".join(power_parts1)
@@ -5959,48 +6211,48 @@ class ShipDesViewWidget(QWidget):
                 elif power_parts1: output_lines.append(line1 + " )")
                 elif power_parts2: output_lines.append("    ( " + line2.strip() + " )")
 
-            if opt['osmass']: output_lines.append(f"   Steel mass(tonnes) = {int(self.M1 + 0.5):5d}")
-            if opt['oomass']: output_lines.append(f"   Outfit mass(tonnes) = {int(self.M2 + 0.5):5d}")
-            if opt['ommass']: output_lines.append(f"   Machy mass(tonnes) = {int(self.M3 + 0.5):5d}")
-            if opt['ofbd']: output_lines.append(f"   Freeboard(m) = {self.F5:5.2f}")
-            if opt['oagm']: output_lines.append(f"   Approx. GM(m) = {self.G6:5.1f}")
+            if opt.osmass: output_lines.append(f"   Steel mass(tonnes) = {int(self.M1 + 0.5):5d}")
+            if opt.oomass: output_lines.append(f"   Outfit mass(tonnes) = {int(self.M2 + 0.5):5d}")
+            if opt.ommass: output_lines.append(f"   Machy mass(tonnes) = {int(self.M3 + 0.5):5d}")
+            if opt.ofbd: output_lines.append(f"   Freeboard(m) = {self.F5:5.2f}")
+            if opt.oagm: output_lines.append(f"   Approx. GM(m) = {self.G6:5.1f}")
             
             if self.m_Econom and ob2:
                 output_lines.append("  ------- Economic analysis:")
-                if opt['ovyear']: output_lines.append(f"   Voyages/year = {self.V7:6.3f}")
-                if opt['osdyear']: output_lines.append(f"   Sea days/year = {self.D1:6.2f}")
+                if opt.ovyear: output_lines.append(f"   Voyages/year = {self.V7:6.3f}")
+                if opt.osdyear: output_lines.append(f"   Sea days/year = {self.D1:6.2f}")
                 
-                if self.Ketype == 4: # Nuclear
-                    if opt['ofcost']: 
-                        installed_power_kw = self.P2 * 0.7457
+                if nuclear:
+                    if opt.ofcost: 
+                        installed_power_kw = p2_kw
                         total_reactor_cost_M = (self.m_Reactor_Cost_per_kW * installed_power_kw) / 1.0e6
                         output_lines.append(f"   Reactor Cost Rate = {self.m_Reactor_Cost_per_kW:,.2f} ($/kW)")
                         output_lines.append(f"   @ {installed_power_kw:,.0f} kW (Installed)")
                         output_lines.append(f"   -> Reactor CAPEX = {total_reactor_cost_M:6.2f} (M$)")
                     
-                    if opt['oirate']: output_lines.append(f"   Core Life (years) = {self.m_Core_Life:3.0f}")
+                    if opt.oirate: output_lines.append(f"   Core Life (years) = {self.m_Core_Life:3.0f}")
                 else: # Fossil
-                    if opt['ofcost']: output_lines.append(f"   Fuel cost/tonne = {self.F8:6.2f}")
+                    if opt.ofcost: output_lines.append(f"   Fuel cost/tonne = {self.F8:6.2f}")
                 
-                if opt['oirate']: output_lines.append(f"   Interest rate (%%) = {self.I:6.2f}")
-                if opt['oreyear']: output_lines.append(f"   Repayment years = {self.N:3d}")
-                if opt['obcost']: output_lines.append(f"   Build cost = {self.S:5.2f}(M)")
-                if opt['oacc']: 
+                if opt.oirate: output_lines.append(f"   Interest rate (%%) = {self.I:6.2f}")
+                if opt.oreyear: output_lines.append(f"   Repayment years = {self.N:3d}")
+                if opt.obcost: output_lines.append(f"   Build cost = {self.S:5.2f}(M)")
+                if opt.oacc: 
                     output_lines.append(f"   Annual capital charges = {self.H1:,.2f}")
                     output_lines.append(f"   Annual OPEX = {self.annual_opex:,.2f}")
                 
-                if self.Ketype == 4:
-                    if opt['oafc']: 
+                if nuclear:
+                    if opt.oafc: 
                         output_lines.append(f"   Annual Core/Decom Cost = {self.H7:,.2f}")
                 else:
-                    if opt['oafc']: 
+                    if opt.oafc: 
                         output_lines.append(f"   Annual fuel costs = {self.annual_fuel_cost_only:,.2f}")
                         if self.check_carbon_tax.isChecked():
                             output_lines.append(f"   Annual carbon taxes = {self.annual_carbon_tax:,.2f}")
                             output_lines.append(f"   Total Fuel + Tax = {self.H7:,.2f}")
                 
-                if opt['orfr']:
-                    if self.design_mode == 2: # TEU Mode
+                if opt.orfr:
+                    if teu_mode:
                         unit_label = "$/TEU"
                         conv_factor = self.m_TEU_Avg_Weight # Convert $/tonne to $/TEU
                     else: # Deadweight Mode
@@ -6035,7 +6287,7 @@ class ShipDesViewWidget(QWidget):
                             fuel_data = FuelConfig.get(self.combo_engine.currentText())
                             lhv = self.m_LHV if self.m_LHV > 0 else 42.7
                             eff = fuel_data["Efficiency"]
-                            service_power_kw = self.P1 * 0.7457
+                            service_power_kw = p1_kw
                             annual_hours = self.D1 * 24.0
                             annual_energy_MJ = service_power_kw * annual_hours * 3.6
                             annual_fuel_tonnes = (annual_energy_MJ / (lhv * eff)) / 1000.0
@@ -6074,7 +6326,7 @@ class ShipDesViewWidget(QWidget):
                             
                         if capacity <= 1.0: capacity = 1.0
                         
-                        p_me = 0.75 * (self.P2 * 0.7457) # 75% MCR in kW
+                        p_me = 0.75 * p2_kw # 75% MCR in kW
                         cf = self._effective_carbon_factor(fuel_data)
                         # Apply methane slip on the same effective-carbon basis
                         # used by _cost / _compute_cii so all three GHG metrics
@@ -6132,12 +6384,21 @@ class ShipDesViewWidget(QWidget):
         
         formatted_output = "\r\n".join(output_lines)
         
+        # Appended cases are kept as separate chunks and joined once below,
+        # so a long append session doesn't re-copy the whole text per case.
+        doc = self.text_results.document()
         if self.m_Append and self.Kcases > 1:
-            self.m_Results += "\r\n" + formatted_output
+            self._result_lines.append("\r\n" + formatted_output)
+            # If the pane still holds exactly the earlier cases, add just
+            # this one instead of re-rendering the whole text
+            if doc.blockCount() == self._results_blocks:
+                self.text_results.appendPlainText(formatted_output)
+            else:
+                self.text_results.setPlainText(self.m_Results)
         else:
             self.m_Results = formatted_output
-            
-        self.text_results.setText(self.m_Results)
+            self.text_results.setPlainText(self.m_Results)
+        self._results_blocks = doc.blockCount()
         self.text_results.verticalScrollBar().setValue(self.text_results.verticalScrollBar().maximum())
             
         return True
\ No newline at end of file
@@ -0,0 +1,171 @@
+# ship_kernels.py
+# Numeric kernels of the ship design calculation
+#
+# Plain functions of floats (and the static tables below) with no Qt or
+# widget state, so numba can compile them when it is installed. The
+# compiled code is cached on disk and shared by every calculation and
+# sweep in the process.
+#
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Sub_freeboard tabular freeboard (mm) against length L2 (m): F1 for
+# type-1 (tanker) ships, F2 for the rest.
+_L2 = np.fromiter((30, 40, 60, 80, 100, 120, 140, 160, 180, 200,
+                   220, 240, 260, 280, 300, 320, 340, 360),
+                  dtype=np.float64, count=18)
+_F1 = np.fromiter((250, 334, 573, 841, 1135, 1459, 1803, 2126, 2393, 2612,
+                   2792, 2946, 3072, 3176, 3262, 3331, 3382, 3425),
+                  dtype=np.float64, count=18)
+_F2 = np.fromiter((250, 334, 573, 887, 1271, 1690, 2109, 2520, 2915, 3264,
+                   3586, 3880, 4152, 4397, 4630, 4844, 5055, 5260),
+                  dtype=np.float64, count=18)
+# Sub_freeboard superstructure deduction E9 (mm) against L1 (m): linear
+# up to 122 m, then constant.
+_E9_L = np.fromiter((24, 85, 122, 360), dtype=np.float64, count=4)
+_E9 = np.fromiter((350, 860, 1070, 1070), dtype=np.float64, count=4)
+
+
+def interp_table(x, xs, ys):
+    """Piecewise-linear lookup of x in the table (xs, ys).
+
+    np.interp clamps outside the table, whereas Sub_freeboard extends the
+    first/last segment, so the two ends are extrapolated here.
+    """
+    if x < xs[0]:
+        return float(ys[0] + (x - xs[0]) * (ys[1] - ys[0]) / (xs[1] - xs[0]))
+    if x > xs[-1]:
+        return float(ys[-1] + (x - xs[-1]) * (ys[-1] - ys[-2]) / (xs[-1] - xs[-2]))
+    return float(np.interp(x, xs, ys))
+
+
+def solve_pitch(Z4, Y4, X4, D61, T3, P5, maxit):
+    """Newton iteration for the propeller pitch offset P5 in Sub_power.
+
+    Solves Z4 + P5*(Y4 + P5*(X4 + P5*D61)) = T3 starting from P5.
+    Returns (P5, iterations); iterations == maxit means no convergence.
+    Kept free of Python objects so numba can compile it when installed.
+    """
+    m0 = 0
+    A9 = Z4 + P5 * (Y4 + P5 * (X4 + P5 * D61)) - T3
+    while m0 < maxit and abs(A9) > 0.00001:
+        m0 += 1
+        B9 = Y4 + P5 * (2.0 * X4 + 3.0 * P5 * D61)
+        if B9 == 0: B9 = 1e-9
+        P5 = P5 - A9 / B9
+        A9 = Z4 + P5 * (Y4 + P5 * (X4 + P5 * D61)) - T3
+    return P5, m0
+
+
+def legacy_beam(L1, Lb01, Lb02, Lb03, Lb04, Lb05):
+    """Beam from length with the Lb01-Lb05 L/B fit of Sub_dimensions."""
+    if L1 <= Lb05:
+        return L1 / (Lb01 + Lb02 * (L1 - Lb03))
+    return L1 / Lb04
+
+
+def legacy_block(vosl, Cb1, Cb2, Cb3, Cb4, Cb5):
+    """Block coefficient from V/sqrt(L) with a ship type's Cb fit."""
+    if vosl < Cb5:
+        return Cb1 - Cb2 * vosl
+    return Cb3 - Cb4 * vosl
+
+
+def teu_capacity(L, B, D):
+    """TEU estimate from L*B*D (Abramowski et al., 2018, inverted eq. 38).
+
+    The guard keeps the base positive, so the power cannot fail.
+    """
+    LBD = L * B * D
+    if LBD <= 0.0:
+        return 0.0
+    return ((LBD + 20143.62) / 104.422) ** (1.0 / 0.9)
+
+
+def freeboard_m(L1, T, D, C, E5, Y1, Y2, type1_table, kstype1):
+    """Sub_freeboard body: freeboard F5 (m) from scalars only.
+
+    type1_table picks the type-1 (tanker) freeboard table, kstype1 the
+    tanker superstructure exponent.
+    """
+    F5 = interp_table(L1, _L2, _F1 if type1_table else _F2)
+
+    if not type1_table and L1 < 100:
+        F5 += 0.75 * (100.0 - L1) * (0.35 - E5)
+
+    T_safe = T if T != 0 else 1e-9
+    C9 = C + (0.85 * D - T) / (10.0 * T_safe)
+    if C9 >= 0.68:
+        F5 *= (C9 + 0.68) / 1.36
+
+    if D >= L1 / 15.0:
+        if L1 <= 120:
+            F5 += ((D - L1 / 15.0) * L1 / 0.48)
+        else:
+            F5 += ((D - L1 / 15.0) * 250.0)
+
+    E9 = interp_table(L1, _E9_L, _E9)
+
+    if kstype1:
+        E9 *= (E5 ** 1.23)
+    else:
+        E9 *= (E5 ** 1.3)
+
+    F5 -= E9
+    E0 = (L1 / 3.0 + 10.0) * (8.3375 * (1.0 - Y1) + 4.16875 * (1.0 - Y2))
+    E0 *= (0.75 - 0.5 * E5)
+    F5 += E0
+    return F5 * 0.001
+
+
+def gm_margin(B, T, D, C, stability_factor):
+    """Sub_stability body: metacentric margin G6 = KB + BM - KG."""
+    G3 = stability_factor * D
+    C7 = 0.67 * C + 0.32
+    C_safe = C if C != 0 else 1e-9
+    T_safe = T if T != 0 else 1e-9
+    G4 = T * (5.0 * C7 - 2.0 * C) / (6.0 * C7)
+    C8 = 1.1 * C - 0.12
+    G5 = C8 * B * B / (12.0 * T_safe * C_safe)
+    return G4 + G5 - G3
+
+
+def taylor_resist(c, L1, B, T, C, W0, X0):
+    """Sub_resist: one row c of the Taylor regression (16 coefficients)
+    evaluated at the basis (1, Z2..Z5, squares, cross terms)."""
+    Z2 = (L1 / W0 - 5.296) / 1.064
+    Z3 = 10.0 * (B / T - 3.025) / 9.05
+    Z4 = 1000.0 * (C - 0.725) / 75.0
+    Z5 = (X0 - 0.77) / 2.77
+    A = (c[0] + c[1] * Z2 + c[2] * Z3 + c[3] * Z4
+         + c[4] * Z5 + c[5] * Z2 * Z2 + c[6] * Z3 * Z3 + c[7] * Z4 * Z4
+         + c[8] * Z5 * Z5 + c[9] * Z2 * Z3 + c[10] * Z2 * Z4
+         + c[11] * Z2 * Z5 + c[12] * Z3 * Z4 + c[13] * Z3 * Z5
+         + c[14] * Z4 * Z5 + c[15] * Z5 * Z4 * Z4)
+    return A * 5.1635 + 13.1035
+
+
+if njit is not None:
+    solve_pitch = njit(cache=True, fastmath=True)(solve_pitch)
+    legacy_beam = njit(cache=True)(legacy_beam)
+    legacy_block = njit(cache=True)(legacy_block)
+    teu_capacity = njit(cache=True)(teu_capacity)
+    interp_table = njit(cache=True)(interp_table)
+    freeboard_m = njit(cache=True)(freeboard_m)
+    gm_margin = njit(cache=True)(gm_margin)
+    taylor_resist = njit(cache=True, fastmath=True)(taylor_resist)
+    # Compile (or load from the on-disk cache) once per process, at
+    # import, rather than on the user's first Calculate click.
+    solve_pitch(0.0, 1.0, 0.0, 0.0, 0.0, 0.0, 1)
+    legacy_beam(100.0, 4.0, 0.025, 30.0, 6.5, 130.0)
+    legacy_block(1.0, 1.0, 0.1, 1.0, 0.1, 1.0)
+    teu_capacity(100.0, 20.0, 10.0)
+    freeboard_m(150.0, 9.0, 12.0, 0.75, 0.3, 0.5, 0.5, True, True)
+    gm_margin(25.0, 9.0, 12.0, 0.75, 0.6)
+    taylor_resist(np.zeros(16), 150.0, 25.0, 9.0, 0.75, 10.0, 0.0)
@@ -0,0 +1,43 @@
+# Regression checks for the L1 search in ShipDesViewWidget.on_calculate.
+# Run offscreen: QT_QPA_PLATFORM=offscreen python -m pytest tests
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="module")
+def view():
+    app = QApplication.instance() or QApplication([])
+    from ship_des_view_widget_holtrop import ShipDesViewWidget
+    widget = ShipDesViewWidget()
+    # Batch mode keeps error message boxes from blocking the test
+    widget.is_batch_mode = True
+    yield widget
+    widget.deleteLater()
+
+
+def _calculate(view, ship, engine, method, weight, speed):
+    view.combo_ship.setCurrentText(ship)
+    view.combo_engine.setCurrentText(engine)
+    view.combo_resistance_method.setCurrentText(method)
+    view.check_econom.setChecked(True)
+    view.radio_cargo.setChecked(True)
+    view.edit_weight.setText(str(weight))
+    view.edit_speed.setText(str(speed))
+    view.on_calculate()
+
+
+def test_failed_probe_steps_back(view):
+    # A secant probe at L1 ~ 392 m puts the propeller pitch out of range;
+    # the search must step back and still converge on the ~406 m design.
+    _calculate(view, "Tanker", "Nuclear SMR", "Holtrop-Mennen (1984)", 300000, 30)
+    assert view.CalculatedOk
+    assert view.L1 == pytest.approx(405.88, abs=0.5)